@@ -1,14 +1,31 @@
 """Trivia Game integration for Home Assistant."""
 import asyncio
 import logging
-import json
 import random
+import time
+from dataclasses import asdict
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_registry as er,
+    issue_registry as ir,
+)
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
@@ -19,8 +36,60 @@ from .const import (
     SERVICE_STOP_GAME,
     SERVICE_NEXT_QUESTION,
     SERVICE_CHECK_ANSWER,
+    SERVICE_IMPORT_QUESTIONS,
+    SERVICE_REPLAY_GAME,
+    SERVICE_EXPORT_JOURNAL,
+    SERVICE_HARDEST_QUESTIONS,
+    SERVICE_SEARCH_QUESTIONS,
+    SERVICE_SUBMIT_ANSWERS,
+    SERVICE_START_PROFILE,
+    SERVICE_STOP_PROFILE,
+    STORE_FILENAME,
+    ASSETS_DIR,
+    JOURNAL_PATH,
+    JOURNAL_EXPORT_DIR,
+    USER_QUESTIONS_DIRS,
+    CATALOG_SCAN_INTERVAL,
+    BANK_CACHE_SIZE,
+    PROFILE_DIR,
+    PROFILE_DEFAULT_DURATION,
+    PROFILE_MAX_DURATION,
+    PROFILE_TOP,
+    CONF_LOOP_WATCHDOG,
+    ADAPTIVE_POOL_FACTOR,
+    QUESTION_STATS_SAVE_DELAY,
     DEFAULT_DIFFICULTY,
+    DEFAULT_LANGUAGE,
     DEFAULT_NUM_QUESTIONS,
+    FEEDBACK_DELAY,
+    UPDATE_DEBOUNCE_DELAY,
+)
+from .announcer import Announcer, HomeAssistantTTSProvider, TTSProvider, phrase
+from .assets import ASSETS_URL, PanelAssetView, build_assets
+from .bank import READ_ERRORS, Question, QuestionPack, QuizFileCache, read_quiz_file
+from .catalog import CatalogEntry, QuestionCatalog
+from .difficulty import QuestionStats, parse_question_key, question_key
+from .game import (
+    CHOICE_LETTERS,
+    AnswerChecked,
+    GameFinished,
+    GameSession,
+    PlayerFinished,
+    QuestionShown,
+)
+from .journal import GameJournal
+from .notifier import Notifier
+from .profiler import CoordinatorProfiler
+from .stats import TimingHistogram
+from .search import QuestionIndex, file_documents, store_documents
+from .store import QuestionStore
+from .validation import excluded_questions, validate_files, validate_quizz
+from .watchdog import LoopWatchdog
+from .websocket import (
+    ANSWERS_SCHEMA,
+    async_get_stream,
+    async_register_websocket,
+    async_remove_stream,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,6 +109,17 @@ class MyStaticPathConfig:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Trivia component."""
     hass.data.setdefault(DOMAIN, {})
+    async_register_websocket(hass)
+
+    # Panel: copies hashées et précompressées, construites une fois par démarrage
+    target = Path(hass.config.path(ASSETS_DIR))
+    manifest = await hass.async_add_executor_job(
+        build_assets, Path(__file__).parent / "www", target
+    )
+    await hass.http.async_register_static_paths(
+        [MyStaticPathConfig(url_path=ASSETS_URL, path=str(target), cache_headers=True)]
+    )
+    hass.http.register_view(PanelAssetView(manifest))
     return True
 
 
@@ -48,6 +128,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = TriviaGameCoordinator(hass, entry)
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # Fichiers de questions disponibles (dossier intégré + dossiers utilisateur)
+    await hass.async_add_executor_job(coordinator.catalog.scan)
+
+    # Fichiers importés dans la base SQLite (si elle existe)
+    await coordinator.async_load_store_files()
+
+    # Taux de réussite par question (mode adaptatif, questions difficiles)
+    await coordinator.async_load_question_stats()
+
+    # Validation et indexation des fichiers de questions en arrière-plan
+    entry.async_create_background_task(
+        hass, coordinator.async_validate_questions(), "trivia_validate_questions"
+    )
+    entry.async_create_background_task(
+        hass, coordinator.async_index_store(), "trivia_index_store"
+    )
+
+    # Surveiller les dossiers de questions (nouveaux fichiers, modifications)
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_refresh_catalog,
+            timedelta(seconds=CATALOG_SCAN_INTERVAL),
+        )
+    )
+
+    # Écrire les événements en attente du journal à l'arrêt de Home Assistant
+    async def flush_journal(_event):
+        await coordinator.journal.async_flush()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, flush_journal)
+    )
+
+    # Retard de la boucle d'événements et gestionnaires lents (option)
+    coordinator.watchdog.async_start()
+    entry.async_on_unload(coordinator.watchdog.async_stop)
+
+    # Recharger l'intégration quand les options changent
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -72,18 +193,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 # Call check_answer with the answer letter
                 await coordinator.check_answer(player_num, answer_letter)
 
-    # Subscribe to mobile_app notification action events
-    hass.bus.async_listen("mobile_app_notification_action", handle_notification_action)
-
-    # Register frontend panel
-    await hass.http.async_register_static_paths(
-        [
-            MyStaticPathConfig(
-                url_path=f"/{DOMAIN}/panel",
-                path=hass.config.path(f"custom_components/{DOMAIN}/www"),
-                cache_headers=False,
-            )
-        ]
+    # Subscribe to mobile_app notification action events (retiré au
+    # déchargement: un rechargement ne doit pas traiter deux fois une réponse)
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            "mobile_app_notification_action", handle_notification_action
+        )
     )
 
     return True
@@ -94,11 +209,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.async_cancel_pending_update()
+        await coordinator.profiler.async_stop()
+        await coordinator.journal.async_flush()
+        await coordinator.async_save_question_stats()
+        await hass.async_add_executor_job(coordinator.store.close)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the state stream kept across reloads of a removed entry."""
+    async_remove_stream(hass, entry.entry_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Set up services for Trivia integration."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
@@ -107,6 +237,13 @@ async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Start a new trivia game."""
         await coordinator.start_game(
             players_devices=call.data.get("players_devices", {}),
+            media_players=call.data.get("media_players"),
+            tts_entity=call.data.get("tts_entity"),
+            tts_voice=call.data.get("tts_voice"),
+            seed=call.data.get("seed"),
+            adaptive=call.data.get("adaptive", False),
+            query=call.data.get("query"),
+            question_ids=call.data.get("question_ids"),
         )
 
     async def stop_game(call: ServiceCall) -> None:
@@ -124,6 +261,47 @@ async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
             answer=call.data.get("answer"),
         )
 
+    async def submit_answers(call: ServiceCall) -> ServiceResponse:
+        """Score a batch of answers (buzzers) at once."""
+        return await coordinator.submit_answers(call.data["answers"])
+
+    async def replay_game(call: ServiceCall) -> ServiceResponse:
+        """Replay a recorded game without notifications and return its result."""
+        return await coordinator.async_replay(call.data.get("record"))
+
+    async def hardest_questions(call: ServiceCall) -> ServiceResponse:
+        """Return the questions with the lowest success rate."""
+        return {"questions": coordinator.question_stats.hardest(call.data["count"])}
+
+    async def search_questions(call: ServiceCall) -> ServiceResponse:
+        """Return the questions whose text, choices or anecdote match a query."""
+        return coordinator.search_questions(
+            call.data["query"],
+            language=call.data.get("language"),
+            difficulty=call.data.get("difficulty"),
+            file=call.data.get("file"),
+            limit=call.data["limit"],
+        )
+
+    async def export_journal(call: ServiceCall) -> None:
+        """Export per-player and per-question CSV summaries of the journal."""
+        await coordinator.export_journal(call.data.get("directory"))
+
+    async def import_questions(call: ServiceCall) -> None:
+        """Import a directory of OpenQuizzDB files into the SQLite store."""
+        await coordinator.import_questions(call.data["directory"])
+
+    async def start_profile(call: ServiceCall) -> None:
+        """Profile the coordinator handlers for a bounded time."""
+        if not await coordinator.profiler.async_start(
+            call.data["duration"], call.data["top"]
+        ):
+            raise HomeAssistantError("Profiling is already running")
+
+    async def stop_profile(call: ServiceCall) -> None:
+        """Stop profiling now and write the results."""
+        await coordinator.profiler.async_stop()
+
     # Register services
     hass.services.async_register(
         DOMAIN,
@@ -132,8 +310,82 @@ async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
         schema=vol.Schema(
             {
                 vol.Required("players_devices"): dict,
+                vol.Optional("media_players"): cv.entity_ids,
+                vol.Optional("tts_entity"): cv.string,
+                vol.Optional("tts_voice"): cv.string,
+                vol.Optional("seed"): vol.Coerce(int),
+                vol.Optional("adaptive"): cv.boolean,
+                vol.Exclusive("query", "questions"): cv.string,
+                vol.Exclusive("question_ids", "questions"): vol.All(
+                    cv.ensure_list, [cv.string]
+                ),
+            }
+        ),
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SUBMIT_ANSWERS,
+        submit_answers,
+        schema=vol.Schema({vol.Required("answers"): ANSWERS_SCHEMA}),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_QUESTIONS,
+        search_questions,
+        schema=vol.Schema(
+            {
+                vol.Required("query"): cv.string,
+                vol.Optional("language"): cv.string,
+                vol.Optional("difficulty"): cv.string,
+                vol.Optional("file"): cv.string,
+                vol.Optional("limit", default=20): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=500)
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_HARDEST_QUESTIONS,
+        hardest_questions,
+        schema=vol.Schema(
+            {
+                vol.Optional("count", default=10): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=100)
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY_GAME,
+        replay_game,
+        schema=vol.Schema(
+            {
+                vol.Optional("record"): vol.Schema(
+                    {
+                        vol.Required("seed"): vol.Coerce(int),
+                        vol.Required("question_file"): vol.Any(None, cv.string),
+                        vol.Required("difficulty"): cv.string,
+                        vol.Required("num_questions"): vol.Coerce(int),
+                        vol.Required("num_players"): vol.Coerce(int),
+                        vol.Required("language"): cv.string,
+                        vol.Required("player_languages"): list,
+                        vol.Required("answers"): [
+                            vol.All(list, vol.Length(min=2, max=3))
+                        ],
+                        vol.Optional("adaptive"): cv.boolean,
+                        vol.Optional("buckets"): vol.Any(None, list),
+                        vol.Optional("question_ids"): [cv.string],
+                    },
+                    extra=vol.ALLOW_EXTRA,
+                ),
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(DOMAIN, SERVICE_STOP_GAME, stop_game)
@@ -149,6 +401,45 @@ async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
             }
         ),
     )
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_IMPORT_QUESTIONS,
+        import_questions,
+        schema=vol.Schema(
+            {
+                vol.Required("directory"): cv.string,
+            }
+        ),
+    )
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_EXPORT_JOURNAL,
+        export_journal,
+        schema=vol.Schema(
+            {
+                vol.Optional("directory"): cv.string,
+            }
+        ),
+    )
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_PROFILE,
+        start_profile,
+        schema=vol.Schema(
+            {
+                vol.Optional("duration", default=PROFILE_DEFAULT_DURATION): vol.All(
+                    vol.Coerce(float), vol.Range(min=1, max=PROFILE_MAX_DURATION)
+                ),
+                vol.Optional("top", default=PROFILE_TOP): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=200)
+                ),
+            }
+        ),
+    )
+    async_register_admin_service(hass, DOMAIN, SERVICE_STOP_PROFILE, stop_profile)
 
 
 class TriviaGameCoordinator(DataUpdateCoordinator):
@@ -159,36 +450,140 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
         super().__init__(hass, _LOGGER, name=DOMAIN)
         self.entry = entry
         self.questions_path = Path(__file__).parent / "questions"
+        self.catalog = QuestionCatalog(
+            [self.questions_path]
+            + [Path(hass.config.path(directory)) for directory in USER_QUESTIONS_DIRS]
+        )
+        # Fichiers de questions déjà décompressés et parsés
+        self.quiz_files = QuizFileCache(BANK_CACHE_SIZE)
 
-        # Game state
+        # Index de recherche plein texte (service search_questions)
+        self.search_index = QuestionIndex()
+
+        # Base SQLite optionnelle pour les grandes collections OpenQuizzDB
+        self.store = QuestionStore(hass.config.path(STORE_FILENAME))
+        self.store_files: list[str] = []
+
+        # Résultats de validation par fichier, mis en cache par hash de contenu
+        self._validation_store = Store(hass, 1, f"{DOMAIN}.validation")
+
+        # Taux de réussite de chaque question, toutes parties confondues
+        self._question_stats_store = Store(hass, 1, f"{DOMAIN}.question_stats")
+        self.question_stats = QuestionStats()
+        self.validation_results: dict[str, dict] = {}
+        self._validation_loaded = False
+
+        # Game state. Les règles, les scores et la progression de chaque
+        # joueur sont dans la session (game.py, sans dépendance à Home Assistant)
         self.game_active = False
-        self.questions_pool = []
-        self.scores = {}
-        self.players = []
+        self.session = GameSession([], 0, DEFAULT_LANGUAGE)
+        self.pool_keys: list[str] = []  # fichier:difficulté:id de chaque question
+        self.players = []  # appareils des joueurs
+
+        # Générateur aléatoire propre à la partie: une graine rejoue la même
+        # partie (questions, mauvaises réponses et ordre des choix)
+        self.seed: int | None = None
+        self.rng = random.Random()
+
+        # Enregistrement de la dernière partie (graine, options, réponses)
+        self.game_record: dict | None = None
+
+        # Journal des événements de jeu, écrit en arrière-plan
+        self.journal = GameJournal(hass, Path(hass.config.path(JOURNAL_PATH)))
+        self.game_id: str | None = None
 
-        # État par joueur (chaque joueur a sa propre progression)
-        self.player_question_index = {}  # {player_num: index}
-        self.player_current_question = {}  # {player_num: question}
-        self.player_finished = {}  # {player_num: bool} pour suivre qui a terminé
+        # Envoi des notifications (timeout, retries, circuit breaker par appareil)
+        self.notifier = Notifier(hass)
 
         # Game options
         self.num_players: int = 1
         self.num_questions: int = DEFAULT_NUM_QUESTIONS
         self.difficulty: str = DEFAULT_DIFFICULTY
         self.question_file: str | None = None
+        self.language: str = DEFAULT_LANGUAGE
 
         # Selected player devices (4 joueurs max)
         self.selected_devices: list[str | None] = [None, None, None, None]
 
-        # Mapping des propositions affichées pour chaque joueur (3 choix sur 4)
-        # Format: {player_num: {"A": "proposition text", "B": "...", "C": "..."}}
-        self.player_displayed_choices = {}
+        # Langue de chaque joueur (None = langue de la partie)
+        self.player_languages: list[str | None] = [None, None, None, None]
+
+        # Annonces vocales (désactivées sans media player). tts_provider peut
+        # être remplacé, par exemple par un moteur local
+        self.announcer: Announcer | None = None
+        self.tts_provider: TTSProvider | None = None
+
+        # État de la partie diffusé au panneau (websocket trivia/subscribe)
+        self.state_stream = async_get_stream(hass, entry.entry_id, self)
+
+        # Surveillance de la boucle d'événements (option), capteur de diagnostic
+        self.watchdog = LoopWatchdog(hass, entry.options.get(CONF_LOOP_WATCHDOG, False))
+        self.watchdog.watch_coordinator(self)
+
+        # Profilage à la demande (services start_profile / stop_profile)
+        self.profiler = CoordinatorProfiler(
+            hass, self, Path(hass.config.path(PROFILE_DIR))
+        )
+
+        # Mises à jour des listeners regroupées (debounce)
+        self._unsub_pending_update = None
+        self.update_requests = 0
+        self.coalesced_updates = 0
+
+        # Temporisations en attente et durées mesurées (diagnostics)
+        self.player_advance_due = {}  # {player_num: monotonic time of next question}
+        self.answer_batches = {"batches": 0, "answers": 0, "skipped": 0, "rejected": 0}
+        self.timings = {
+            name: TimingHistogram()
+            for name in (
+                "load_questions", "send_question", "send_feedback", "answer_time",
+            )
+        }
+
+    @callback
+    def _update_listeners(self, immediate: bool = False):
+        """Schedule a coalesced update of listeners, or flush it right away.
+
+        Updates requested within UPDATE_DEBOUNCE_DELAY are merged into a single
+        one, so a burst of answers only writes entity states once.
+        """
+        self.update_requests += 1
+        # Le panneau reçoit les changements sans attendre le debounce
+        self.state_stream.async_changed()
+        if immediate:
+            self._flush_listeners()
+            return
+
+        if self._unsub_pending_update is not None:
+            self.coalesced_updates += 1
+            return
+
+        self._unsub_pending_update = async_call_later(
+            self.hass, UPDATE_DEBOUNCE_DELAY, self._flush_listeners
+        )
 
     @callback
-    def _update_listeners(self):
-        """Update listeners of state change."""
+    def _flush_listeners(self, _now=None):
+        """Update listeners now, absorbing any pending update."""
+        if self._unsub_pending_update is not None:
+            if _now is None:
+                self._unsub_pending_update()
+                self.coalesced_updates += 1
+            self._unsub_pending_update = None
         self.async_update_listeners()
 
+    @property
+    def update_pending(self) -> bool:
+        """Return True if a coalesced listener update is scheduled."""
+        return self._unsub_pending_update is not None
+
+    @callback
+    def async_cancel_pending_update(self):
+        """Cancel a scheduled listener update."""
+        if self._unsub_pending_update is not None:
+            self._unsub_pending_update()
+            self._unsub_pending_update = None
+
     async def async_set_num_players(self, value: int):
         self.num_players = value
         self._update_listeners()
@@ -205,6 +600,32 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
         self.question_file = value
         self._update_listeners()
 
+    async def async_set_language(self, value: str):
+        self.language = value
+        self._update_listeners()
+
+    async def async_set_player_language(self, player_num: int, language: str | None):
+        """Set the language of a specific player (1-4), None to follow the game."""
+        if 1 <= player_num <= 4:
+            self.player_languages[player_num - 1] = language
+            self._update_listeners()
+
+    def get_player_language(self, player_num: int) -> str:
+        """Return the language questions are shown in for a player."""
+        return self.player_languages[player_num - 1] or self.language
+
+    def get_current_question(self, player_num: int) -> Question | None:
+        """Return the question a player is on, in the player's language."""
+        if not self.game_active:
+            return None
+        return self.session.current_question(player_num)
+
+    def get_displayed_choices(self, player_num: int) -> dict[str, str]:
+        """Return the choices shown to a player, as {letter: proposition}."""
+        if not self.game_active:
+            return {}
+        return self.session.displayed_choices(player_num)
+
     async def async_set_player_device(self, player_num: int, device_id: str | None):
         """Set the device for a specific player (1-4)."""
         if 1 <= player_num <= 4:
@@ -218,6 +639,189 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
         _LOGGER.debug(f"Selected devices for {self.num_players} players: {devices}")
         return devices
 
+    def question_files(self) -> list[str]:
+        """Return the names of every question file a game can use."""
+        return sorted(set(self.catalog.names()) | set(self.store_files))
+
+    @callback
+    def _async_question_files_changed(self) -> None:
+        """Keep the selected file valid after the file list changed."""
+        files = self.question_files()
+        if self.question_file not in files:
+            self.question_file = files[0] if files else None
+        self._update_listeners()
+
+    async def async_refresh_catalog(self, _now=None) -> None:
+        """Pick up added, modified and removed question files."""
+        changes = await self.hass.async_add_executor_job(self.catalog.scan)
+        if not changes:
+            return
+
+        _LOGGER.info(
+            f"Question files changed: added {sorted(changes.added)}, "
+            f"modified {sorted(changes.changed)}, removed {sorted(changes.removed)}"
+        )
+        self._async_question_files_changed()
+        await self.async_validate_questions(changes.added | changes.changed)
+
+    async def async_load_store_files(self) -> None:
+        """Read the list of files imported in the SQLite store."""
+        self.store_files = await self.hass.async_add_executor_job(self.store.files)
+
+    async def async_load_question_stats(self) -> None:
+        """Read the saved per-question statistics."""
+        self.question_stats = QuestionStats.from_data(
+            await self._question_stats_store.async_load()
+        )
+
+    async def async_save_question_stats(self) -> None:
+        """Save the per-question statistics now."""
+        await self._question_stats_store.async_save(self.question_stats.as_data())
+
+    async def import_questions(self, directory: str) -> None:
+        """Bulk-import a directory of OpenQuizzDB files into the SQLite store."""
+        path = Path(self.hass.config.path(directory))
+        if not await self.hass.async_add_executor_job(path.is_dir):
+            _LOGGER.error(f"Cannot import questions: {path} is not a directory")
+            return
+
+        imported = await self.hass.async_add_executor_job(
+            self.store.import_directory, path
+        )
+        _LOGGER.info(f"Imported question files: {imported}")
+        await self.async_load_store_files()
+        self._async_question_files_changed()
+        await self.async_index_store()
+
+    async def async_validate_questions(self, names=None) -> None:
+        """Validate the question files (or only the given names).
+
+        Unchanged files keep their cached result, only files whose content
+        hash changed are parsed again.
+        """
+        if not self._validation_loaded:
+            self.validation_results = await self._validation_store.async_load() or {}
+            self._validation_loaded = True
+        cache = self.validation_results
+
+        results, validated = await self.hass.async_add_executor_job(
+            validate_files, self.catalog.entries(names), cache
+        )
+        if names is not None:
+            results = {**cache, **results}
+        # Oublier les fichiers qui ne sont plus dans le catalogue
+        results = {name: result for name, result in results.items() if name in self.catalog}
+        self.validation_results = results
+        if results != cache:
+            await self._validation_store.async_save(results)
+        _LOGGER.debug(
+            f"Validated {len(validated)} question files, "
+            f"{len(results) - len(validated)} unchanged"
+        )
+
+        # Signaler les fichiers problématiques dans les réparations
+        invalid = {
+            name: len(result["problems"]) + len(result["errors"])
+            for name, result in results.items()
+            if result["problems"] or result["errors"]
+        }
+        if invalid:
+            for name, count in invalid.items():
+                _LOGGER.warning(f"{name}: {count} invalid questions excluded")
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                "invalid_questions",
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key="invalid_questions",
+                translation_placeholders={
+                    "files": ", ".join(
+                        f"{name} ({count})" for name, count in sorted(invalid.items())
+                    )
+                },
+            )
+        else:
+            ir.async_delete_issue(self.hass, DOMAIN, "invalid_questions")
+        self._update_listeners()
+
+        # L'index de recherche suit les exclusions du validateur
+        await self.async_index_questions(names)
+
+    async def async_index_questions(self, names=None) -> None:
+        """Index the text of the question files (or only the given names).
+
+        Files are read and tokenized in the executor, then swapped into the
+        index file by file; files that are no longer available are dropped.
+        """
+        entries = self.catalog.entries(names)
+        results = self.validation_results
+
+        def read_documents() -> dict[str, list]:
+            documents = {}
+            for name, entry in entries.items():
+                # Lecture directe: indexer ne doit pas vider le cache des parties
+                try:
+                    data = read_quiz_file(entry.path, entry.member)
+                except (*READ_ERRORS, ValueError):
+                    continue
+                quizz = data.get("quizz") if isinstance(data, dict) else None
+                if not isinstance(quizz, dict):
+                    continue
+                result = results.get(name)
+                exclude = excluded_questions(result) if result else frozenset()
+                documents[name] = file_documents(name, quizz, exclude)
+            return documents
+
+        for name, documents in (
+            await self.hass.async_add_executor_job(read_documents)
+        ).items():
+            self.search_index.replace_file(name, documents)
+        for name in self.search_index.files() - set(self.question_files()):
+            self.search_index.remove_file(name)
+        _LOGGER.debug(f"Search index: {self.search_index.as_dict()}")
+
+    async def async_index_store(self) -> None:
+        """Index the text of the files imported in the SQLite store."""
+        if not self.store_files:
+            return
+        documents = await self.hass.async_add_executor_job(
+            lambda: store_documents(self.store.search_rows())
+        )
+        by_file: dict[str, list] = {}
+        for document in documents:
+            by_file.setdefault(document.file, []).append(document)
+        for name, found in by_file.items():
+            # Un fichier du même nom dans les dossiers de questions est prioritaire
+            if name not in self.catalog:
+                self.search_index.replace_file(name, found)
+
+    def search_questions(
+        self,
+        query: str,
+        language: str | None = None,
+        difficulty: str | None = None,
+        file: str | None = None,
+        limit: int = 20,
+    ) -> dict:
+        """Return the questions matching a query, with their ids."""
+        hits = self.search_index.search(query, language, difficulty, file)
+        language = language or self.language
+        return {
+            "count": len(hits),
+            "questions": [
+                {
+                    "id": hit.key,
+                    "file": hit.file,
+                    "difficulty": hit.difficulty,
+                    "question": hit.texts.get(language)
+                    or next(iter(hit.texts.values())),
+                    "languages": sorted(hit.texts),
+                }
+                for hit in hits[:limit]
+            ],
+        }
+
     async def _get_notify_service_for_device(self, device_id: str) -> str | None:
         """Find the notify service for a given mobile_app device ID."""
         from homeassistant.helpers import device_registry as dr
@@ -249,9 +853,28 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
 
         return service_name
 
-    async def start_game(self, players_devices: dict[str, Any] | None = None) -> None:
-        """Start a new game, reading options from coordinator state."""
-        if not self.question_file:
+    async def start_game(
+        self,
+        players_devices: dict[str, Any] | None = None,
+        media_players: list[str] | None = None,
+        tts_entity: str | None = None,
+        tts_voice: str | None = None,
+        seed: int | None = None,
+        adaptive: bool = False,
+        query: str | None = None,
+        question_ids: list[str] | None = None,
+    ) -> None:
+        """Start a new game, reading options from coordinator state.
+
+        With media players and a TTS engine, questions and feedback are also
+        announced out loud. Without a seed, a random one is drawn and kept in
+        the game record so the game can be replayed. An adaptive game picks
+        each player's next question by difficulty from a larger pool. With a
+        search query or a list of question ids, the questions are drawn from
+        the matching questions of every file instead of the selected file.
+        """
+        themed = query is not None or question_ids is not None
+        if not themed and not self.question_file:
             _LOGGER.error("Cannot start game: no question file selected.")
             return
 
@@ -265,44 +888,242 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Cannot start game: no player devices selected.")
             return
 
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
         _LOGGER.info(
             f"Starting game: {self.num_players} players, {self.question_file}, "
-            f"{self.difficulty}, {self.num_questions} questions"
+            f"{self.difficulty}, {self.num_questions} questions, {self.language}, "
+            f"seed {seed}"
         )
 
         # Reset game state
         self.game_active = True
         self.players = device_ids[: self.num_players]
-        self.scores = {i + 1: 0 for i in range(self.num_players)}
-        self.player_displayed_choices = {}  # Reset choices mapping
+        self.session = GameSession([], self.num_players, self.language)
+        self.game_record = {
+            "seed": seed,
+            "question_file": self.question_file,
+            "difficulty": self.difficulty,
+            "num_questions": self.num_questions,
+            "num_players": self.num_players,
+            "language": self.language,
+            "player_languages": list(self.player_languages),
+            "players": list(self.players),
+            "adaptive": adaptive,
+            "answers": [],
+        }
+        if themed:
+            if question_ids is None:
+                question_ids = [
+                    hit.key
+                    for hit in self.search_index.search(query, language=self.language)
+                ]
+            # Les ids résolus sont gardés: le rejeu ne dépend pas de l'index
+            self.game_record["question_file"] = None
+            self.game_record["query"] = query
+            self.game_record["question_ids"] = list(dict.fromkeys(question_ids))
+        self._update_listeners(immediate=True)
 
-        # Initialiser l'état par joueur
-        self.player_question_index = {i + 1: 0 for i in range(self.num_players)}
-        self.player_current_question = {}
-        self.player_finished = {i + 1: False for i in range(self.num_players)}
+        # Load questions
+        with self.timings["load_questions"].time():
+            pool, self.pool_keys = await self._async_load_pool(
+                self.game_record, self.rng
+            )
+        _LOGGER.info(f"Loaded {len(pool)} questions")
+        if not pool:
+            if themed:
+                _LOGGER.error(
+                    f"Cannot start game: no question in {self.language} matches "
+                    f"{query if query is not None else question_ids}"
+                )
+            else:
+                _LOGGER.error(
+                    f"Cannot start game: no {self.difficulty} question in "
+                    f"{self.language} in {self.question_file}"
+                )
+            self.game_active = False
+            self._update_listeners(immediate=True)
+            return
 
+        # Tranche de difficulté de chaque question, gardée pour le rejeu
+        buckets = None
+        if adaptive:
+            buckets = self.game_record["buckets"] = [
+                self.question_stats.bucket(key) for key in self.pool_keys
+            ]
+
+        # Les règles du jeu (ordre des choix, scores, progression) sont dans la session
+        self.session = GameSession(
+            pool, self.num_players, self.language, self.player_languages, self.rng,
+            length=self.num_questions, buckets=buckets,
+        )
         self._update_listeners()
 
-        # Load questions
-        await self._load_questions()
+        self.game_id = f"{int(time.time() * 1000):x}"
+        self.journal.record(
+            "start",
+            game=self.game_id,
+            seed=seed,
+            file=self.game_record["question_file"],
+            difficulty=self.difficulty,
+            language=self.language,
+            players=self.num_players,
+            questions=[next(iter(entry.values())).id for entry in pool],
+            query=query,
+        )
 
-        # Send first question to each player independently
+        if self.announcer is not None:
+            self.announcer.clear()
+            self.announcer = None
+        if media_players and (tts_entity or self.tts_provider):
+            provider = self.tts_provider or HomeAssistantTTSProvider(
+                self.hass, tts_entity
+            )
+            self.announcer = Announcer(self.hass, provider, media_players, tts_voice)
+            for player_num in self.session.players:
+                self._prefetch_announcements(player_num)
+
+        # Première question de chaque joueur, envoyées en parallèle: un
+        # appareil injoignable ne retarde pas les autres
+        now = time.monotonic()
+        events = []
         for player_num in range(1, self.num_players + 1):
-            await self.next_question(player_num)
-
-    async def _load_questions(self) -> None:
-        """Load questions from JSON file using coordinator state."""
-        file_path = self.questions_path / self.question_file
+            events.extend(self.session.show(player_num, now))
+        await self._async_handle_events(events)
+
+    async def _async_load_pool(
+        self, options: dict, rng: random.Random
+    ) -> tuple[list, list[str]]:
+        """Draw the questions of a game and return them with their keys.
+
+        options holds the question_file, difficulty, num_questions, language
+        and player_languages of the game, as in a game record. With
+        question_ids (search results or chosen questions), the questions are
+        drawn among those ids instead, across files and difficulties. Each
+        pool entry maps a language to the same question (aligned by id), so
+        players with different languages answer the same question; its key
+        (file:difficulty:id) identifies it in the per-question statistics.
+        """
+        question_file = options["question_file"]
+        difficulty = options["difficulty"]
+        count = options["num_questions"]
+        if options.get("adaptive"):
+            count *= ADAPTIVE_POOL_FACTOR
+        language = options["language"]
+        question_ids = options.get("question_ids")
+        languages = {language} | {
+            player_language or language
+            for player_language in options["player_languages"][: options["num_players"]]
+        }
 
-        def load_json():
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            questions = data["quizz"]["fr"][self.difficulty]
-            return random.sample(questions, min(self.num_questions, len(questions)))
+        def load_file():
+            entry = self.catalog.entry(question_file)
+            # Les fichiers absents des dossiers de questions viennent de la base SQLite
+            if entry is None:
+                if question_file not in self.store_files:
+                    _LOGGER.error(f"Question file not found: {question_file}")
+                    return [], []
+                pool = self.store.sample(
+                    language, difficulty, count,
+                    file=question_file, languages=languages, rng=rng,
+                )
+                ids = [translations[language].id for translations in pool]
+            else:
+                pack = self._question_pack(question_file, entry)
+                available = pack.ids(difficulty, language)
+                ids = rng.sample(available, min(count, len(available)))
+                # Seules les langues des joueurs sont gardées, en format compact
+                pool = [pack.records(difficulty, qid, languages) for qid in ids]
+            return pool, [question_key(question_file, difficulty, qid) for qid in ids]
+
+        def load_ids():
+            packs: dict[str, QuestionPack | None] = {}
+            pool = []
+            keys = []
+            for key in rng.sample(question_ids, min(count, len(question_ids))):
+                try:
+                    file, level, qid = parse_question_key(key)
+                except ValueError:
+                    _LOGGER.warning(f"Invalid question id: {key}")
+                    continue
+                if file not in packs:
+                    entry = self.catalog.entry(file)
+                    packs[file] = (
+                        None if entry is None else self._question_pack(file, entry)
+                    )
+                translations = {}
+                if packs[file] is not None:
+                    try:
+                        translations = packs[file].records(level, qid, languages)
+                    except KeyError:
+                        pass
+                elif file in self.store_files:
+                    translations = self.store.get(file, level, qid, languages)
+                if language not in translations:
+                    _LOGGER.warning(f"Question {key} not found in {language}")
+                    continue
+                pool.append(translations)
+                keys.append(key)
+            return pool, keys
+
+        return await self.hass.async_add_executor_job(
+            load_file if question_ids is None else load_ids
+        )
 
-        self.questions_pool = await self.hass.async_add_executor_job(load_json)
-        _LOGGER.info(f"Loaded {len(self.questions_pool)} questions")
-        self._update_listeners()
+    def _question_pack(self, name: str, entry: CatalogEntry) -> QuestionPack:
+        """Return the playable questions of a catalog file. Blocking."""
+        # Décompressé et parsé une seule fois tant que le fichier ne change pas
+        data = self.quiz_files.get(entry)
+        # Exclure les questions signalées par le validateur
+        result = self.validation_results.get(name)
+        if result is not None:
+            exclude = excluded_questions(result)
+        else:
+            exclude = {
+                (lang, level, qid)
+                for lang, level, qid, _reason in validate_quizz(data)[1]
+            }
+        return QuestionPack(name, data.get("quizz", {}), exclude)
+
+    async def _async_handle_events(self, events: list) -> None:
+        """Turn game session events into notifications and entity updates.
+
+        Entities are updated once for all the events, and the questions of
+        several players (a batch of answers) are sent concurrently.
+        """
+
+        async def send_question(event: QuestionShown, device_id: str) -> None:
+            with self.timings["send_question"].time():
+                await self._send_question_notification(event, device_id)
+
+        sends = []
+        finished = False
+        for event in events:
+            if isinstance(event, QuestionShown):
+                self.journal.record(
+                    "question",
+                    game=self.game_id,
+                    player=event.player,
+                    index=event.index,
+                    qid=event.question.id,
+                    language=event.language,
+                )
+                # Envoyer la notification seulement à ce joueur
+                device_id = self.players[event.player - 1]  # player est 1-indexed
+                sends.append(send_question(event, device_id))
+            elif isinstance(event, PlayerFinished):
+                _LOGGER.info(f"Player {event.player} has finished all questions")
+            elif isinstance(event, GameFinished):
+                _LOGGER.info("All players finished, stopping game")
+                finished = True
+        if events:
+            self._update_listeners()
+        await asyncio.gather(*sends)
+        if finished:
+            await self.stop_game()
 
     async def next_question(self, player_num: int) -> None:
         """Send the next question to a specific player."""
@@ -310,80 +1131,34 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Next question called but game is not active.")
             return
 
-        # Vérifier si ce joueur a terminé
-        player_index = self.player_question_index[player_num]
-        if player_index >= len(self.questions_pool):
-            # Ce joueur a terminé toutes ses questions
-            self.player_finished[player_num] = True
-            _LOGGER.info(f"Player {player_num} has finished all questions")
-
-            # Vérifier si TOUS les joueurs ont terminé
-            if all(self.player_finished.values()):
-                _LOGGER.info("All players finished, stopping game")
-                await self.stop_game()
-            return
-
-        # Récupérer la question pour ce joueur
-        self.player_current_question[player_num] = self.questions_pool[player_index]
-        self._update_listeners()
-
-        # Envoyer la notification seulement à ce joueur
-        device_id = self.players[player_num - 1]  # player_num est 1-indexed
-        await self._send_question_notification(player_num, device_id)
+        await self._async_handle_events(
+            self.session.advance(player_num, time.monotonic())
+        )
 
     async def _send_question_notification(
-        self, player_num: int, device_id: str
+        self, event: QuestionShown, device_id: str
     ) -> None:
         """Send question notification to a player with 3 choices (Android limit)."""
+        player_num = event.player
+        _LOGGER.debug(f"Player {player_num} choices: {event.choices}")
+
+        if self.announcer is not None:
+            self._announce(*self._question_announcement(player_num, event.index))
+            self._prefetch_announcements(player_num)
+
         service_name = await self._get_notify_service_for_device(device_id)
         if not service_name:
             return
 
-        # Récupérer la question de CE joueur
-        question = self.player_current_question.get(player_num)
-        if not question:
-            _LOGGER.warning(f"No current question for player {player_num}")
-            return
-
-        # Identifier la bonne réponse
-        correct_answer = question["réponse"]
-        all_propositions = question["propositions"]
-
-        # Séparer bonne réponse et mauvaises réponses
-        wrong_answers = [p for p in all_propositions if p != correct_answer]
-
-        # Sélectionner 2 mauvaises réponses aléatoirement parmi les 3 disponibles
-        selected_wrong = random.sample(wrong_answers, 2)
-
-        # Créer liste de 3 propositions (1 bonne + 2 mauvaises)
-        three_choices = [correct_answer] + selected_wrong
-
-        # Mélanger l'ordre pour que la bonne réponse ne soit pas toujours en position A
-        random.shuffle(three_choices)
-
-        # Créer mapping A/B/C -> texte de proposition
-        choices_map = {
-            "A": three_choices[0],
-            "B": three_choices[1],
-            "C": three_choices[2]
-        }
-
-        # Stocker le mapping pour validation ultérieure
-        self.player_displayed_choices[player_num] = choices_map
-
-        _LOGGER.debug(f"Player {player_num} choices: {choices_map}")
-
         # Format message avec question et 3 options
-        message = f"{question['question']}\n\n"
-        message += f"A) {three_choices[0]}\n"
-        message += f"B) {three_choices[1]}\n"
-        message += f"C) {three_choices[2]}"
+        message = f"{event.question.text}\n\n" + "\n".join(
+            f"{letter}) {text}" for letter, text in event.choices.items()
+        )
 
-        await self.hass.services.async_call(
-            "notify",
+        await self.notifier.async_send(
             service_name,
             {
-                "title": f"🎮 Question {self.player_question_index[player_num] + 1}/{len(self.questions_pool)}",
+                "title": f"🎮 Question {event.index + 1}/{event.total}",
                 "message": message,
                 "data": {
                     "actions": [
@@ -397,6 +1172,49 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
             },
         )
 
+    def _question_announcement(self, player_num: int, index: int) -> tuple[str, str]:
+        """Return the text and language announcing a player's question."""
+        question, language = self.session.question(player_num, index)
+        order = self.session.choice_order(player_num, index)
+        choices = " ".join(
+            f"{letter}: {question.propositions[choice]}."
+            for letter, choice in zip(CHOICE_LETTERS, order)
+        )
+        intro = phrase(language, "question", player=player_num, number=index + 1)
+        return f"{intro} {question.text} {choices}", language
+
+    def _feedback_announcement(
+        self, player_num: int, index: int, is_correct: bool
+    ) -> tuple[str, str]:
+        """Return the text and language announcing a player's result."""
+        question, language = self.session.question(player_num, index)
+        if is_correct:
+            return phrase(language, "correct", player=player_num), language
+        return (
+            phrase(language, "wrong", player=player_num, answer=question.answer),
+            language,
+        )
+
+    def _prefetch_announcements(self, player_num: int) -> None:
+        """Render the announcements of a player's next questions ahead of time."""
+        state = self.session.players[player_num]
+        start = state.index
+        # En mode adaptatif, seules les questions déjà tirées sont connues
+        end = min(start + 1 + self.announcer.prefetch_count, len(state.sequence))
+        items = []
+        for index in range(start, end):
+            items.append(self._question_announcement(player_num, index))
+            items.append(self._feedback_announcement(player_num, index, True))
+            items.append(self._feedback_announcement(player_num, index, False))
+        self.announcer.prefetch(items)
+
+    @callback
+    def _announce(self, text: str, language: str) -> None:
+        """Play an announcement without delaying the notifications."""
+        self.entry.async_create_background_task(
+            self.hass, self.announcer.async_announce(text, language), "trivia_announce"
+        )
+
     async def _send_answer_feedback(
         self, player_num: int, device_id: str, is_correct: bool,
         player_answer: str, correct_answer: str
@@ -407,8 +1225,7 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
             return
 
         # Supprimer la notification de question active
-        await self.hass.services.async_call(
-            "notify",
+        await self.notifier.async_send(
             service_name,
             {
                 "message": "clear_notification",
@@ -435,8 +1252,7 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
             icon = "mdi:close-circle"
 
         # Envoyer la notification de feedback
-        await self.hass.services.async_call(
-            "notify",
+        await self.notifier.async_send(
             service_name,
             {
                 "title": title,
@@ -454,77 +1270,228 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
 
     async def check_answer(self, player: int, answer: str) -> None:
         """Check a player's answer using the 3-choice mapping."""
-        # Vérifier que ce joueur a une question active
-        if player not in self.player_current_question:
+        if not self.game_active:
             _LOGGER.warning(f"No current question for player {player}")
             return
 
-        # Récupérer le mapping des choix affichés pour ce joueur
-        if player not in self.player_displayed_choices:
-            _LOGGER.warning(f"No displayed choices found for player {player}")
+        # Lettre (A, B, C) ou texte libre (saisie, Assist) résolu par la session
+        result = self.session.answer(player, answer, time.monotonic())
+        if result is None:
+            _LOGGER.warning(
+                f"Could not match answer {answer!r} to A, B or C for player {player}"
+            )
             return
+        self._record_answer(result, answer)
+        self._update_listeners()
 
-        choices_map = self.player_displayed_choices[player]
-
-        # Vérifier que la réponse est valide (A, B, ou C)
-        if answer not in choices_map:
-            _LOGGER.warning(f"Invalid answer format: {answer} (expected A, B, or C)")
-            return
+        if self.announcer is not None:
+            self._announce(
+                *self._feedback_announcement(player, result.index, result.correct)
+            )
 
-        # Récupérer le texte de la proposition sélectionnée
-        player_answer = choices_map[answer]
-        correct_answer = self.player_current_question[player]["réponse"]
+        # Envoyer le feedback au joueur qui a répondu
+        await self._async_feedback_and_advance(result)
 
-        # Vérifier si la réponse est correcte
-        is_correct = player_answer == correct_answer
+    def _record_answer(self, result: AnswerChecked, answer: str) -> None:
+        """Keep a scored answer in the game record, statistics and journal."""
+        player = result.player
+        self.game_record["answers"].append(
+            [player, answer, round(result.elapsed or 0.0, 3)]
+        )
 
-        if is_correct:
-            self.scores[player] = self.scores.get(player, 0) + 1
-            _LOGGER.info(f"Player {player} answered correctly! ({answer}: {player_answer})")
+        if result.elapsed is not None:
+            self.timings["answer_time"].record(result.elapsed)
+        qid = self.session.question(player, result.index)[0].id
+        key = self.pool_keys[self.session.position(player, result.index)]
+        self.question_stats.record(key, result.correct)
+        self._question_stats_store.async_delay_save(
+            self.question_stats.as_data, QUESTION_STATS_SAVE_DELAY
+        )
+        # Partie par recherche: le fichier change d'une question à l'autre
+        source = {}
+        if "question_ids" in self.game_record:
+            file, difficulty, _qid = parse_question_key(key)
+            source = {"file": file, "difficulty": difficulty}
+        self.journal.record(
+            "answer",
+            game=self.game_id,
+            player=player,
+            index=result.index,
+            qid=qid,
+            letter=result.letter,
+            correct=result.correct,
+            elapsed=round(result.elapsed, 3) if result.elapsed is not None else None,
+            **source,
+        )
+        if result.correct:
+            _LOGGER.info(f"Player {player} answered correctly! ({result.letter}: {result.answer})")
         else:
-            _LOGGER.info(f"Player {player} answered incorrectly. ({answer}: {player_answer} != {correct_answer})")
+            _LOGGER.info(f"Player {player} answered incorrectly. ({result.letter}: {result.answer} != {result.correct_answer})")
 
-        # Envoyer le feedback au joueur qui a répondu
+    async def _async_feedback_and_advance(self, result: AnswerChecked) -> None:
+        """Send the feedback of a scored answer, then the player's next question.
+
+        Each player of a batch runs this on their own, so a device slow to
+        receive its feedback never delays the next question of the others.
+        """
+        player = result.player
         device_id = self.players[player - 1]  # player_num est 1-indexed
-        await self._send_answer_feedback(
-            player, device_id, is_correct, player_answer, correct_answer
-        )
+        with self.timings["send_feedback"].time():
+            await self._send_answer_feedback(
+                player, device_id, result.correct, result.answer, result.correct_answer
+            )
 
         # Attendre 7 secondes pour laisser le temps de lire le feedback
-        await asyncio.sleep(7)
-
-        # Incrémenter l'index de question pour CE joueur uniquement
-        self.player_question_index[player] += 1
-        self._update_listeners()
+        self.player_advance_due[player] = time.monotonic() + FEEDBACK_DELAY
+        try:
+            await asyncio.sleep(FEEDBACK_DELAY)
+        finally:
+            self.player_advance_due.pop(player, None)
 
         # Envoyer la question suivante seulement à CE joueur
         await self.next_question(player)
 
+    async def submit_answers(self, answers: list[dict]) -> dict:
+        """Score a batch of answers from buzzers or another external source.
+
+        Each answer is {player, choice, timestamp}: choice is a letter or
+        text as in check_answer, timestamp the Unix time of the press
+        (defaults to now). The batch is checked in one pass and applied all
+        at once: if one answer is invalid, none is scored. Entities are
+        updated once, then each player of the batch gets their feedback and
+        next question in the background, independently of the others.
+        Returns the accepted, skipped and rejected answers.
+        """
+        if not self.game_active:
+            raise HomeAssistantError("No game in progress")
+
+        now = time.monotonic()
+        wall = time.time()
+        batch = [
+            (
+                answer["player"],
+                answer["choice"],
+                # Heure de l'appui ramenée à l'horloge monotone de la session
+                now - max(wall - answer["timestamp"], 0.0)
+                if "timestamp" in answer
+                else now,
+            )
+            for answer in answers
+        ]
+        results, skipped, rejected = self.session.answer_batch(batch)
+
+        counts = self.answer_batches
+        counts["batches"] += 1
+        counts["skipped"] += len(skipped)
+        counts["rejected"] += len(rejected)
+        response = {
+            "accepted": [
+                {
+                    "player": result.player,
+                    "letter": result.letter,
+                    "correct": result.correct,
+                }
+                for result in results
+            ],
+            "skipped": [asdict(item) for item in skipped],
+            "rejected": [asdict(item) for item in rejected],
+        }
+        if rejected:
+            _LOGGER.warning(f"Rejected a batch of {len(answers)} answers: {response['rejected']}")
+            return response
+
+        counts["answers"] += len(results)
+        for result in results:
+            self._record_answer(result, result.letter)
+        if results:
+            self._update_listeners()
+        for result in results:
+            self.entry.async_create_background_task(
+                self.hass,
+                self._async_feedback_and_advance(result),
+                f"trivia_answer_feedback_{result.player}",
+            )
+        return response
+
     async def stop_game(self) -> None:
         """Stop the game and show final scores."""
         if not self.game_active:
             return
 
-        _LOGGER.info(f"Game finished. Final scores: {self.scores}")
+        if not self.session.finished:
+            self.session.finish()
+        _LOGGER.info(f"Game finished. Final scores: {self.session.scores}")
+        self.journal.record("end", game=self.game_id, scores=self.session.scores)
         self.game_active = False
+        self._update_listeners(immediate=True)
+
+        # Classement construit une seule fois pour tous les joueurs
+        ranking_message = self.session.leaderboard.render(self.session.total)
+
+        async def send_results(player_num: int, device_id: str) -> None:
+            await self._send_final_score(player_num, device_id)
+            # Attendre 7 secondes pour que le joueur lise son score individuel
+            await asyncio.sleep(FEEDBACK_DELAY)
+            await self._send_ranking(player_num, device_id, ranking_message)
+
+        # Score puis classement, joueur par joueur et en parallèle: un appareil
+        # lent ne retarde pas le classement des autres
+        await asyncio.gather(
+            *(
+                send_results(i + 1, device_id)
+                for i, device_id in enumerate(self.players)
+            )
+        )
 
-        # Send final scores to all players
-        for i, device_id in enumerate(self.players):
-            await self._send_final_score(i + 1, device_id)
-
-        # Attendre 7 secondes pour que les joueurs lisent leur score individuel
-        await asyncio.sleep(7)
-
-        # Envoyer le classement à tous les joueurs
-        for i, device_id in enumerate(self.players):
-            await self._send_ranking(i + 1, device_id)
+        if self.announcer is not None:
+            self.announcer.clear()
+            self.announcer = None
+        self._update_listeners(immediate=True)
+        _LOGGER.debug(
+            f"Listener updates: {self.update_requests} requested, "
+            f"{self.coalesced_updates} coalesced"
+        )
 
-        # Nettoyer l'état par joueur
-        self.player_question_index = {}
-        self.player_current_question = {}
-        self.player_finished = {}
-        self._update_listeners()
+    async def export_journal(self, directory: str | None = None) -> None:
+        """Write CSV summaries of the game journal.
 
+        A relative directory is resolved from the configuration directory.
+        """
+        target = Path(self.hass.config.path(directory or JOURNAL_EXPORT_DIR))
+        try:
+            players_path, questions_path = await self.journal.async_export(target)
+        except OSError as err:
+            _LOGGER.error(f"Cannot export the game journal to {target}: {err}")
+            return
+        _LOGGER.info(f"Game journal exported to {players_path} and {questions_path}")
+
+    async def async_replay(self, record: dict | None = None) -> dict:
+        """Replay a game record and return the resulting scores.
+
+        The questions are drawn again with the recorded seed and options, and
+        the recorded answers are played on a separate game session, with no
+        notification and no pause. Uses the last game when no record is given.
+        """
+        record = record or self.game_record
+        if not record:
+            raise HomeAssistantError("No game to replay")
+
+        rng = random.Random(record["seed"])
+        pool, _keys = await self._async_load_pool(record, rng)
+        session = GameSession(
+            pool, record["num_players"], record["language"],
+            record["player_languages"], rng,
+            length=record["num_questions"], buckets=record.get("buckets"),
+        )
+        finished = session.replay(record["answers"])
+        result = {
+            "seed": record["seed"],
+            "questions": session.total,
+            "scores": finished.scores,
+            "ranking": finished.ranking,
+        }
+        _LOGGER.info(f"Replayed game with seed {record['seed']}: {result['scores']}")
+        return result
 
     async def _send_final_score(self, player_num: int, device_id: str) -> None:
         """Send final score to a player."""
@@ -532,12 +1499,11 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
         if not service_name:
             return
 
-        score = self.scores.get(player_num, 0)
-        total = len(self.questions_pool)
+        score = self.session.scores.get(player_num, 0)
+        total = self.session.total
 
         # D'abord, supprimer la notification de question active
-        await self.hass.services.async_call(
-            "notify",
+        await self.notifier.async_send(
             service_name,
             {
                 "message": "clear_notification",
@@ -551,8 +1517,7 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
         await asyncio.sleep(0.5)
 
         # Ensuite, envoyer le score final avec tag différent
-        await self.hass.services.async_call(
-            "notify",
+        await self.notifier.async_send(
             service_name,
             {
                 "title": "🏆 Fin du jeu!",
@@ -565,35 +1530,16 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
             },
         )
 
-    async def _send_ranking(self, player_num: int, device_id: str) -> None:
-        """Send final ranking to a player showing all players' scores."""
+    async def _send_ranking(
+        self, player_num: int, device_id: str, ranking_message: str
+    ) -> None:
+        """Send the final ranking message to a player."""
         service_name = await self._get_notify_service_for_device(device_id)
         if not service_name:
             return
 
-        total = len(self.questions_pool)
-
-        # Créer liste des scores avec numéro de joueur
-        player_scores = []
-        for p_num in range(1, self.num_players + 1):
-            score = self.scores.get(p_num, 0)
-            player_scores.append((p_num, score))
-
-        # Trier par score décroissant
-        player_scores.sort(key=lambda x: x[1], reverse=True)
-
-        # Construire le message de classement
-        ranking_message = ""
-        medals = ["🥇", "🥈", "🥉"]
-
-        for position, (p_num, score) in enumerate(player_scores, start=1):
-            # Utiliser médailles pour les 3 premiers, sinon numéro de position
-            position_icon = medals[position - 1] if position <= 3 else f"{position}."
-            ranking_message += f"{position_icon} Joueur {p_num}: {score}/{total}\n"
-
         # Supprimer la notification de score individuel
-        await self.hass.services.async_call(
-            "notify",
+        await self.notifier.async_send(
             service_name,
             {
                 "message": "clear_notification",
@@ -607,16 +1553,15 @@ class TriviaGameCoordinator(DataUpdateCoordinator):
         await asyncio.sleep(0.5)
 
         # Envoyer le classement
-        await self.hass.services.async_call(
-            "notify",
+        await self.notifier.async_send(
             service_name,
             {
                 "title": "📊 Classement Final",
-                "message": ranking_message.strip(),
+                "message": ranking_message,
                 "data": {
                     "tag": "trivia_ranking",
                     "notification_icon": "mdi:podium",
                     "color": "#9C27B0",  # Violet
                 },
             },
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,187 @@
+"""Spoken announcements of questions on media players."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, OrderedDict
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .const import TTS_CACHE_SIZE, TTS_PREFETCH
+
+_LOGGER = logging.getLogger(__name__)
+
+# Phrases des annonces, dans la langue de la question du joueur
+ANNOUNCEMENT_PHRASES = {
+    "fr": {
+        "question": "Joueur {player}, question {number}.",
+        "correct": "Joueur {player}, bonne réponse !",
+        "wrong": "Joueur {player}, mauvaise réponse. La bonne réponse était {answer}.",
+    },
+    "en": {
+        "question": "Player {player}, question {number}.",
+        "correct": "Player {player}, correct answer!",
+        "wrong": "Player {player}, wrong answer. The right answer was {answer}.",
+    },
+    "es": {
+        "question": "Jugador {player}, pregunta {number}.",
+        "correct": "Jugador {player}, ¡respuesta correcta!",
+        "wrong": "Jugador {player}, respuesta incorrecta. La respuesta correcta era {answer}.",
+    },
+    "it": {
+        "question": "Giocatore {player}, domanda {number}.",
+        "correct": "Giocatore {player}, risposta esatta!",
+        "wrong": "Giocatore {player}, risposta sbagliata. La risposta giusta era {answer}.",
+    },
+    "de": {
+        "question": "Spieler {player}, Frage {number}.",
+        "correct": "Spieler {player}, richtige Antwort!",
+        "wrong": "Spieler {player}, falsche Antwort. Die richtige Antwort war {answer}.",
+    },
+    "nl": {
+        "question": "Speler {player}, vraag {number}.",
+        "correct": "Speler {player}, goed antwoord!",
+        "wrong": "Speler {player}, fout antwoord. Het juiste antwoord was {answer}.",
+    },
+}
+
+
+def phrase(language: str, key: str, **values) -> str:
+    """Return an announcement phrase in a language, in French if missing."""
+    phrases = ANNOUNCEMENT_PHRASES.get(language, ANNOUNCEMENT_PHRASES["fr"])
+    return phrases[key].format(**values)
+
+
+class TTSProvider:
+    """Turn a text into media a media player can play.
+
+    Subclass it to use another engine; a local stand-in only needs to
+    return any media content id from async_render.
+    """
+
+    async def async_render(self, text: str, language: str, voice: str | None) -> str:
+        """Synthesize text and return a playable media content id."""
+        raise NotImplementedError
+
+
+class HomeAssistantTTSProvider(TTSProvider):
+    """Render through a Home Assistant TTS entity or engine."""
+
+    def __init__(self, hass: HomeAssistant, engine: str) -> None:
+        """Initialize the provider."""
+        self.hass = hass
+        self.engine = engine
+
+    async def async_render(self, text: str, language: str, voice: str | None) -> str:
+        """Synthesize the audio now so playing it later has no wait."""
+        from homeassistant.components import tts
+
+        media_id = tts.generate_media_source_id(
+            self.hass,
+            text,
+            engine=self.engine,
+            language=language,
+            options={tts.ATTR_VOICE: voice} if voice else None,
+        )
+        # Génère l'audio et le place dans le cache TTS de Home Assistant
+        await tts.async_get_media_source_audio(self.hass, media_id)
+        return media_id
+
+
+class Announcer:
+    """Play announcements, rendering upcoming ones ahead of time.
+
+    Rendered media are kept in an LRU cache keyed by (text, language, voice).
+    A pending render is cached as its future, so a prefetch and a later
+    announcement of the same text share one synthesis.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        provider: TTSProvider,
+        media_players: list[str],
+        voice: str | None = None,
+        prefetch: int = TTS_PREFETCH,
+        cache_size: int = TTS_CACHE_SIZE,
+    ) -> None:
+        """Initialize the announcer."""
+        self.hass = hass
+        self.provider = provider
+        self.media_players = media_players
+        self.voice = voice
+        self.prefetch_count = prefetch
+        self.cache_size = cache_size
+        self.stats: Counter[str] = Counter()
+        self._cache: OrderedDict[tuple, asyncio.Future] = OrderedDict()
+
+    def _render(self, text: str, language: str) -> asyncio.Future:
+        """Return the cached render of a text, starting it if needed."""
+        key = (text, language, self.voice)
+        future = self._cache.get(key)
+        if future is not None:
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return future
+
+        self.stats["misses"] += 1
+        future = self.hass.async_create_background_task(
+            self.provider.async_render(text, language, self.voice),
+            "trivia_tts_render",
+        )
+        future.add_done_callback(lambda done: self._render_done(key, done))
+        self._cache[key] = future
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return future
+
+    def _render_done(self, key: tuple, future: asyncio.Future) -> None:
+        """Forget failed renders so they are retried next time."""
+        if not future.cancelled() and future.exception() is None:
+            return
+        if self._cache.get(key) is future:
+            del self._cache[key]
+        if not future.cancelled():
+            self.stats["errors"] += 1
+            _LOGGER.warning(f"TTS rendering failed: {future.exception()}")
+
+    def prefetch(self, items) -> None:
+        """Start rendering (text, language) items that are not cached yet."""
+        for text, language in items:
+            if (text, language, self.voice) not in self._cache:
+                self.stats["prefetched"] += 1
+                self._render(text, language)
+
+    async def async_announce(self, text: str, language: str) -> None:
+        """Play a text on the media players."""
+        try:
+            media_id = await self._render(text, language)
+        except Exception:  # noqa: BLE001
+            # Déjà journalisé par _render_done
+            return
+        await self.hass.services.async_call(
+            "media_player",
+            "play_media",
+            {
+                "entity_id": self.media_players,
+                "media_content_id": media_id,
+                "media_content_type": "music",
+                "announce": True,
+            },
+        )
+        self.stats["announced"] += 1
+
+    def clear(self) -> None:
+        """Drop the cache, cancelling pending renders."""
+        for future in self._cache.values():
+            future.cancel()
+        self._cache.clear()
+
+    def as_dict(self) -> dict:
+        """Return cache statistics for diagnostics."""
+        return {
+            "media_players": len(self.media_players),
+            "cached": len(self._cache),
+            "cache_size": self.cache_size,
+            "stats": dict(self.stats),
+        }
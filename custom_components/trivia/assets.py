@@ -0,0 +1,86 @@
+"""Content-hashed, precompressed assets of the Trivia panel."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+PANEL_URL = f"/{DOMAIN}/panel"
+ASSETS_URL = f"/{DOMAIN}/assets"
+
+# Fichiers déjà compressés: le gzip n'y gagne rien
+COMPRESSED_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".woff2", ".gz")
+
+
+def build_assets(source: Path, target: Path) -> dict[str, str]:
+    """Copy the panel files to target under content-hashed names. Blocking.
+
+    Each file gets a name.<hash>.suffix copy and, when it compresses, a .gz
+    variant next to it that aiohttp serves to clients accepting gzip.
+    Unchanged files are not rewritten and stale builds are removed.
+    Returns {original name: hashed name}.
+    """
+    target.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    keep = set()
+    for path in sorted(source.iterdir()):
+        if not path.is_file():
+            continue
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        hashed = f"{path.stem}.{digest}{path.suffix}"
+        manifest[path.name] = hashed
+        keep.add(hashed)
+
+        built = target / hashed
+        if not built.exists():
+            built.write_bytes(content)
+        if path.suffix not in COMPRESSED_SUFFIXES:
+            compressed = target / f"{hashed}.gz"
+            keep.add(compressed.name)
+            if not compressed.exists():
+                # mtime=0: même contenu, même fichier compressé
+                data = gzip.compress(content, compresslevel=9, mtime=0)
+                if len(data) < len(content):
+                    compressed.write_bytes(data)
+                else:
+                    keep.discard(compressed.name)
+
+    for stale in target.iterdir():
+        if stale.name not in keep and stale.is_file():
+            stale.unlink()
+    return manifest
+
+
+class PanelAssetView(HomeAssistantView):
+    """Redirect the stable panel URLs to their hashed, cacheable copies.
+
+    The redirect itself is tiny and never cached, so a new version of the
+    panel is picked up on the next load while the file stays cached.
+    """
+
+    url = PANEL_URL + "/{filename}"
+    name = f"{DOMAIN}:panel"
+    requires_auth = False
+
+    def __init__(self, manifest: dict[str, str]) -> None:
+        """Initialize the view."""
+        self.manifest = manifest
+
+    async def get(self, request: web.Request, filename: str) -> web.Response:
+        """Redirect to the hashed asset."""
+        hashed = self.manifest.get(filename)
+        if hashed is None:
+            raise web.HTTPNotFound()
+        raise web.HTTPFound(
+            f"{ASSETS_URL}/{hashed}", headers={"Cache-Control": "no-cache"}
+        )
@@ -0,0 +1,185 @@
+"""Question packs for the Trivia Game integration."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import gzip
+import json
+import lzma
+from pathlib import Path
+import sys
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+import zipfile
+
+if TYPE_CHECKING:
+    from .catalog import CatalogEntry
+
+# Compression transparente, choisie d'après l'extension du fichier
+COMPRESSED_OPENERS = {".gz": gzip.open, ".xz": lzma.open}
+
+# Erreurs possibles en lisant un fichier, compressé ou non
+READ_ERRORS = (OSError, EOFError, lzma.LZMAError, zipfile.BadZipFile, KeyError)
+
+
+class Question(NamedTuple):
+    """Compact, immutable question record shared by every player.
+
+    Propositions are interned (answers such as "Vrai" or a year repeat across
+    questions) and the right answer is stored as an index into them.
+    """
+
+    id: int
+    text: str
+    propositions: tuple[str, ...]
+    answer_index: int
+    anecdote: str
+
+    @property
+    def answer(self) -> str:
+        """Return the text of the right answer."""
+        return self.propositions[self.answer_index]
+
+    @classmethod
+    def from_dict(cls, data: dict, qid: int | None = None) -> "Question":
+        """Build a record from an OpenQuizzDB question.
+
+        qid is the id the question is indexed under, its position in its
+        level when the file has no "id"; it defaults to data["id"].
+        """
+        propositions = tuple(sys.intern(text) for text in data["propositions"])
+        return cls(
+            data.get("id") if qid is None else qid,
+            data["question"],
+            propositions,
+            propositions.index(data["réponse"]),
+            data.get("anecdote") or "",
+        )
+
+
+class QuestionPack:
+    """Every language of one OpenQuizzDB file, aligned by question id.
+
+    The file is parsed once; the pack only indexes the parsed questions by
+    (difficulty, id, language), so serving an extra language costs a dict
+    entry per question, not another load.
+    """
+
+    def __init__(self, name: str, quizz: dict, exclude=frozenset()) -> None:
+        """Index the "quizz" section of an OpenQuizzDB file.
+
+        exclude holds the (language, difficulty, id) reported by the
+        validator; those translations are left out of the pack.
+        """
+        self.name = name
+        self.languages = list(quizz)
+        self._levels: dict[str, dict[int, dict[str, dict]]] = {}
+        for language, levels in quizz.items():
+            if not isinstance(levels, dict):
+                continue
+            for difficulty, questions in levels.items():
+                if not isinstance(questions, list):
+                    continue
+                by_id = self._levels.setdefault(difficulty, {})
+                for position, question in enumerate(questions):
+                    if not isinstance(question, dict):
+                        continue
+                    qid = question.get("id", position)
+                    if (language, difficulty, qid) in exclude:
+                        continue
+                    by_id.setdefault(qid, {})[language] = question
+
+    def ids(self, difficulty: str, language: str) -> list[int]:
+        """Return the ids of the questions available in a language."""
+        return [
+            qid
+            for qid, translations in self._levels.get(difficulty, {}).items()
+            if language in translations
+        ]
+
+    def get(self, difficulty: str, qid: int) -> dict[str, dict]:
+        """Return the translations of a question, keyed by language."""
+        return self._levels[difficulty][qid]
+
+    def records(self, difficulty: str, qid: int, languages) -> dict[str, Question]:
+        """Return compact records of a question for the given languages."""
+        return {
+            language: Question.from_dict(question, qid)
+            for language, question in self._levels[difficulty][qid].items()
+            if language in languages
+        }
+
+
+def quiz_file_name(filename: str) -> str:
+    """Return the name of a question file without its compression suffix."""
+    for suffix in COMPRESSED_OPENERS:
+        if filename.endswith(f".json{suffix}"):
+            return filename[: -len(suffix)]
+    return filename
+
+
+def read_quiz_bytes(path: Path, member: str | None = None) -> bytes:
+    """Return the decompressed content of a question file. Blocking.
+
+    member is the name of the file inside a zip archive at path.
+    """
+    if member is not None:
+        with zipfile.ZipFile(path) as archive:
+            return archive.read(member)
+    opener = COMPRESSED_OPENERS.get(path.suffix, open)
+    with opener(path, "rb") as f:
+        return f.read()
+
+
+def read_quiz_file(path: Path, member: str | None = None) -> dict:
+    """Parse a question file. Blocking, run it in the executor."""
+    return json.loads(read_quiz_bytes(path, member))
+
+
+class QuizFileCache:
+    """Parsed question files, least recently used evicted first.
+
+    Entries are keyed by catalog entry, which holds the size and mtime of
+    the file: a modified file is simply a miss and its stale copy ages out.
+    get() is blocking and may run from several executor threads.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[CatalogEntry, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, entry: CatalogEntry) -> dict:
+        """Return the parsed file of a catalog entry. Blocking."""
+        with self._lock:
+            data = self._data.get(entry)
+            if data is not None:
+                self._data.move_to_end(entry)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        # Décompression et parsing hors du verrou
+        data = read_quiz_file(entry.path, entry.member)
+        with self._lock:
+            self._data[entry] = data
+            self._data.move_to_end(entry)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return data
+
+    def clear(self) -> None:
+        """Forget every parsed file."""
+        with self._lock:
+            self._data.clear()
+
+    def as_dict(self) -> dict:
+        """Return cache statistics for diagnostics."""
+        return {
+            "files": len(self._data),
+            "max_files": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -17,13 +17,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Trivia button entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
-        [
-            TriviaStartGameButton(coordinator, entry),
-            TriviaNextQuestionButton(coordinator, entry),
-            TriviaStopGameButton(coordinator, entry),
-        ]
-    )
+    buttons = [
+        TriviaStartGameButton(coordinator, entry),
+        TriviaNextQuestionButton(coordinator, entry),
+        TriviaStopGameButton(coordinator, entry),
+    ]
+    coordinator.watchdog.watch_entities(buttons)
+    async_add_entities(buttons)
 
 
 class TriviaStartGameButton(ButtonEntity):
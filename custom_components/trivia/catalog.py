@@ -0,0 +1,149 @@
+"""Catalog of the question files available to games."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import os
+from pathlib import Path, PurePosixPath
+import zipfile
+
+from .bank import quiz_file_name
+
+_LOGGER = logging.getLogger(__name__)
+
+QUESTION_FILE_SUFFIXES = (".json", ".json.gz", ".json.xz")
+ARCHIVE_SUFFIXES = (".zip",)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """A question file and the stat used to detect changes.
+
+    Files read from a zip archive have the archive as path, the name of the
+    file inside it as member, and the archive mtime.
+    """
+
+    path: Path
+    size: int
+    mtime: float
+    member: str | None = None
+
+
+@dataclass
+class CatalogChanges:
+    """Names of the files added, modified and removed by a scan."""
+
+    added: set[str] = field(default_factory=set)
+    changed: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+class QuestionCatalog:
+    """Question files found in the bundled folder and the user folders.
+
+    Directories are listed in priority order: a file in a later directory
+    replaces a bundled file with the same name. scan() is a cheap mtime
+    poll meant to run in the executor; it only reports the entries that
+    differ from the previous scan. Compressed files are listed under their
+    .json name, and the .json files of zip archives are listed as well.
+    """
+
+    def __init__(self, directories: list[Path]) -> None:
+        """Initialize an empty catalog."""
+        self.directories = directories
+        self._entries: dict[str, CatalogEntry] = {}
+        # Contenu des archives, relu seulement quand l'archive change
+        self._archives: dict[Path, tuple[int, float, dict[str, CatalogEntry]]] = {}
+
+    def names(self) -> list[str]:
+        """Return the sorted file names."""
+        return sorted(self._entries)
+
+    def entry(self, name: str) -> CatalogEntry | None:
+        """Return the entry of a file, or None if it is not in the catalog."""
+        return self._entries.get(name)
+
+    def entries(self, names=None) -> dict[str, CatalogEntry]:
+        """Return the entries of all files, or of the given names."""
+        if names is None:
+            return dict(self._entries)
+        return {name: self._entries[name] for name in names if name in self._entries}
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if a file is in the catalog."""
+        return name in self._entries
+
+    def scan(self) -> CatalogChanges:
+        """Stat the directories and return what changed. Blocking."""
+        found: dict[str, CatalogEntry] = {}
+        archives = {}
+        for directory in self.directories:
+            try:
+                with os.scandir(directory) as it:
+                    for item in it:
+                        is_archive = item.name.endswith(ARCHIVE_SUFFIXES)
+                        if not is_archive and not item.name.endswith(
+                            QUESTION_FILE_SUFFIXES
+                        ):
+                            continue
+                        try:
+                            if not item.is_file():
+                                continue
+                            stat = item.stat()
+                        except OSError:
+                            continue
+                        path = Path(item.path)
+                        if is_archive:
+                            archives[path] = self._archive_entries(
+                                path, stat.st_size, stat.st_mtime
+                            )
+                            found.update(archives[path])
+                            continue
+                        found[quiz_file_name(item.name)] = CatalogEntry(
+                            path, stat.st_size, stat.st_mtime
+                        )
+            except FileNotFoundError:
+                continue
+            except OSError as err:
+                _LOGGER.warning(f"Cannot list question directory {directory}: {err}")
+
+        changes = CatalogChanges()
+        for name, entry in found.items():
+            previous = self._entries.get(name)
+            if previous is None:
+                changes.added.add(name)
+            elif previous != entry:
+                changes.changed.add(name)
+        changes.removed = self._entries.keys() - found.keys()
+        self._entries = found
+        self._archives = {
+            path: self._archives[path] for path in archives if path in self._archives
+        }
+        return changes
+
+    def _archive_entries(
+        self, path: Path, size: int, mtime: float
+    ) -> dict[str, CatalogEntry]:
+        """Return the question files of a zip archive. Blocking."""
+        cached = self._archives.get(path)
+        if cached is not None and cached[:2] == (size, mtime):
+            return cached[2]
+
+        entries = {}
+        try:
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    name = PurePosixPath(info.filename).name
+                    if info.is_dir() or not name.endswith(".json"):
+                        continue
+                    entries[name] = CatalogEntry(
+                        path, info.file_size, mtime, info.filename
+                    )
+        except (OSError, zipfile.BadZipFile) as err:
+            _LOGGER.warning(f"Cannot read question archive {path.name}: {err}")
+        self._archives[path] = (size, mtime, entries)
+        return entries
@@ -5,10 +5,10 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .const import CONF_LOOP_WATCHDOG, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,3 +33,38 @@ class TriviaConfigFlow(config_entries.ConfigFlow):
             return self.async_create_entry(title="Trivia Game", data={})
 
         return self.async_show_form(step_id="user")
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Return the options flow."""
+        return TriviaOptionsFlow(config_entry)
+
+
+class TriviaOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of Trivia Game."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_LOOP_WATCHDOG,
+                        default=self._entry.options.get(CONF_LOOP_WATCHDOG, False),
+                    ): bool,
+                }
+            ),
+        )
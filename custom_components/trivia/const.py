@@ -7,14 +7,87 @@ SERVICE_START_GAME = "start_game"
 SERVICE_STOP_GAME = "stop_game"
 SERVICE_NEXT_QUESTION = "next_question"
 SERVICE_CHECK_ANSWER = "check_answer"
+SERVICE_IMPORT_QUESTIONS = "import_questions"
+SERVICE_REPLAY_GAME = "replay_game"
+SERVICE_EXPORT_JOURNAL = "export_journal"
+SERVICE_HARDEST_QUESTIONS = "hardest_questions"
+SERVICE_SEARCH_QUESTIONS = "search_questions"
+SERVICE_SUBMIT_ANSWERS = "submit_answers"
+SERVICE_START_PROFILE = "start_profile"
+SERVICE_STOP_PROFILE = "stop_profile"
+
+# Extra question directories, relative to the Home Assistant config directory
+USER_QUESTIONS_DIRS = ["trivia/questions"]
+
+# Interval (seconds) between two scans of the question directories
+CATALOG_SCAN_INTERVAL = 30
+
+# Profiling results (.prof and text summary), relative to the config directory
+PROFILE_DIR = "trivia/profiles"
+PROFILE_DEFAULT_DURATION = 60  # seconds
+PROFILE_MAX_DURATION = 600  # seconds
+PROFILE_TOP = 25  # functions and allocation lines in the summary
+
+# Event loop lag watchdog (option), for the diagnostic sensor
+CONF_LOOP_WATCHDOG = "loop_watchdog"
+WATCHDOG_INTERVAL = 1.0  # seconds between two heartbeats
+WATCHDOG_SLOW_STEP = 0.1  # seconds a handler may block the loop
+WATCHDOG_TOP = 5  # worst handlers listed
+
+# Parsed question files kept in memory (LRU), so replays skip decompression
+BANK_CACHE_SIZE = 8
+
+# SQLite question store, in the Home Assistant config directory
+STORE_FILENAME = "trivia_questions.db"
+
+# Built panel assets (hashed and gzipped copies of www/)
+ASSETS_DIR = "trivia/.assets"
+
+# Game event journal, relative to the Home Assistant config directory
+JOURNAL_PATH = "trivia/journal.jsonl"
+JOURNAL_EXPORT_DIR = "trivia/export"
+JOURNAL_FLUSH_DELAY = 2  # seconds events wait in memory before being written
+JOURNAL_FLUSH_SIZE = 256  # buffered events that trigger an immediate write
+JOURNAL_MAX_BYTES = 1_000_000  # size at which the file is rotated
+JOURNAL_BACKUPS = 5  # compacted segments kept
 
 # Default values
 DEFAULT_NUM_QUESTIONS = 10
 DEFAULT_DIFFICULTY = "débutant"
 
+# Adaptive games draw from a pool this many times larger than the game
+ADAPTIVE_POOL_FACTOR = 3
+
+# Delay (seconds) before per-question statistics are saved
+QUESTION_STATS_SAVE_DELAY = 30
+
+# Delay (seconds) used to coalesce listener updates
+UPDATE_DEBOUNCE_DELAY = 0.5
+
+# Delay (seconds) players get to read the answer feedback
+FEEDBACK_DELAY = 7
+
+# Answers accepted in one submit_answers batch
+BATCH_MAX_ANSWERS = 100
+
+# Notification delivery
+NOTIFY_TIMEOUT = 10  # seconds per attempt
+NOTIFY_RETRIES = 2  # extra attempts after the first one
+NOTIFY_RETRY_DELAY = 0.5  # base delay (seconds) for the jittered backoff
+NOTIFY_BREAKER_THRESHOLD = 3  # consecutive failures before skipping a device
+NOTIFY_BREAKER_COOLDOWN = 120  # seconds a failing device is skipped
+
 # Difficulty levels
 DIFFICULTY_BEGINNER = "débutant"
 DIFFICULTY_CONFIRMED = "confirmé"
 DIFFICULTY_EXPERT = "expert"
 
 DIFFICULTIES = [DIFFICULTY_BEGINNER, DIFFICULTY_CONFIRMED, DIFFICULTY_EXPERT]
+
+# Languages shipped in OpenQuizzDB files
+DEFAULT_LANGUAGE = "fr"
+LANGUAGES = ["fr", "en", "es", "it", "de", "nl"]
+
+# Spoken announcements on media players
+TTS_PREFETCH = 2  # questions rendered ahead of the current one
+TTS_CACHE_SIZE = 64  # rendered announcements kept (LRU)
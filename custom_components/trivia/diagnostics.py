@@ -0,0 +1,109 @@
+"""Diagnostics support for Trivia Game."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {"players", "selected_devices", "device_id"}
+
+
+def _anonymize_devices(notify: dict) -> dict:
+    """Replace the notify service names (mobile_app_<name>) with device_N."""
+    devices = notify.get("devices", {})
+    return {
+        **notify,
+        "devices": {
+            f"device_{number}": stats
+            for number, stats in enumerate(devices.values(), start=1)
+        },
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Everything is read from in-memory coordinator state, nothing touches the
+    disk or the network, so collecting it does not block the event loop.
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    now = time.monotonic()
+
+    session = coordinator.session
+    players = {}
+    for player_num, state in sorted(session.players.items()):
+        question = coordinator.get_current_question(player_num)
+        sent_at = state.sent_at
+        advance_due = coordinator.player_advance_due.get(player_num)
+        players[player_num] = {
+            "question_index": state.index,
+            "finished": state.finished,
+            "score": state.score,
+            "rank": session.leaderboard.rank(player_num),
+            "current_question_id": question.id if question else None,
+            "displayed_choices": coordinator.get_displayed_choices(player_num),
+            "waiting_answer_for": (
+                round(now - sent_at, 1) if sent_at is not None else None
+            ),
+            "next_question_in": (
+                round(advance_due - now, 1) if advance_due is not None else None
+            ),
+        }
+
+    return async_redact_data(
+        {
+            "options": {
+                "num_players": coordinator.num_players,
+                "num_questions": coordinator.num_questions,
+                "difficulty": coordinator.difficulty,
+                "question_file": coordinator.question_file,
+                "selected_devices": coordinator.selected_devices,
+            },
+            "game": {
+                "active": coordinator.game_active,
+                "players": coordinator.players,
+                "questions_pool_size": session.total,
+                "seed": coordinator.seed,
+                "recorded_answers": (
+                    len(coordinator.game_record["answers"])
+                    if coordinator.game_record
+                    else 0
+                ),
+                "ranking": session.leaderboard.top(),
+            },
+            "player_states": players,
+            "listener_updates": {
+                "requested": coordinator.update_requests,
+                "coalesced": coordinator.coalesced_updates,
+                "pending": coordinator.update_pending,
+            },
+            "answer_batches": dict(coordinator.answer_batches),
+            # Les noms des services notify contiennent souvent des prénoms
+            "notify": _anonymize_devices(coordinator.notifier.as_dict()),
+            "journal": coordinator.journal.as_dict(),
+            "quiz_file_cache": coordinator.quiz_files.as_dict(),
+            "search_index": coordinator.search_index.as_dict(),
+            "profiler": coordinator.profiler.as_dict(),
+            "loop_watchdog": coordinator.watchdog.as_dict(),
+            "question_stats": {
+                "questions": len(coordinator.question_stats),
+                "buckets": coordinator.question_stats.bucket_sizes(),
+            },
+            "state_stream": coordinator.state_stream.as_dict(),
+            "announcer": (
+                coordinator.announcer.as_dict() if coordinator.announcer else None
+            ),
+            "timings": {
+                name: histogram.as_dict()
+                for name, histogram in coordinator.timings.items()
+            },
+        },
+        TO_REDACT,
+    )
@@ -0,0 +1,146 @@
+"""Per-question answer statistics and difficulty buckets."""
+from __future__ import annotations
+
+from array import array
+
+# Tranches de taux de réussite, 0 = questions les plus difficiles
+BUCKETS = 5
+
+# Réponses nécessaires avant de classer une question dans une tranche
+MIN_ANSWERS = 5
+
+
+def bucket_for_rate(rate: float, buckets: int = BUCKETS) -> int:
+    """Return the bucket of a success rate between 0 and 1."""
+    return min(int(rate * buckets), buckets - 1)
+
+
+def question_key(file: str | None, difficulty: str, qid) -> str:
+    """Return the key identifying a question across games."""
+    return f"{file}:{difficulty}:{qid}"
+
+
+def parse_question_key(key: str) -> tuple[str, str, int | str]:
+    """Split a question key into its file, difficulty and id."""
+    file, difficulty, qid = key.rsplit(":", 2)
+    return file, difficulty, int(qid) if qid.lstrip("-").isdigit() else qid
+
+
+class QuestionStats:
+    """Running correct-answer rate of every question that was answered.
+
+    Counts live in parallel arrays indexed by a slot per question, and each
+    rated question sits in the set of its success-rate bucket. Recording an
+    answer updates two counters and at most moves the question between two
+    sets, so it is O(1) and buckets never need to be rebuilt.
+    """
+
+    def __init__(self, buckets: int = BUCKETS, min_answers: int = MIN_ANSWERS) -> None:
+        """Initialize empty statistics."""
+        self.buckets = buckets
+        self.min_answers = min_answers
+        self._slots: dict[str, int] = {}
+        self._keys: list[str] = []
+        self._asked = array("I")
+        self._correct = array("I")
+        # Tranche de chaque slot, -1 tant que la question n'est pas classée
+        self._bucket = array("b")
+        self._members: list[set[int]] = [set() for _ in range(buckets)]
+
+    def __len__(self) -> int:
+        """Return the number of questions with statistics."""
+        return len(self._keys)
+
+    def record(self, key: str, correct: bool) -> None:
+        """Count one answer to a question."""
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = len(self._keys)
+            self._keys.append(key)
+            self._asked.append(0)
+            self._correct.append(0)
+            self._bucket.append(-1)
+        self._asked[slot] += 1
+        self._correct[slot] += bool(correct)
+
+        if self._asked[slot] < self.min_answers:
+            return
+        bucket = bucket_for_rate(self._correct[slot] / self._asked[slot], self.buckets)
+        previous = self._bucket[slot]
+        if bucket != previous:
+            if previous >= 0:
+                self._members[previous].discard(slot)
+            self._members[bucket].add(slot)
+            self._bucket[slot] = bucket
+
+    def rate(self, key: str) -> float | None:
+        """Return the success rate of a question, or None if never answered."""
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        return self._correct[slot] / self._asked[slot]
+
+    def bucket(self, key: str) -> int | None:
+        """Return the bucket of a question, or None if it is not rated yet."""
+        slot = self._slots.get(key)
+        if slot is None or self._bucket[slot] < 0:
+            return None
+        return self._bucket[slot]
+
+    def hardest(self, count: int = 10) -> list[dict]:
+        """Return the rated questions with the lowest success rate.
+
+        Buckets are read from the hardest one and only the buckets needed to
+        reach count are sorted.
+        """
+        report = []
+        for members in self._members:
+            for slot in sorted(
+                members,
+                key=lambda slot: (
+                    self._correct[slot] / self._asked[slot], -self._asked[slot]
+                ),
+            ):
+                report.append(
+                    {
+                        "question": self._keys[slot],
+                        "answers": self._asked[slot],
+                        "correct": self._correct[slot],
+                        "success_rate": round(
+                            self._correct[slot] / self._asked[slot], 3
+                        ),
+                    }
+                )
+                if len(report) >= count:
+                    return report
+        return report
+
+    def bucket_sizes(self) -> list[int]:
+        """Return the number of questions in each bucket."""
+        return [len(members) for members in self._members]
+
+    def as_data(self) -> dict:
+        """Return the counters in a JSON-friendly form."""
+        return {
+            "keys": self._keys,
+            "asked": self._asked.tolist(),
+            "correct": self._correct.tolist(),
+        }
+
+    @classmethod
+    def from_data(cls, data: dict | None) -> "QuestionStats":
+        """Rebuild statistics saved with as_data."""
+        stats = cls()
+        if not data:
+            return stats
+        for key, asked, correct in zip(data["keys"], data["asked"], data["correct"]):
+            slot = stats._slots[key] = len(stats._keys)
+            stats._keys.append(key)
+            stats._asked.append(asked)
+            stats._correct.append(correct)
+            stats._bucket.append(-1)
+            if asked >= stats.min_answers:
+                bucket = bucket_for_rate(correct / asked, stats.buckets)
+                stats._bucket[slot] = bucket
+                stats._members[bucket].add(slot)
+        return stats
@@ -0,0 +1,399 @@
+"""Game rules of the Trivia Game integration.
+
+This module is plain Python: no Home Assistant import, no I/O and no clock.
+A GameSession receives commands (show, answer, advance, finish) together
+with the current time and returns events; the coordinator turns those
+events into notifications, announcements and entity updates.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+
+from .bank import Question
+from .difficulty import BUCKETS, bucket_for_rate
+from .leaderboard import Leaderboard
+from .matching import AnswerMatcher
+
+# Lettres des 3 choix affichés dans les notifications
+CHOICE_LETTERS = ("A", "B", "C")
+
+
+@dataclass(frozen=True)
+class QuestionShown:
+    """A player was given a question."""
+
+    player: int
+    index: int
+    total: int
+    question: Question
+    language: str
+    choices: dict[str, str]
+
+
+@dataclass(frozen=True)
+class AnswerChecked:
+    """A player's answer was matched to a choice and scored."""
+
+    player: int
+    index: int
+    letter: str
+    answer: str
+    correct_answer: str
+    correct: bool
+    elapsed: float | None
+
+
+@dataclass(frozen=True)
+class AnswerRejected:
+    """An answer of a batch was not scored (position in the batch and reason)."""
+
+    position: int
+    player: int
+    reason: str
+
+
+@dataclass(frozen=True)
+class PlayerFinished:
+    """A player answered the last question."""
+
+    player: int
+
+
+@dataclass(frozen=True)
+class GameFinished:
+    """Every player finished, or the game was stopped."""
+
+    scores: dict[int, int]
+    ranking: list[tuple[int, int, float]]
+
+
+def draw_choice_order(question: Question, rng: random.Random) -> tuple[int, ...]:
+    """Pick 2 wrong answers and shuffle them with the right one."""
+    # Index des mauvaises réponses (textes distincts)
+    wrong_answers = list(
+        {
+            text: index
+            for index, text in enumerate(question.propositions)
+            if text != question.answer
+        }.values()
+    )
+
+    # Sélectionner 2 mauvaises réponses aléatoirement parmi les 3 disponibles
+    # et mélanger pour que la bonne réponse ne soit pas toujours en position A
+    order = [question.answer_index] + rng.sample(wrong_answers, 2)
+    rng.shuffle(order)
+    return tuple(order)
+
+
+class PlayerState:
+    """Progress of one player through the pool."""
+
+    __slots__ = (
+        "index", "finished", "score", "answered", "answer_time", "orders",
+        "sequence", "available", "rng", "choices", "matcher", "sent_at",
+    )
+
+    def __init__(self, orders: list[tuple[int, ...]]) -> None:
+        """Initialize a player at the first question."""
+        self.index = 0
+        self.finished = False
+        self.score = 0
+        self.answered = 0
+        self.answer_time = 0.0
+        # Ordre des choix de chaque question du pool, tiré au démarrage
+        self.orders = orders
+        # Index dans le pool des questions posées, dans l'ordre
+        self.sequence: list[int] = []
+        # Mode adaptatif: index du pool restants par tranche de difficulté,
+        # et générateur propre au joueur (indépendant du rythme des autres)
+        self.available: list[list[int]] | None = None
+        self.rng: random.Random | None = None
+        # Choix affichés (index dans question.propositions), None sans question
+        self.choices: tuple[int, ...] | None = None
+        self.matcher: AnswerMatcher | None = None
+        self.sent_at: float | None = None
+
+
+class GameSession:
+    """One game: a pool of questions and the progress of each player.
+
+    Each player goes through the pool at their own pace. The order of the
+    choices of every question is drawn when the session is created, from
+    the given rng, so a seeded rng makes the whole game reproducible.
+
+    With buckets (the difficulty bucket of every pool question, None when
+    unrated), the session is adaptive: each player gets length questions,
+    each one drawn from the bucket matching the player's running accuracy.
+    """
+
+    def __init__(
+        self,
+        pool: list[dict[str, Question]],
+        num_players: int,
+        language: str,
+        player_languages: list[str | None] | None = None,
+        rng: random.Random | None = None,
+        length: int | None = None,
+        buckets: list[int | None] | None = None,
+    ) -> None:
+        """Create a session and draw the choices of every question."""
+        self.pool = pool
+        self.language = language
+        self.finished = False
+        self.length = len(pool) if length is None else min(length, len(pool))
+        self.adaptive = buckets is not None
+        rng = rng or random.Random()
+        player_languages = player_languages or []
+
+        # Langue de chaque joueur (None = langue de la partie)
+        self.languages = {
+            player: (
+                player_languages[player - 1]
+                if player <= len(player_languages)
+                else None
+            ) or language
+            for player in range(1, num_players + 1)
+        }
+        self.players = {
+            player: PlayerState(
+                [
+                    draw_choice_order(self._translation(player, position)[0], rng)
+                    for position in range(len(pool))
+                ]
+            )
+            for player in range(1, num_players + 1)
+        }
+        for state in self.players.values():
+            if not self.adaptive:
+                state.sequence = list(range(self.length))
+                continue
+            # Questions pas encore classées: tranche du milieu
+            state.available = [[] for _ in range(BUCKETS)]
+            for position, bucket in enumerate(buckets):
+                state.available[BUCKETS // 2 if bucket is None else bucket].append(
+                    position
+                )
+            state.rng = random.Random(rng.getrandbits(64))
+        self.leaderboard = Leaderboard()
+        self.leaderboard.reset(self.players)
+
+    @property
+    def total(self) -> int:
+        """Return the number of questions each player answers."""
+        return self.length
+
+    @property
+    def scores(self) -> dict[int, int]:
+        """Return {player: score}."""
+        return {player: state.score for player, state in self.players.items()}
+
+    def finished_count(self) -> int:
+        """Return the number of players who answered every question."""
+        return sum(state.finished for state in self.players.values())
+
+    def question(self, player: int, index: int) -> tuple[Question, str]:
+        """Return a player's question number index and its language."""
+        return self._translation(player, self.players[player].sequence[index])
+
+    def position(self, player: int, index: int) -> int:
+        """Return the pool position of a player's question number index."""
+        return self.players[player].sequence[index]
+
+    def choice_order(self, player: int, index: int) -> tuple[int, ...]:
+        """Return the order of the choices of a player's question number index."""
+        state = self.players[player]
+        return state.orders[state.sequence[index]]
+
+    def _translation(self, player: int, position: int) -> tuple[Question, str]:
+        """Return a pool question and its language, as shown to a player.
+
+        Players get the game language when their own is missing from the file.
+        """
+        translations = self.pool[position]
+        language = self.languages.get(player, self.language)
+        if language not in translations:
+            language = self.language
+        return translations[language], language
+
+    def current_question(self, player: int) -> Question | None:
+        """Return the question a player is on, or None."""
+        state = self.players.get(player)
+        if self.finished or state is None or state.finished:
+            return None
+        if state.index >= len(state.sequence):
+            return None
+        return self.question(player, state.index)[0]
+
+    def displayed_choices(self, player: int) -> dict[str, str]:
+        """Return the choices shown to a player, as {letter: proposition}."""
+        question = self.current_question(player)
+        state = self.players.get(player)
+        if question is None or state.choices is None:
+            return {}
+        return {
+            letter: question.propositions[index]
+            for letter, index in zip(CHOICE_LETTERS, state.choices)
+        }
+
+    def show(self, player: int, now: float) -> list:
+        """Give a player their current question.
+
+        Returns a QuestionShown, or a PlayerFinished past the last question,
+        followed by a GameFinished once every player is done.
+        """
+        state = self.players[player]
+        if self.finished:
+            return []
+        if state.index >= self.total:
+            state.finished = True
+            events = [PlayerFinished(player)]
+            if all(other.finished for other in self.players.values()):
+                events.append(self.finish())
+            return events
+
+        if state.index == len(state.sequence):
+            state.sequence.append(self._pick(state))
+        question, language = self.question(player, state.index)
+        state.choices = self.choice_order(player, state.index)
+        state.sent_at = now
+        choices = self.displayed_choices(player)
+        state.matcher = AnswerMatcher(choices)
+        return [
+            QuestionShown(player, state.index, self.total, question, language, choices)
+        ]
+
+    def answer(self, player: int, answer: str, now: float) -> AnswerChecked | None:
+        """Score a letter or free-text answer.
+
+        Returns None when the player has no question waiting for an answer
+        or the answer matches none of the choices.
+        """
+        question = self.current_question(player)
+        state = self.players.get(player)
+        if question is None or state.matcher is None:
+            return None
+        letter = state.matcher.match(answer)
+        if letter is None:
+            return None
+        return self._score(player, letter, now)
+
+    def answer_batch(
+        self, answers: list[tuple[int, str, float]]
+    ) -> tuple[list[AnswerChecked], list[AnswerRejected], list[AnswerRejected]]:
+        """Score several (player, answer, time) at once, all or nothing.
+
+        Answers are taken in time order and only the first one of a player
+        counts: later ones, and answers of players with no question waiting,
+        are skipped as in answer(). If an answer names an unknown player or
+        matches none of the choices, the whole batch is rejected and nothing
+        changes. Returns the checked, skipped and rejected answers.
+        """
+        matched = []
+        skipped = []
+        rejected = []
+        seen = set()
+        for position in sorted(range(len(answers)), key=lambda i: answers[i][2]):
+            player, answer, at = answers[position]
+            state = self.players.get(player)
+            if state is None:
+                rejected.append(AnswerRejected(position, player, "unknown_player"))
+                continue
+            if (
+                player in seen
+                or self.current_question(player) is None
+                or state.matcher is None
+            ):
+                skipped.append(AnswerRejected(position, player, "not_waiting"))
+                continue
+            letter = state.matcher.match(answer)
+            if letter is None:
+                rejected.append(AnswerRejected(position, player, "no_match"))
+                continue
+            seen.add(player)
+            matched.append((player, letter, at))
+
+        if rejected:
+            return [], skipped, rejected
+        # Tout est valide: les scores et le classement changent d'un coup
+        return [self._score(*item) for item in matched], skipped, []
+
+    def _score(self, player: int, letter: str, now: float) -> AnswerChecked:
+        """Score the choice letter of a player waiting for an answer."""
+        question = self.current_question(player)
+        state = self.players[player]
+
+        # Les choix sont consommés: une seule réponse par question
+        player_answer = question.propositions[
+            state.choices[CHOICE_LETTERS.index(letter)]
+        ]
+        state.choices = None
+        state.matcher = None
+
+        # Temps de réponse cumulé, utilisé pour départager les égalités
+        elapsed = None
+        if state.sent_at is not None:
+            # Un buzzer horodaté peut précéder de peu l'envoi de la question
+            elapsed = max(now - state.sent_at, 0.0)
+            state.answer_time += elapsed
+            state.sent_at = None
+
+        correct = player_answer == question.answer
+        state.answered += 1
+        if correct:
+            state.score += 1
+        self.leaderboard.update(player, state.score, state.answer_time)
+        return AnswerChecked(
+            player, state.index, letter, player_answer, question.answer,
+            correct, elapsed,
+        )
+
+    def _pick(self, state: PlayerState) -> int:
+        """Draw the next question of an adaptive player in O(1).
+
+        A player answering everything right gets the hardest bucket, one
+        answering nothing right the easiest; the nearest non-empty bucket is
+        used when the target one is exhausted.
+        """
+        accuracy = state.score / state.answered if state.answered else 0.5
+        target = bucket_for_rate(1 - accuracy)
+        for distance in range(BUCKETS):
+            for bucket in (target - distance, target + distance):
+                if 0 <= bucket < BUCKETS and state.available[bucket]:
+                    candidates = state.available[bucket]
+                    # Retrait en O(1): échange avec le dernier élément
+                    slot = state.rng.randrange(len(candidates))
+                    candidates[slot], candidates[-1] = candidates[-1], candidates[slot]
+                    return candidates.pop()
+        raise IndexError("no question left")
+
+    def advance(self, player: int, now: float) -> list:
+        """Move a player to the next question and show it."""
+        if self.finished:
+            return []
+        self.players[player].index += 1
+        return self.show(player, now)
+
+    def finish(self) -> GameFinished:
+        """End the game and return the final scores."""
+        self.finished = True
+        for state in self.players.values():
+            state.choices = None
+            state.matcher = None
+            state.sent_at = None
+        return GameFinished(self.scores, self.leaderboard.top())
+
+    def replay(self, answers) -> GameFinished:
+        """Play recorded (player, answer[, seconds to answer]) with no delay.
+
+        Unmatched answers are ignored, as in a live game. The game is
+        finished at the end if some players did not answer everything.
+        """
+        for player in self.players:
+            self.show(player, 0.0)
+        for player, answer, *elapsed in answers:
+            if self.answer(player, answer, elapsed[0] if elapsed else 0.0):
+                self.advance(player, 0.0)
+        if not self.finished:
+            return self.finish()
+        return GameFinished(self.scores, self.leaderboard.top())
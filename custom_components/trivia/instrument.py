@@ -0,0 +1,104 @@
+"""Temporary instrumentation of handler methods."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import functools
+import inspect
+
+# Gestionnaires du coordinateur (actions, réponses, catalogue, entités)
+COORDINATOR_HANDLERS = (
+    "start_game",
+    "stop_game",
+    "next_question",
+    "check_answer",
+    "submit_answers",
+    "async_replay",
+    "async_refresh_catalog",
+    "async_validate_questions",
+    "import_questions",
+    "export_journal",
+    "_flush_listeners",
+)
+
+
+class _InstrumentedCoroutine:
+    """Drive a coroutine, calling enter and exit around each of its steps.
+
+    A step is the synchronous run of the coroutine between two awaits, so
+    the hooks see the time the coroutine actually holds the event loop, not
+    the time it spends waiting (sleeps, network) or other tasks.
+    """
+
+    def __init__(
+        self, coro, enter: Callable[[], None], exit: Callable[[], None]
+    ) -> None:
+        """Wrap a coroutine."""
+        self._coro = coro
+        self._enter = enter
+        self._exit = exit
+
+    def __await__(self):
+        """Forward every step of the coroutine between the hooks."""
+        coro = self._coro
+        value = None
+        error = None
+        while True:
+            self._enter()
+            try:
+                if error is None:
+                    future = coro.send(value)
+                else:
+                    future = coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._exit()
+            try:
+                value = yield future
+                error = None
+            except BaseException as err:  # noqa: BLE001 - relayé à la coroutine
+                value = None
+                error = err
+
+
+def instrument(
+    owner: object, name: str, enter: Callable[[], None], exit: Callable[[], None]
+) -> None:
+    """Shadow a method of owner with a version calling enter and exit around it.
+
+    The wrapper is an instance attribute: restore() brings back the method
+    it replaced, so nothing is left behind once instrumentation stops.
+    Coroutine methods are hooked around each step.
+    """
+    method = getattr(owner, name)
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            return await _InstrumentedCoroutine(method(*args, **kwargs), enter, exit)
+
+    else:
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            enter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                exit()
+
+    # Un autre instrument (profilage et watchdog) peut déjà être en place
+    wrapper._instrumented_previous = vars(owner).get(name)
+    setattr(owner, name, wrapper)
+
+
+def restore(owner: object, name: str) -> None:
+    """Remove the wrapper installed last by instrument() on a method."""
+    wrapper = vars(owner).get(name)
+    if wrapper is None:
+        return
+    previous = getattr(wrapper, "_instrumented_previous", None)
+    if previous is None:
+        delattr(owner, name)
+    else:
+        setattr(owner, name, previous)
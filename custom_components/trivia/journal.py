@@ -0,0 +1,226 @@
+"""Append-only journal of game events."""
+from __future__ import annotations
+
+import asyncio
+import csv
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    JOURNAL_BACKUPS,
+    JOURNAL_FLUSH_DELAY,
+    JOURNAL_FLUSH_SIZE,
+    JOURNAL_MAX_BYTES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GameJournal:
+    """Game events written as JSON lines by a background writer.
+
+    record() only appends an encoded line to an in-memory buffer. The buffer
+    is written to disk in the executor after JOURNAL_FLUSH_DELAY, or as soon
+    as it holds JOURNAL_FLUSH_SIZE lines. When the file grows past max_bytes
+    it is rotated: the full segment is compacted (gzipped) next to it and
+    only the newest backups are kept.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: Path,
+        max_bytes: int = JOURNAL_MAX_BYTES,
+        backups: int = JOURNAL_BACKUPS,
+    ) -> None:
+        """Initialize the journal."""
+        self.hass = hass
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.written = 0
+        self.rotations = 0
+        self._buffer: list[str] = []
+        self._unsub_flush = None
+        self._lock = asyncio.Lock()
+
+    @callback
+    def record(self, kind: str, **fields) -> None:
+        """Queue an event. Never blocks."""
+        fields["t"] = round(time.time(), 3)
+        fields["e"] = kind
+        self._buffer.append(
+            json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+        )
+        if len(self._buffer) >= JOURNAL_FLUSH_SIZE:
+            self._schedule_flush(0)
+        elif self._unsub_flush is None:
+            self._schedule_flush(JOURNAL_FLUSH_DELAY)
+
+    @callback
+    def _schedule_flush(self, delay: float) -> None:
+        """Flush the buffer after delay seconds."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+        self._unsub_flush = async_call_later(self.hass, delay, self._flush_later)
+
+    @callback
+    def _flush_later(self, _now) -> None:
+        """Start a flush in the background."""
+        self._unsub_flush = None
+        self.hass.async_create_background_task(
+            self.async_flush(), "trivia_journal_flush"
+        )
+
+    async def async_flush(self) -> None:
+        """Write the buffered events."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        # Un seul écrivain à la fois, dans l'ordre des événements
+        async with self._lock:
+            lines, self._buffer = self._buffer, []
+            if not lines:
+                return
+            try:
+                await self.hass.async_add_executor_job(self._write, lines)
+            except OSError as err:
+                _LOGGER.warning(f"Cannot write the game journal: {err}")
+                return
+            self.written += len(lines)
+
+    async def async_export(self, directory: Path) -> tuple[Path, Path]:
+        """Flush, then write the CSV summaries in the executor."""
+        await self.async_flush()
+        async with self._lock:
+            return await self.hass.async_add_executor_job(self.export, directory)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines and rotate the file if needed. Blocking."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            size = f.tell()
+        if size >= self.max_bytes:
+            self._rotate()
+
+    def _segment(self, number: int) -> Path:
+        """Return the path of a compacted segment (1 is the newest)."""
+        return self.path.with_name(f"{self.path.stem}.{number}{self.path.suffix}.gz")
+
+    def _rotate(self) -> None:
+        """Compact the current file into segment 1, shifting older ones. Blocking."""
+        oldest = self._segment(self.backups)
+        if oldest.exists():
+            oldest.unlink()
+        for number in range(self.backups - 1, 0, -1):
+            segment = self._segment(number)
+            if segment.exists():
+                os.replace(segment, self._segment(number + 1))
+
+        compacted = self._segment(1).with_suffix(".tmp")
+        with open(self.path, "rb") as src, gzip.open(compacted, "wb") as dst:
+            dst.writelines(src)
+        os.replace(compacted, self._segment(1))
+        self.path.unlink()
+        self.rotations += 1
+
+    def segments(self) -> list[Path]:
+        """Return the journal files, oldest first. Blocking."""
+        paths = [self._segment(n) for n in range(self.backups, 0, -1)]
+        paths.append(self.path)
+        return [path for path in paths if path.exists()]
+
+    def read(self):
+        """Yield every event, oldest first. Blocking."""
+        for path in self.segments():
+            opener = gzip.open if path.suffix == ".gz" else open
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # Ligne tronquée (arrêt pendant une écriture)
+                        continue
+
+    def export(self, directory: Path) -> tuple[Path, Path]:
+        """Write per-player and per-question CSV summaries. Blocking.
+
+        Returns the paths of the players file and the questions file.
+        """
+        games: dict[str, dict] = {}
+        players: dict[tuple, dict] = {}
+        questions: dict[tuple, dict] = {}
+        for event in self.read():
+            kind = event.get("e")
+            game = event.get("game")
+            if kind == "start":
+                games[game] = event
+            elif kind == "answer":
+                start = games.get(game, {})
+                player = players.setdefault(
+                    (game, event["player"]),
+                    {"answers": 0, "correct": 0, "answer_time": 0.0},
+                )
+                # Partie thématique: fichier et difficulté propres à la réponse
+                question = questions.setdefault(
+                    (
+                        event.get("file", start.get("file")),
+                        event.get("difficulty", start.get("difficulty")),
+                        event.get("qid"),
+                    ),
+                    {"answers": 0, "correct": 0, "answer_time": 0.0},
+                )
+                for row in (player, question):
+                    row["answers"] += 1
+                    row["correct"] += bool(event.get("correct"))
+                    row["answer_time"] += event.get("elapsed") or 0.0
+
+        directory.mkdir(parents=True, exist_ok=True)
+        players_path = directory / "trivia_players.csv"
+        with open(players_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["game", "started", "file", "difficulty", "player",
+                 "answers", "correct", "answer_time", "mean_answer_time"]
+            )
+            for (game, player), row in sorted(players.items()):
+                start = games.get(game, {})
+                writer.writerow(
+                    [game, start.get("t"), start.get("file"), start.get("difficulty"),
+                     player, row["answers"], row["correct"],
+                     round(row["answer_time"], 3),
+                     round(row["answer_time"] / row["answers"], 3)]
+                )
+
+        questions_path = directory / "trivia_questions.csv"
+        with open(questions_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["file", "difficulty", "question_id", "answers", "correct",
+                 "success_rate", "mean_answer_time"]
+            )
+            for (file, difficulty, qid), row in sorted(
+                questions.items(), key=lambda item: tuple(map(str, item[0]))
+            ):
+                writer.writerow(
+                    [file, difficulty, qid, row["answers"], row["correct"],
+                     round(row["correct"] / row["answers"], 3),
+                     round(row["answer_time"] / row["answers"], 3)]
+                )
+        return players_path, questions_path
+
+    def as_dict(self) -> dict:
+        """Return writer statistics for diagnostics."""
+        return {
+            "buffered": len(self._buffer),
+            "written": self.written,
+            "rotations": self.rotations,
+        }
@@ -0,0 +1,86 @@
+"""Incremental leaderboard for the Trivia Game integration."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+
+MEDALS = ["🥇", "🥈", "🥉"]
+
+
+class Leaderboard:
+    """Ranking of players kept sorted as answers come in.
+
+    Entries are ordered by score (descending), then total answer time
+    (ascending), then player number. Each answer moves a single entry with a
+    bisect, so rank lookups are O(log P) and top-k reads only k entries.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty leaderboard."""
+        self._entries: list[tuple[int, float, int]] = []
+        self._keys: dict[int, tuple[int, float, int]] = {}
+        self._message: str | None = None
+        self._message_total: int | None = None
+
+    def reset(self, players) -> None:
+        """Start a new ranking where every player has zero points."""
+        self._keys = {player: (0, 0.0, player) for player in players}
+        self._entries = sorted(self._keys.values())
+        self._message = None
+
+    def __len__(self) -> int:
+        """Return the number of ranked players."""
+        return len(self._entries)
+
+    def update(self, player: int, score: int, answer_time: float) -> None:
+        """Move a player to the position matching its new score and time."""
+        new_key = (-score, answer_time, player)
+        old_key = self._keys.get(player)
+        if old_key == new_key:
+            return
+
+        if old_key is not None:
+            index = bisect_left(self._entries, old_key)
+            del self._entries[index]
+        insort(self._entries, new_key)
+        self._keys[player] = new_key
+        self._message = None
+
+    def score(self, player: int) -> int:
+        """Return the score of a player."""
+        key = self._keys.get(player)
+        return -key[0] if key else 0
+
+    def answer_time(self, player: int) -> float:
+        """Return the total answer time of a player, in seconds."""
+        key = self._keys.get(player)
+        return key[1] if key else 0.0
+
+    def rank(self, player: int) -> int | None:
+        """Return the 1-based position of a player, or None if unknown."""
+        key = self._keys.get(player)
+        if key is None:
+            return None
+        return bisect_left(self._entries, key) + 1
+
+    def top(self, k: int | None = None) -> list[tuple[int, int, float]]:
+        """Return the first k players as (player, score, answer_time)."""
+        entries = self._entries if k is None else self._entries[:k]
+        return [(player, -neg_score, time) for neg_score, time, player in entries]
+
+    def leader(self) -> int | None:
+        """Return the player currently in first place."""
+        return self._entries[0][2] if self._entries else None
+
+    def render(self, total: int) -> str:
+        """Return the ranking message, built once and reused until it changes."""
+        if self._message is None or self._message_total != total:
+            lines = []
+            for position, (player, score, _time) in enumerate(self.top(), start=1):
+                # Médailles pour les 3 premiers, sinon numéro de position
+                position_icon = (
+                    MEDALS[position - 1] if position <= len(MEDALS) else f"{position}."
+                )
+                lines.append(f"{position_icon} Joueur {player}: {score}/{total}")
+            self._message = "\n".join(lines)
+            self._message_total = total
+        return self._message
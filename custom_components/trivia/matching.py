@@ -0,0 +1,125 @@
+"""Free-text answer matching for the Trivia Game integration."""
+from __future__ import annotations
+
+import re
+import unicodedata
+
+# Articles ignorés en tête de proposition ("Un coiffeur" == "coiffeur")
+LEADING_ARTICLES = frozenset(
+    {
+        "un", "une", "le", "la", "les", "l", "des", "du", "de", "d",
+        "the", "an",
+        "el", "los", "las", "il", "lo", "gli", "der", "die", "das", "ein", "eine",
+        "het", "een",
+    }
+)
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    """Return text without accents, case or punctuation, words single-spaced."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(_NON_WORD.sub(" ", stripped.casefold()).split())
+
+
+def strip_articles(normalized: str) -> str:
+    """Return a normalized text without its leading articles."""
+    tokens = normalized.split()
+    while len(tokens) > 1 and tokens[0] in LEADING_ARTICLES:
+        tokens.pop(0)
+    return " ".join(tokens)
+
+
+def _has_digit(text: str) -> bool:
+    """Return True if text contains a digit."""
+    return any(char.isdigit() for char in text)
+
+
+def bounded_distance(a: str, b: str, limit: int) -> int | None:
+    """Return the Levenshtein distance of a and b, or None if above limit.
+
+    Only the rows of the dynamic programming table are kept and the
+    computation stops as soon as every cell of a row exceeds the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    previous = list(range(len(a) + 1))
+    for j, char_b in enumerate(b, start=1):
+        current = [j]
+        for i, char_a in enumerate(a, start=1):
+            current.append(
+                min(
+                    previous[i] + 1,
+                    current[i - 1] + 1,
+                    previous[i - 1] + (char_a != char_b),
+                )
+            )
+        if min(current) > limit:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= limit else None
+
+
+class AnswerMatcher:
+    """Resolve a typed or spoken answer to one of the displayed letters.
+
+    The normalized forms of the propositions are computed once when the
+    question is shown. Matching tries the displayed letters first (buttons
+    and buzzers send them), then an exact dictionary lookup (full text, text
+    without articles) and only then a bounded edit distance. Answers with
+    digits (years, quantities) must match exactly.
+    """
+
+    __slots__ = ("_letters", "_exact", "_forms")
+
+    def __init__(self, choices: dict[str, str]) -> None:
+        """Precompute the lookup tables of {letter: proposition}."""
+        self._letters = {letter.casefold(): letter for letter in choices}
+        self._exact: dict[str, str | None] = {}
+        self._forms: list[tuple[str, str]] = []
+        for letter, text in choices.items():
+            full = normalize(text)
+            short = strip_articles(full)
+            for form in {full, short}:
+                # Une proposition "A" ne masque jamais la lettre A
+                if not form or form in self._letters:
+                    continue
+                # Une forme partagée par deux propositions est ambiguë
+                existing = self._exact.get(form, letter)
+                self._exact[form] = letter if existing == letter else None
+                # Pas de tolérance aux fautes sur les nombres (1789 != 1798)
+                if not _has_digit(form):
+                    self._forms.append((letter, form))
+
+    def match(self, answer: str) -> str | None:
+        """Return the letter matching an answer, or None if unsure."""
+        key = normalize(answer)
+        if not key:
+            return None
+        if key in self._letters:
+            return self._letters[key]
+        if key in self._exact:
+            return self._exact[key]
+        short = strip_articles(key)
+        if short in self._exact:
+            return self._exact[short]
+        if _has_digit(short):
+            return None
+
+        # Tolérance aux fautes: ~1 erreur pour 4 caractères, au moins 1
+        limit = max(1, len(short) // 4)
+        best: str | None = None
+        best_distance = limit + 1
+        for letter, form in self._forms:
+            distance = bounded_distance(short, form, min(limit, best_distance))
+            if distance is None:
+                continue
+            if distance < best_distance:
+                best, best_distance = letter, distance
+            elif distance == best_distance and letter != best:
+                best = None
+        return best
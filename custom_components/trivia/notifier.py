@@ -0,0 +1,175 @@
+"""Resilient notification delivery for the Trivia Game integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import logging
+import random
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    NOTIFY_BREAKER_COOLDOWN,
+    NOTIFY_BREAKER_THRESHOLD,
+    NOTIFY_RETRIES,
+    NOTIFY_RETRY_DELAY,
+    NOTIFY_TIMEOUT,
+)
+from .stats import TimingHistogram
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Skip a device after repeated failures until a cool-down has passed.
+
+    After the cool-down a single trial call is let through (half-open): a
+    success closes the breaker again, a failure re-opens it. Other calls
+    are skipped while the trial runs; a trial that never reports back (a
+    cancelled call) expires after another cool-down.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        """Initialize a closed breaker."""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+        # Début de l'appel d'essai en cours (état half_open)
+        self.trial_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted.
+
+        In half-open state only the first caller gets True, until the trial
+        call records its success or failure.
+        """
+        state = self.state
+        if state != "half_open":
+            return state == "closed"
+        now = time.monotonic()
+        if self.trial_at is not None and now - self.trial_at < self.cooldown:
+            return False
+        self.trial_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.opened_at = None
+        self.trial_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure and open the breaker past the threshold."""
+        self.trial_at = None
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+class Notifier:
+    """Send notify service calls with a timeout, retries and circuit breakers."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        timeout: float = NOTIFY_TIMEOUT,
+        retries: int = NOTIFY_RETRIES,
+        retry_delay: float = NOTIFY_RETRY_DELAY,
+    ) -> None:
+        """Initialize the notifier."""
+        self.hass = hass
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.stats: Counter[str] = Counter()
+        self.device_stats: dict[str, Counter[str]] = {}
+        self.timing = TimingHistogram()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def _breaker(self, service_name: str) -> CircuitBreaker:
+        """Return the breaker of a notify service, creating it if needed."""
+        breaker = self._breakers.get(service_name)
+        if breaker is None:
+            breaker = self._breakers[service_name] = CircuitBreaker(
+                NOTIFY_BREAKER_THRESHOLD, NOTIFY_BREAKER_COOLDOWN
+            )
+        return breaker
+
+    def _count(self, service_name: str, outcome: str) -> None:
+        """Count an outcome globally and for the device."""
+        self.stats[outcome] += 1
+        self.device_stats.setdefault(service_name, Counter())[outcome] += 1
+
+    async def async_send(self, service_name: str, data: dict) -> bool:
+        """Call notify.<service_name> and return True if it succeeded.
+
+        Errors are logged and counted but never raised, so one unreachable
+        phone cannot abort or stall the game for the other players.
+        """
+        breaker = self._breaker(service_name)
+        if not breaker.allow():
+            self._count(service_name, "skipped")
+            _LOGGER.debug(f"Skipping notify.{service_name}: circuit open")
+            return False
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                # Backoff exponentiel avec jitter complet
+                self._count(service_name, "retried")
+                await asyncio.sleep(
+                    random.uniform(0, self.retry_delay * 2 ** (attempt - 1))
+                )
+            try:
+                with self.timing.time():
+                    async with asyncio.timeout(self.timeout):
+                        await self.hass.services.async_call(
+                            "notify", service_name, data, blocking=True
+                        )
+            except TimeoutError:
+                self._count(service_name, "timeout")
+                _LOGGER.warning(
+                    f"notify.{service_name} timed out (attempt {attempt + 1})"
+                )
+            except Exception as err:  # noqa: BLE001
+                self._count(service_name, "error")
+                _LOGGER.warning(
+                    f"notify.{service_name} failed (attempt {attempt + 1}): {err}"
+                )
+            else:
+                breaker.record_success()
+                self._count(service_name, "sent")
+                return True
+
+        breaker.record_failure()
+        self._count(service_name, "failed")
+        if breaker.state == "open":
+            _LOGGER.warning(
+                f"notify.{service_name} keeps failing, skipping it for "
+                f"{breaker.cooldown} seconds"
+            )
+        return False
+
+    def as_dict(self) -> dict:
+        """Return counters and breaker states for diagnostics."""
+        return {
+            "stats": dict(self.stats),
+            "devices": {
+                service_name: {
+                    **dict(counter),
+                    "breaker": self._breakers[service_name].state,
+                }
+                for service_name, counter in self.device_stats.items()
+            },
+            "timing": self.timing.as_dict(),
+        }
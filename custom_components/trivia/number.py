@@ -17,12 +17,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Trivia number entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
-        [
-            TriviaNumPlayersNumber(coordinator, entry),
-            TriviaNumQuestionsNumber(coordinator, entry),
-        ]
-    )
+    numbers = [
+        TriviaNumPlayersNumber(coordinator, entry),
+        TriviaNumQuestionsNumber(coordinator, entry),
+    ]
+    coordinator.watchdog.watch_entities(numbers)
+    async_add_entities(numbers)
 
 
 class TriviaNumPlayersNumber(NumberEntity):
@@ -0,0 +1,196 @@
+"""On-demand profiling of the Trivia coordinator."""
+from __future__ import annotations
+
+import cProfile
+from datetime import datetime
+import io
+import logging
+from pathlib import Path
+import pstats
+import tracemalloc
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .instrument import COORDINATOR_HANDLERS, instrument, restore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Profondeur des traces d'allocation
+TRACEMALLOC_FRAMES = 10
+
+
+class CoordinatorProfiler:
+    """cProfile and tracemalloc over the coordinator handlers, for a bounded time.
+
+    Profiling wraps the handlers of one coordinator (and its notifier) with
+    instrument(), only while it runs: when profiling is off, nothing is
+    wrapped and calls cost nothing extra. The profiler is enabled for each
+    step of a handler, so sleeps and other tasks are not recorded. Results
+    are a .prof file readable by pstats or snakeviz, and a text summary
+    with the slowest functions and the top allocations.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, directory: Path) -> None:
+        """Initialize an idle profiler."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.directory = directory
+        self.runs = 0
+        self.last_files: list[str] = []
+        self._profile: cProfile.Profile | None = None
+        self._depth = 0
+        self._top = 0
+        self._started: datetime | None = None
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._owns_tracemalloc = False
+        self._unsub_stop = None
+        self._wrapped: list[tuple[object, str]] = []
+
+    @property
+    def active(self) -> bool:
+        """Return True while profiling."""
+        return self._profile is not None
+
+    def enter(self) -> None:
+        """Enable the profiler when entering the outermost profiled call."""
+        if self._profile is None:
+            return
+        if self._depth == 0:
+            try:
+                self._profile.enable()
+            except ValueError:
+                # Un autre profileur est actif: ne jamais gêner la partie
+                return
+        self._depth += 1
+
+    def exit(self) -> None:
+        """Disable the profiler when leaving the outermost profiled call."""
+        if self._profile is None or self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            self._profile.disable()
+
+    def _wrap(self, owner: object, name: str) -> None:
+        """Profile a method of owner until profiling stops."""
+        instrument(owner, name, self.enter, self.exit)
+        self._wrapped.append((owner, name))
+
+    async def async_start(self, duration: float, top: int) -> bool:
+        """Start profiling for duration seconds. Returns False if already running."""
+        if self.active:
+            return False
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._owns_tracemalloc = True
+            self._baseline = None
+        else:
+            # Traçage déjà actif: ne garder que la différence
+            self._owns_tracemalloc = False
+            self._baseline = await self.hass.async_add_executor_job(
+                tracemalloc.take_snapshot
+            )
+
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self._top = top
+        self._started = datetime.now()
+        for name in COORDINATOR_HANDLERS:
+            self._wrap(self.coordinator, name)
+        self._wrap(self.coordinator.notifier, "async_send")
+
+        self._unsub_stop = async_call_later(self.hass, duration, self._stop_later)
+        _LOGGER.info(f"Profiling the trivia integration for {duration} seconds")
+        return True
+
+    @callback
+    def _stop_later(self, _now) -> None:
+        """Stop profiling at the end of the requested duration."""
+        self._unsub_stop = None
+        self.hass.async_create_background_task(
+            self.async_stop(), "trivia_profile_stop"
+        )
+
+    async def async_stop(self) -> list[Path]:
+        """Stop profiling and write the results. Returns the written files."""
+        if not self.active:
+            return []
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+
+        for owner, name in self._wrapped:
+            restore(owner, name)
+        self._wrapped = []
+        profile, self._profile = self._profile, None
+        if self._depth:
+            profile.disable()
+        self._depth = 0
+
+        snapshot = await self.hass.async_add_executor_job(tracemalloc.take_snapshot)
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+
+        stem = f"trivia_profile_{self._started:%Y%m%d_%H%M%S}"
+        try:
+            files = await self.hass.async_add_executor_job(
+                self._write, profile, snapshot, self._baseline, stem
+            )
+        except OSError as err:
+            _LOGGER.error(f"Cannot write the profile to {self.directory}: {err}")
+            return []
+        finally:
+            self._baseline = None
+
+        self.runs += 1
+        self.last_files = [str(path) for path in files]
+        _LOGGER.info(f"Trivia profile written to {', '.join(self.last_files)}")
+        return files
+
+    def _write(
+        self,
+        profile: cProfile.Profile,
+        snapshot: tracemalloc.Snapshot,
+        baseline: tracemalloc.Snapshot | None,
+        stem: str,
+    ) -> list[Path]:
+        """Write the .prof file and the text summary. Blocking."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        prof_path = self.directory / f"{stem}.prof"
+        profile.dump_stats(prof_path)
+
+        # Ignorer les allocations de tracemalloc lui-même
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        snapshot = snapshot.filter_traces(filters)
+        if baseline is not None:
+            allocations = snapshot.compare_to(baseline.filter_traces(filters), "lineno")
+        else:
+            allocations = snapshot.statistics("lineno")
+
+        timings = io.StringIO()
+        try:
+            stats = pstats.Stats(profile, stream=timings)
+        except TypeError:
+            # Aucun gestionnaire appelé pendant le profilage
+            timings.write("No profiled call.\n")
+        else:
+            stats.sort_stats("cumulative").print_stats(self._top)
+
+        summary_path = self.directory / f"{stem}.txt"
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(f"Top {self._top} functions by cumulative time\n\n")
+            f.write(timings.getvalue())
+            f.write(f"\nTop {self._top} allocations by line\n\n")
+            for statistic in allocations[: self._top]:
+                f.write(f"{statistic}\n")
+        return [prof_path, summary_path]
+
+    def as_dict(self) -> dict:
+        """Return profiler state for diagnostics."""
+        return {
+            "active": self.active,
+            "runs": self.runs,
+            "last_files": self.last_files,
+        }
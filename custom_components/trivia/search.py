@@ -0,0 +1,227 @@
+"""Full-text search over the question banks."""
+from __future__ import annotations
+
+from bisect import bisect_left
+import json
+import re
+import unicodedata
+from typing import NamedTuple
+
+from .difficulty import question_key
+from .validation import validate_question
+
+# Mots de la recherche; une étoile finale cherche un préfixe (pari*)
+QUERY_RE = re.compile(r"(\w+)(\*?)")
+TOKEN_RE = re.compile(r"\w+")
+
+# Les mots d'une lettre (l', d', à) ne sont pas indexés
+MIN_TOKEN_LENGTH = 2
+
+
+def fold(text: str) -> str:
+    """Return text in lower case without accents ("Élysée" -> "elysee")."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+def tokenize(text: str) -> set[str]:
+    """Return the folded words of a text."""
+    return {
+        token
+        for token in TOKEN_RE.findall(fold(text))
+        if len(token) >= MIN_TOKEN_LENGTH
+    }
+
+
+class SearchDocument(NamedTuple):
+    """Every translation of one question, as indexed."""
+
+    key: str
+    file: str
+    difficulty: str
+    qid: int
+    texts: dict[str, str]
+    tokens: frozenset[str]
+
+
+def _documents(questions) -> list[SearchDocument]:
+    """Merge (file, difficulty, qid, language, question, propositions, anecdote)."""
+    merged: dict[str, tuple[str, str, int, dict[str, str], set[str]]] = {}
+    for file, difficulty, qid, language, text, propositions, anecdote in questions:
+        key = question_key(file, difficulty, qid)
+        document = merged.get(key)
+        if document is None:
+            document = merged[key] = (file, difficulty, qid, {}, set())
+        document[3][language] = text
+        tokens = document[4]
+        tokens |= tokenize(text)
+        for proposition in propositions:
+            tokens |= tokenize(proposition)
+        if anecdote:
+            tokens |= tokenize(anecdote)
+    return [
+        SearchDocument(key, file, difficulty, qid, texts, frozenset(tokens))
+        for key, (file, difficulty, qid, texts, tokens) in merged.items()
+    ]
+
+
+def file_documents(
+    name: str, quizz: dict, exclude=frozenset()
+) -> list[SearchDocument]:
+    """Return the documents of the "quizz" section of an OpenQuizzDB file.
+
+    Questions reported by the validator (exclude) are left out, as in games.
+    Blocking on large files, run it in the executor.
+    """
+
+    def questions():
+        for language, levels in quizz.items():
+            if not isinstance(levels, dict):
+                continue
+            for difficulty, level in levels.items():
+                if not isinstance(level, list):
+                    continue
+                for position, question in enumerate(level):
+                    if validate_question(question) is not None:
+                        continue
+                    qid = question.get("id", position)
+                    if (language, difficulty, qid) in exclude:
+                        continue
+                    yield (
+                        name,
+                        difficulty,
+                        qid,
+                        language,
+                        question["question"],
+                        question["propositions"],
+                        question.get("anecdote") or "",
+                    )
+
+    return _documents(questions())
+
+
+def store_documents(rows) -> list[SearchDocument]:
+    """Return the documents of SQLite store rows.
+
+    rows are (file, difficulty, qid, language, question, propositions as
+    JSON, anecdote). Blocking, run it in the executor.
+    """
+    return _documents(
+        (file, difficulty, qid, language, text, json.loads(propositions), anecdote)
+        for file, difficulty, qid, language, text, propositions, anecdote in rows
+    )
+
+
+class QuestionIndex:
+    """Inverted index of folded words to the questions containing them.
+
+    Each question is one document covering its text, propositions and
+    anecdote in every language. Files are replaced or removed as a whole,
+    so the catalog can update the index file by file as files change. A
+    query is the intersection of the posting sets of its words, smallest
+    first, and never scans the questions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._documents: dict[int, SearchDocument] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._files: dict[str, list[int]] = {}
+        self._next = 0
+        # Vocabulaire trié pour les préfixes, reconstruit après un changement
+        self._vocabulary: list[str] | None = None
+        self.searches = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed questions."""
+        return len(self._documents)
+
+    def files(self) -> set[str]:
+        """Return the names of the indexed files."""
+        return set(self._files)
+
+    def replace_file(self, name: str, documents: list[SearchDocument]) -> None:
+        """Index the documents of a file, replacing its previous ones."""
+        self.remove_file(name)
+        slots = self._files[name] = []
+        for document in documents:
+            slot = self._next
+            self._next += 1
+            self._documents[slot] = document
+            slots.append(slot)
+            for token in document.tokens:
+                self._postings.setdefault(token, set()).add(slot)
+        self._vocabulary = None
+
+    def remove_file(self, name: str) -> None:
+        """Drop the documents of a file."""
+        for slot in self._files.pop(name, ()):
+            document = self._documents.pop(slot)
+            for token in document.tokens:
+                posting = self._postings[token]
+                posting.discard(slot)
+                if not posting:
+                    del self._postings[token]
+        self._vocabulary = None
+
+    def _matches(self, token: str, prefix: bool) -> set[int]:
+        """Return the documents containing a word, or a word starting with it."""
+        if not prefix:
+            return self._postings.get(token, set())
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        slots: set[int] = set()
+        for index in range(bisect_left(vocabulary, token), len(vocabulary)):
+            if not vocabulary[index].startswith(token):
+                break
+            slots |= self._postings[vocabulary[index]]
+        return slots
+
+    def search(
+        self,
+        query: str,
+        language: str | None = None,
+        difficulty: str | None = None,
+        file: str | None = None,
+    ) -> list[SearchDocument]:
+        """Return the questions containing every word of query, sorted by key.
+
+        Words are matched without case or accents; a word ending with * also
+        matches longer words. language, difficulty and file filter the hits.
+        """
+        self.searches += 1
+        terms = [
+            (token, bool(star))
+            for token, star in QUERY_RE.findall(fold(query))
+            if len(token) >= MIN_TOKEN_LENGTH
+        ]
+        if not terms:
+            return []
+        postings = sorted((self._matches(*term) for term in terms), key=len)
+        slots = set(postings[0])
+        for posting in postings[1:]:
+            if not slots:
+                break
+            slots &= posting
+
+        hits = [
+            document
+            for document in map(self._documents.__getitem__, slots)
+            if (language is None or language in document.texts)
+            and (difficulty is None or document.difficulty == difficulty)
+            and (file is None or document.file == file)
+        ]
+        hits.sort(key=lambda document: document.key)
+        return hits
+
+    def as_dict(self) -> dict:
+        """Return index statistics for diagnostics."""
+        return {
+            "files": len(self._files),
+            "questions": len(self._documents),
+            "words": len(self._postings),
+            "searches": self.searches,
+        }
@@ -2,12 +2,12 @@
 import logging
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers import device_registry as dr
 
-from .const import DOMAIN, DIFFICULTIES, DEFAULT_DIFFICULTY
+from .const import DOMAIN, DIFFICULTIES, DEFAULT_DIFFICULTY, LANGUAGES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,18 +26,27 @@ async def async_setup_entry(
         for player_num in range(1, 5)
     ]
 
-    async_add_entities(
-        [
-            TriviaQuestionFileSelect(coordinator, entry),
-            TriviaDifficultySelect(coordinator, entry),
-        ] + player_selects
-    )
+    # Create player language selects (1 to 4)
+    language_selects = [
+        TriviaPlayerLanguageSelect(coordinator, entry, player_num)
+        for player_num in range(1, 5)
+    ]
+
+    selects = [
+        TriviaQuestionFileSelect(coordinator, entry),
+        TriviaDifficultySelect(coordinator, entry),
+        TriviaLanguageSelect(coordinator, entry),
+    ] + player_selects + language_selects
+    coordinator.watchdog.watch_entities(selects)
+    async_add_entities(selects)
 
 
 class TriviaQuestionFileSelect(SelectEntity):
     """Representation of a Select entity for choosing a trivia question file."""
 
     _attr_icon = "mdi:file-question"
+    # Les options suivent le catalogue du coordinator, pas de polling
+    _attr_should_poll = False
 
     def __init__(self, coordinator, entry: ConfigEntry):
         """Initialize the select entity."""
@@ -50,13 +59,8 @@ class TriviaQuestionFileSelect(SelectEntity):
             manufacturer="Custom",
             model="Trivia Game",
         )
-        # Initialize options list first to avoid AttributeError
         self._attr_options = []
-        try:
-            self._update_options()
-        except Exception as e:
-            _LOGGER.error(f"Error loading question files: {e}")
-            self._attr_options = []
+        self._update_options()
 
         # Set initial value from coordinator if available, else first option
         if self._attr_options and self._coordinator.question_file not in self._attr_options:
@@ -64,42 +68,39 @@ class TriviaQuestionFileSelect(SelectEntity):
         elif not self._attr_options:
             _LOGGER.warning("No question files found!")
             self._coordinator.question_file = None
+        self._written_option = self._coordinator.question_file
 
-
-    def _get_files(self) -> list[str]:
-        """Get list of question files."""
-        path = self._coordinator.questions_path
-        if not path or not path.exists():
-            _LOGGER.warning(f"Questions path not found: {path}")
-            return []
-        files = sorted([f.name for f in path.glob("*.json")])
-        _LOGGER.debug(f"Found question files: {files}")
-        return files
-
-    def _update_options(self):
-        """Update the available options."""
-        self._attr_options = self._get_files()
+    def _update_options(self) -> bool:
+        """Update the available options, return True if they changed."""
+        options = self._coordinator.question_files()
+        if options == self._attr_options:
+            return False
+        self._attr_options = options
+        return True
 
     @property
     def current_option(self) -> str | None:
         """Return the selected entity."""
         return self._coordinator.question_file
 
-    @property
-    def options(self) -> list[str]:
-        """Return the available options."""
-        return self._attr_options
-
     async def async_select_option(self, option: str) -> None:
         """Select the option."""
         await self._coordinator.async_set_question_file(option)
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        self._update_options()
-        if self._coordinator.question_file not in self._attr_options:
-            new_option = self._attr_options[0] if self._attr_options else None
-            await self._coordinator.async_set_question_file(new_option)
+    async def async_added_to_hass(self) -> None:
+        """Follow question file changes of the coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state when the file list or the selection changed."""
+        options_changed = self._update_options()
+        if options_changed or self._written_option != self.current_option:
+            self._written_option = self.current_option
+            self.async_write_ha_state()
 
 
 class TriviaDifficultySelect(SelectEntity):
@@ -131,6 +132,62 @@ class TriviaDifficultySelect(SelectEntity):
         await self._coordinator.async_set_difficulty(option)
 
 
+class TriviaLanguageSelect(SelectEntity):
+    """Representation of a Select entity for choosing the game language."""
+
+    _attr_options = LANGUAGES
+    _attr_icon = "mdi:translate"
+
+    def __init__(self, coordinator, entry: ConfigEntry):
+        """Initialize the select entity."""
+        self._coordinator = coordinator
+        self._attr_name = "Trivia Langue"
+        self._attr_unique_id = f"{entry.entry_id}_language"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Trivia Game",
+        )
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the selected language."""
+        return self._coordinator.language
+
+    async def async_select_option(self, option: str) -> None:
+        """Select the option."""
+        await self._coordinator.async_set_language(option)
+
+
+class TriviaPlayerLanguageSelect(SelectEntity):
+    """Representation of a Select entity for choosing a player's language."""
+
+    # "" = même langue que la partie
+    _attr_options = [""] + LANGUAGES
+    _attr_icon = "mdi:translate-variant"
+
+    def __init__(self, coordinator, entry: ConfigEntry, player_num: int):
+        """Initialize the select entity."""
+        self._coordinator = coordinator
+        self._player_num = player_num
+        self._attr_name = f"Trivia Langue Joueur {player_num}"
+        self._attr_unique_id = f"{entry.entry_id}_player{player_num}_language"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Trivia Game",
+        )
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the selected language."""
+        return self._coordinator.player_languages[self._player_num - 1] or ""
+
+    async def async_select_option(self, option: str) -> None:
+        """Select the option."""
+        await self._coordinator.async_set_player_language(
+            self._player_num, option or None
+        )
+
+
 class TriviaPlayerDeviceSelect(SelectEntity):
     """Representation of a Select entity for choosing a player's mobile device."""
 
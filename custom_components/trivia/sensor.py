@@ -1,16 +1,23 @@
 """Sensor platform for Trivia Game."""
+from datetime import timedelta
 import logging
-from pathlib import Path
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Longueur maximale d'un état dans Home Assistant
+MAX_STATE_LENGTH = 255
+
+# Seul le capteur du watchdog est interrogé, les autres sont poussés
+SCAN_INTERVAL = timedelta(seconds=30)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -22,120 +29,267 @@ async def async_setup_entry(
 
     sensors = [
         TriviaGameStateSensor(coordinator, entry),
-        TriviaCurrentQuestionSensor(coordinator, entry),
         TriviaQuestionFileSensor(coordinator, entry),
+        TriviaRankingSensor(coordinator, entry),
     ]
 
-    # Add score sensors for each player
+    # Add score, question and progress sensors for each player
     for i in range(1, 5):
         sensors.append(TriviaPlayerScoreSensor(coordinator, entry, i))
+        sensors.append(TriviaPlayerQuestionSensor(coordinator, entry, i))
+        sensors.append(TriviaPlayerProgressSensor(coordinator, entry, i))
 
+    # Capteur de diagnostic du watchdog, seulement s'il est activé
+    if coordinator.watchdog.enabled:
+        sensors.append(TriviaLoopWatchdogSensor(coordinator, entry))
+
+    coordinator.watchdog.watch_entities(sensors)
     async_add_entities(sensors)
 
 
-class TriviaGameStateSensor(SensorEntity):
+class TriviaCoordinatorSensor(SensorEntity):
+    """Base class for sensors pushed by the game coordinator.
+
+    The value and attributes are recomputed on each coordinator update and
+    the state is only written when one of them actually changed, so the
+    recorder does not store a new row for every unrelated game event.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator):
+        """Initialize the sensor."""
+        self._coordinator = coordinator
+        self._attr_extra_state_attributes = {}
+        self._refresh()
+
+    def _compute(self) -> tuple:
+        """Return the (value, attributes) pair to expose."""
+        raise NotImplementedError
+
+    def _refresh(self) -> bool:
+        """Recompute the state and return True if it changed."""
+        value, attributes = self._compute()
+        if (
+            value == self._attr_native_value
+            and attributes == self._attr_extra_state_attributes
+        ):
+            return False
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attributes
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to coordinator updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the visible value changed."""
+        if self._refresh():
+            self.async_write_ha_state()
+
+
+class TriviaGameStateSensor(TriviaCoordinatorSensor):
     """Sensor for game state."""
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
-        self._coordinator = coordinator
         self._attr_name = "Trivia Game State"
         self._attr_unique_id = f"{entry.entry_id}_game_state"
+        super().__init__(coordinator)
 
-    @property
-    def state(self):
-        """Return the state."""
-        return "playing" if self._coordinator.game_active else "idle"
+    def _compute(self):
+        """Return the game state and its attributes."""
+        coordinator = self._coordinator
+        return (
+            "playing" if coordinator.game_active else "idle",
+            {
+                "total_questions": coordinator.session.total,
+                "num_players": len(coordinator.players),
+                "players_finished": (
+                    coordinator.session.finished_count()
+                    if coordinator.game_active
+                    else 0
+                ),
+                "seed": coordinator.seed,
+            },
+        )
 
-    @property
-    def extra_state_attributes(self):
-        """Return additional attributes."""
-        return {
-            "current_question_index": self._coordinator.current_question_index,
-            "total_questions": len(self._coordinator.questions_pool),
-            "num_players": len(self._coordinator.players),
-        }
 
+class TriviaPlayerQuestionSensor(TriviaCoordinatorSensor):
+    """Sensor for the question currently displayed to a player."""
 
-class TriviaCurrentQuestionSensor(SensorEntity):
-    """Sensor for current question."""
+    _attr_icon = "mdi:help-circle-outline"
+    # Attributs volumineux exclus de la base du recorder
+    _unrecorded_attributes = frozenset(
+        {"propositions", "choices", "correct_answer", "anecdote"}
+    )
 
-    def __init__(self, coordinator, entry):
+    def __init__(self, coordinator, entry, player_num):
         """Initialize the sensor."""
-        self._coordinator = coordinator
-        self._attr_name = "Trivia Current Question"
-        self._attr_unique_id = f"{entry.entry_id}_current_question"
-
-    @property
-    def state(self):
-        """Return the state."""
-        if self._coordinator.current_question:
-            return self._coordinator.current_question.get("question", "")
-        return "No active question"
-
-    @property
-    def extra_state_attributes(self):
-        """Return additional attributes."""
-        if self._coordinator.current_question:
-            return {
-                "propositions": self._coordinator.current_question.get("propositions", []),
-                "correct_answer": self._coordinator.current_question.get("réponse", ""),
-                "anecdote": self._coordinator.current_question.get("anecdote", ""),
-            }
-        return {}
-
-
-class TriviaPlayerScoreSensor(SensorEntity):
+        self._player_num = player_num
+        self._attr_name = f"Trivia Player {player_num} Question"
+        self._attr_unique_id = f"{entry.entry_id}_player{player_num}_question"
+        super().__init__(coordinator)
+
+    def _compute(self):
+        """Return the question text and its details."""
+        question = self._coordinator.get_current_question(self._player_num)
+        if not question:
+            return "No active question", {}
+        return (
+            question.text[:MAX_STATE_LENGTH],
+            {
+                "propositions": list(question.propositions),
+                "choices": self._coordinator.get_displayed_choices(self._player_num),
+                "correct_answer": question.answer,
+                "anecdote": question.anecdote,
+            },
+        )
+
+
+class TriviaPlayerProgressSensor(TriviaCoordinatorSensor):
+    """Sensor for the number of questions a player has answered."""
+
+    _attr_icon = "mdi:progress-question"
+
+    def __init__(self, coordinator, entry, player_num):
+        """Initialize the sensor."""
+        self._player_num = player_num
+        self._attr_name = f"Trivia Player {player_num} Progress"
+        self._attr_unique_id = f"{entry.entry_id}_player{player_num}_progress"
+        super().__init__(coordinator)
+
+    def _compute(self):
+        """Return the answered count and the game length."""
+        coordinator = self._coordinator
+        state = (
+            coordinator.session.players.get(self._player_num)
+            if coordinator.game_active
+            else None
+        )
+        return (
+            state.index if state else 0,
+            {
+                "player_number": self._player_num,
+                "total_questions": coordinator.session.total,
+                "finished": state.finished if state else False,
+            },
+        )
+
+
+class TriviaPlayerScoreSensor(TriviaCoordinatorSensor):
     """Sensor for player score."""
 
     def __init__(self, coordinator, entry, player_num):
         """Initialize the sensor."""
-        self._coordinator = coordinator
         self._player_num = player_num
         self._attr_name = f"Trivia Player {player_num} Score"
         self._attr_unique_id = f"{entry.entry_id}_player{player_num}_score"
+        super().__init__(coordinator)
 
-    @property
-    def state(self):
-        """Return the state."""
-        return self._coordinator.scores.get(self._player_num, 0)
-
-    @property
-    def extra_state_attributes(self):
-        """Return additional attributes."""
+    def _compute(self):
+        """Return the score and the player's device."""
+        coordinator = self._coordinator
         device = (
-            self._coordinator.players[self._player_num - 1]
-            if self._player_num <= len(self._coordinator.players)
+            coordinator.players[self._player_num - 1]
+            if self._player_num <= len(coordinator.players)
             else None
         )
-        return {
-            "player_number": self._player_num,
-            "device": device,
-        }
+        return (
+            coordinator.session.scores.get(self._player_num, 0),
+            {
+                "player_number": self._player_num,
+                "device": device,
+            },
+        )
+
+
+class TriviaRankingSensor(TriviaCoordinatorSensor):
+    """Sensor for the live ranking of the current game."""
 
+    _attr_icon = "mdi:podium"
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        self._attr_name = "Trivia Ranking"
+        self._attr_unique_id = f"{entry.entry_id}_ranking"
+        super().__init__(coordinator)
 
-class TriviaQuestionFileSensor(SensorEntity):
+    def _compute(self):
+        """Return the player in first place and the full ranking."""
+        leaderboard = self._coordinator.session.leaderboard
+        leader = leaderboard.leader()
+        return (
+            f"Joueur {leader}" if leader else "none",
+            {
+                "ranking": [
+                    {
+                        "position": position,
+                        "player": player,
+                        "score": score,
+                        "answer_time": round(answer_time, 1),
+                    }
+                    for position, (player, score, answer_time) in enumerate(
+                        leaderboard.top(), start=1
+                    )
+                ],
+            },
+        )
+
+
+class TriviaQuestionFileSensor(TriviaCoordinatorSensor):
     """Sensor for available question files."""
 
+    _unrecorded_attributes = frozenset({"files", "invalid_questions"})
+
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
-        self._coordinator = coordinator
         self._attr_name = "Trivia Question Files"
         self._attr_unique_id = f"{entry.entry_id}_question_files"
+        super().__init__(coordinator)
+
+    def _compute(self):
+        """Return the number of files, read from the coordinator catalog."""
+        files = self._coordinator.question_files()
+        return (
+            len(files),
+            {
+                "files": files,
+                "invalid_questions": {
+                    name: len(result["problems"]) + len(result["errors"])
+                    for name, result in self._coordinator.validation_results.items()
+                    if result["problems"] or result["errors"]
+                },
+            },
+        )
+
+
+class TriviaLoopWatchdogSensor(SensorEntity):
+    """Diagnostic sensor counting the trivia handlers that blocked the loop.
+
+    It is polled rather than pushed: the watchdog times state writes, so
+    writing on every measurement would feed itself.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-alert-outline"
+    _unrecorded_attributes = frozenset({"worst_handlers", "lag_blamed"})
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        self._watchdog = coordinator.watchdog
+        self._attr_name = "Trivia Slow Handlers"
+        self._attr_unique_id = f"{entry.entry_id}_loop_watchdog"
+        self._attr_native_value = 0
+        self._attr_extra_state_attributes = {}
 
-    @property
-    def state(self):
-        """Return the state."""
-        return len(self._get_question_files())
-
-    @property
-    def extra_state_attributes(self):
-        """Return additional attributes."""
-        return {"files": self._get_question_files()}
-
-    def _get_question_files(self):
-        """Get list of question files."""
-        path = self._coordinator.questions_path
-        if not path or not path.exists():
-            return []
-        return [f.name for f in path.glob("*.json")]
\ No newline at end of file
+    async def async_update(self) -> None:
+        """Read the watchdog counters."""
+        state = self._watchdog.as_dict()
+        self._attr_native_value = state.pop("slow_calls")
+        self._attr_extra_state_attributes = state
@@ -0,0 +1,63 @@
+"""Lightweight runtime statistics for the Trivia Game integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+import time
+
+# Upper bounds (seconds) of the histogram buckets, last bucket is open-ended
+DEFAULT_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class TimingHistogram:
+    """Bucketed durations plus a bounded window of the most recent samples."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, recent: int = 50) -> None:
+        """Initialize the histogram."""
+        self._bounds = tuple(buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._recent: deque[float] = deque(maxlen=recent)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float) -> None:
+        """Add one duration, in seconds."""
+        self._counts[bisect_left(self._bounds, duration)] += 1
+        self._recent.append(duration)
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def time(self) -> "_Timer":
+        """Return a context manager recording the duration of its block."""
+        return _Timer(self)
+
+    def as_dict(self) -> dict:
+        """Return a JSON-friendly summary."""
+        labels = [f"<={bound}s" for bound in self._bounds] + [f">{self._bounds[-1]}s"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else None,
+            "max": round(self.max, 4),
+            "buckets": dict(zip(labels, self._counts)),
+            "recent": [round(value, 4) for value in self._recent],
+        }
+
+
+class _Timer:
+    """Context manager feeding a TimingHistogram."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: TimingHistogram) -> None:
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._histogram.record(time.perf_counter() - self._start)
@@ -0,0 +1,265 @@
+"""SQLite question store for large OpenQuizzDB collections."""
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+import random
+import sqlite3
+import threading
+
+from .bank import READ_ERRORS, Question, quiz_file_name, read_quiz_file
+from .validation import validate_question
+
+_LOGGER = logging.getLogger(__name__)
+
+# Extensions des fichiers OpenQuizzDB acceptés à l'import
+IMPORT_PATTERNS = ("*.json", "*.json.txt", "*.json.gz", "*.json.xz")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    language TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    qid INTEGER,
+    question TEXT NOT NULL,
+    propositions TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    anecdote TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_questions_lookup
+    ON questions (language, difficulty, category, file);
+CREATE INDEX IF NOT EXISTS idx_questions_file ON questions (file);
+CREATE INDEX IF NOT EXISTS idx_questions_translation
+    ON questions (file, difficulty, qid);
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    category TEXT NOT NULL DEFAULT '',
+    questions INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class QuestionStore:
+    """Question store backed by a SQLite database.
+
+    Every method is blocking and must run in the executor. Sampling first
+    reads the matching rowids from the covering index (cached until the next
+    import), then fetches only the selected rows by primary key.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the store, the database is opened lazily."""
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._rowids: dict[tuple, list[int]] = {}
+
+    @property
+    def exists(self) -> bool:
+        """Return True if the database file has been created."""
+        return self.path.exists()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the open connection, creating the schema if needed."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def files(self) -> list[str]:
+        """Return the names of the imported files."""
+        if not self.exists:
+            return []
+        with self._lock:
+            rows = self._connection().execute("SELECT name FROM files ORDER BY name")
+            return [name for (name,) in rows]
+
+    def sample(
+        self,
+        language: str,
+        difficulty: str,
+        count: int,
+        file: str | None = None,
+        category: str | None = None,
+        languages=(),
+        rng: random.Random | None = None,
+    ) -> list[dict[str, Question]]:
+        """Return up to count random questions with their translations.
+
+        Questions are drawn in language; each entry maps that language and
+        any of the extra languages the question exists in to its record.
+        Drawing with a seeded rng returns the same questions every time.
+        """
+        key = (language, difficulty, category, file)
+        with self._lock:
+            conn = self._connection()
+            rowids = self._rowids.get(key)
+            if rowids is None:
+                query = "SELECT id FROM questions WHERE language = ? AND difficulty = ?"
+                params: list = [language, difficulty]
+                if category is not None:
+                    query += " AND category = ?"
+                    params.append(category)
+                if file is not None:
+                    query += " AND file = ?"
+                    params.append(file)
+                query += " ORDER BY id"
+                rowids = self._rowids[key] = [
+                    rowid for (rowid,) in conn.execute(query, params)
+                ]
+
+            chosen = (rng or random).sample(rowids, min(count, len(rowids)))
+            if not chosen:
+                return []
+            placeholders = ",".join("?" * len(chosen))
+            rows = {
+                row[0]: row
+                for row in conn.execute(
+                    "SELECT id, file, qid, question, propositions, answer, anecdote "
+                    f"FROM questions WHERE id IN ({placeholders})",
+                    chosen,
+                )
+            }
+
+            extra = [other for other in languages if other != language]
+            entries = []
+            for rowid in chosen:
+                _rowid, row_file, qid, *fields = rows[rowid]
+                entry = {language: _row_to_question(qid, *fields)}
+                if extra:
+                    # Traductions alignées par (fichier, difficulté, id)
+                    for other, *other_fields in conn.execute(
+                        "SELECT language, question, propositions, answer, anecdote "
+                        "FROM questions WHERE file = ? AND difficulty = ? AND qid = ? "
+                        f"AND language IN ({','.join('?' * len(extra))})",
+                        [row_file, difficulty, qid, *extra],
+                    ):
+                        entry[other] = _row_to_question(qid, *other_fields)
+                entries.append(entry)
+
+        return entries
+
+    def get(
+        self, file: str, difficulty: str, qid: int, languages
+    ) -> dict[str, Question]:
+        """Return the translations of one question in the given languages."""
+        languages = list(languages)
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT language, question, propositions, answer, anecdote "
+                "FROM questions WHERE file = ? AND difficulty = ? AND qid = ? "
+                f"AND language IN ({','.join('?' * len(languages))})",
+                [file, difficulty, qid, *languages],
+            )
+            return {
+                language: _row_to_question(qid, *fields) for language, *fields in rows
+            }
+
+    def search_rows(self) -> list[tuple]:
+        """Return the text of every question, for the search index."""
+        if not self.exists:
+            return []
+        with self._lock:
+            return self._connection().execute(
+                "SELECT file, difficulty, qid, language, question, propositions, "
+                "anecdote FROM questions ORDER BY file, difficulty, qid"
+            ).fetchall()
+
+    def import_directory(self, directory: str | Path) -> dict[str, int]:
+        """Import every OpenQuizzDB file of a directory in one transaction.
+
+        Files already in the store are replaced. Returns the number of
+        questions imported per file.
+        """
+        directory = Path(directory)
+        paths = sorted(
+            {path for pattern in IMPORT_PATTERNS for path in directory.glob(pattern)}
+        )
+        rows: list[tuple] = []
+        files: list[tuple] = []
+        for path in paths:
+            try:
+                file_rows, file_category = _read_file(path)
+            except (*READ_ERRORS, ValueError, TypeError, AttributeError) as err:
+                _LOGGER.warning(f"Skipping {path.name}: {err}")
+                continue
+            rows.extend(file_rows)
+            files.append((quiz_file_name(path.name), file_category, len(file_rows)))
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                names = [(name,) for name, _category, _count in files]
+                conn.executemany("DELETE FROM questions WHERE file = ?", names)
+                conn.executemany(
+                    "INSERT INTO questions (file, language, difficulty, category, "
+                    "qid, question, propositions, answer, anecdote) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO files (name, category, questions) "
+                    "VALUES (?, ?, ?)",
+                    files,
+                )
+            self._rowids.clear()
+
+        _LOGGER.info(f"Imported {len(rows)} questions from {len(files)} files")
+        return {name: count for name, _category, count in files}
+
+
+def _row_to_question(
+    qid: int, question: str, propositions: str, answer: str, anecdote: str
+) -> Question:
+    """Return a store row as a question record."""
+    return Question.from_dict(
+        {
+            "id": qid,
+            "question": question,
+            "propositions": json.loads(propositions),
+            "réponse": answer,
+            "anecdote": anecdote,
+        }
+    )
+
+
+def _read_file(path: Path) -> tuple[list[tuple], str]:
+    """Parse an OpenQuizzDB file into store rows and its category."""
+    data = read_quiz_file(path)
+    name = quiz_file_name(path.name)
+
+    meta = data.get("catégorie-nom-slogan", {})
+    file_category = meta.get("fr", {}).get("catégorie", "")
+    rows = []
+    for language, levels in data["quizz"].items():
+        category = meta.get(language, {}).get("catégorie", file_category)
+        for difficulty, questions in levels.items():
+            for position, question in enumerate(questions):
+                # Les questions injouables ne sont pas importées
+                if validate_question(question) is not None:
+                    continue
+                rows.append(
+                    (
+                        name,
+                        language,
+                        difficulty,
+                        category,
+                        # Même id que QuestionPack et le validateur
+                        question.get("id", position),
+                        question["question"],
+                        json.dumps(question["propositions"], ensure_ascii=False),
+                        question["réponse"],
+                        question.get("anecdote") or "",
+                    )
+                )
+    return rows, file_category
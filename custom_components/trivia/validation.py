@@ -0,0 +1,147 @@
+"""Validation of OpenQuizzDB question files."""
+from __future__ import annotations
+
+from collections import Counter
+import hashlib
+import json
+import logging
+
+from .bank import READ_ERRORS, read_quiz_bytes
+from .catalog import CatalogEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Une question affiche la bonne réponse et 2 mauvaises
+MIN_WRONG_ANSWERS = 2
+
+
+def _is_text(value) -> bool:
+    """Return True for a non-blank string."""
+    return isinstance(value, str) and bool(value.strip())
+
+
+def validate_question(question) -> str | None:
+    """Return why a question cannot be played, or None if it is valid."""
+    if not isinstance(question, dict):
+        return "not an object"
+    if not _is_text(question.get("question")):
+        return "empty question"
+    answer = question.get("réponse")
+    if not _is_text(answer):
+        return "empty answer"
+    propositions = question.get("propositions")
+    if not isinstance(propositions, list):
+        return "propositions is not a list"
+    if not all(_is_text(proposition) for proposition in propositions):
+        return "empty proposition"
+    if answer not in propositions:
+        return "answer not in propositions"
+    if len({p for p in propositions if p != answer}) < MIN_WRONG_ANSWERS:
+        return f"fewer than {MIN_WRONG_ANSWERS} wrong answers"
+    return None
+
+
+def validate_quizz(data) -> tuple[list[str], list[tuple[str, str, int, str]]]:
+    """Validate a parsed file.
+
+    Returns the file-level errors and the (language, difficulty, id, reason)
+    of every question that must not be played.
+    """
+    quizz = data.get("quizz") if isinstance(data, dict) else None
+    if not isinstance(quizz, dict):
+        return ["missing quizz section"], []
+
+    errors = []
+    problems = []
+    for language, levels in quizz.items():
+        if not isinstance(levels, dict):
+            errors.append(f"{language}: levels is not an object")
+            continue
+        for difficulty, questions in levels.items():
+            if not isinstance(questions, list):
+                errors.append(f"{language}/{difficulty}: questions is not a list")
+                continue
+            ids = Counter(
+                question.get("id", position)
+                for position, question in enumerate(questions)
+                if isinstance(question, dict)
+            )
+            for position, question in enumerate(questions):
+                qid = (
+                    question.get("id", position)
+                    if isinstance(question, dict)
+                    else position
+                )
+                reason = validate_question(question)
+                if reason is None and ids[qid] > 1:
+                    reason = "duplicate id"
+                if reason is not None:
+                    problems.append((language, difficulty, qid, reason))
+    return errors, problems
+
+
+def validate_files(
+    entries: dict[str, CatalogEntry], cache: dict
+) -> tuple[dict, list[str]]:
+    """Validate catalog files, reusing cached results of unchanged files.
+
+    A file is skipped when its size and mtime did not change, and is not
+    revalidated either when its content hash is the same. A file that
+    cannot be read is reported with an error instead of keeping its
+    previous result. Compressed files
+    and archive members are hashed once decompressed. Blocking, run it in
+    the executor. Returns the new cache and the names of the files that
+    were actually validated.
+    """
+    results = {}
+    validated = []
+    for name, entry in entries.items():
+        cached = cache.get(name)
+        if (
+            cached
+            and cached["size"] == entry.size
+            and cached["mtime"] == entry.mtime
+        ):
+            results[name] = cached
+            continue
+
+        try:
+            content = read_quiz_bytes(entry.path, entry.member)
+        except READ_ERRORS as err:
+            _LOGGER.warning(f"Cannot read {name}: {err}")
+            # Fichier illisible: invalide, et relu au prochain passage
+            validated.append(name)
+            results[name] = {
+                "hash": None,
+                "size": None,
+                "mtime": None,
+                "errors": [f"unreadable: {err}"],
+                "problems": [],
+            }
+            continue
+        digest = hashlib.sha256(content).hexdigest()
+        if cached and cached["hash"] == digest:
+            results[name] = {**cached, "size": entry.size, "mtime": entry.mtime}
+            continue
+
+        try:
+            errors, problems = validate_quizz(json.loads(content))
+        except ValueError as err:
+            errors, problems = [f"invalid JSON: {err}"], []
+        validated.append(name)
+        results[name] = {
+            "hash": digest,
+            "size": entry.size,
+            "mtime": entry.mtime,
+            "errors": errors,
+            "problems": [list(problem) for problem in problems],
+        }
+    return results, validated
+
+
+def excluded_questions(result: dict) -> set[tuple[str, str, int]]:
+    """Return the (language, difficulty, id) to exclude from a cached result."""
+    return {
+        (language, difficulty, qid)
+        for language, difficulty, qid, _reason in result["problems"]
+    }
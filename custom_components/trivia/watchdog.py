@@ -0,0 +1,194 @@
+"""Event loop lag watchdog for the Trivia handlers."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import WATCHDOG_INTERVAL, WATCHDOG_SLOW_STEP, WATCHDOG_TOP
+from .instrument import COORDINATOR_HANDLERS, instrument, restore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Méthodes d'entité surveillées: écriture de l'état (propriétés), actions
+ENTITY_HANDLERS = (
+    "async_write_ha_state",
+    "async_update",
+    "async_select_option",
+    "async_set_native_value",
+    "async_press",
+)
+
+
+class _HandlerStats:
+    """Time a handler held the event loop, per synchronous step."""
+
+    __slots__ = ("calls", "slow", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.calls = 0
+        self.slow = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class LoopWatchdog:
+    """Measure event loop lag and the trivia handlers that cause it.
+
+    Each watched handler is timed for every synchronous step it runs (the
+    time it blocks the loop, nested handlers excluded), and a heartbeat
+    scheduled every WATCHDOG_INTERVAL measures how late the loop runs it.
+    A late heartbeat is blamed on the trivia handlers that had a slow step
+    since the previous one, or on "other" code. Nothing is wrapped or
+    scheduled unless the watchdog is enabled.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        enabled: bool,
+        threshold: float = WATCHDOG_SLOW_STEP,
+        interval: float = WATCHDOG_INTERVAL,
+    ) -> None:
+        """Initialize the watchdog."""
+        self.hass = hass
+        self.enabled = enabled
+        self.threshold = threshold
+        self.interval = interval
+        self.handlers: dict[str, _HandlerStats] = {}
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self.lag_events = 0
+        self.lag_blamed: dict[str, int] = {}
+        # Pile des appels en cours: [label, début, temps des appels imbriqués]
+        self._stack: list[list] = []
+        # Gestionnaires lents depuis le dernier battement
+        self._slow_since_beat: set[str] = set()
+        self._wrapped: list[tuple[object, str]] = []
+        self._expected = 0.0
+        self._beat: asyncio.TimerHandle | None = None
+
+    def watch(self, owner: object, name: str, label: str) -> None:
+        """Time a method of owner under label."""
+        if not self.enabled:
+            return
+        self.handlers.setdefault(label, _HandlerStats())
+        instrument(owner, name, lambda: self._enter(label), self._exit)
+        self._wrapped.append((owner, name))
+
+    def watch_coordinator(self, coordinator) -> None:
+        """Time the game actions of the coordinator and its notifications."""
+        for name in COORDINATOR_HANDLERS:
+            self.watch(coordinator, name, f"coordinator.{name}")
+        self.watch(coordinator.notifier, "async_send", "notify")
+
+    def watch_entities(self, entities) -> None:
+        """Time the state writes and actions of entities, per entity class."""
+        for entity in entities:
+            for name in ENTITY_HANDLERS:
+                if hasattr(entity, name):
+                    self.watch(entity, name, f"{type(entity).__name__}.{name}")
+
+    def _enter(self, label: str) -> None:
+        """Start timing a step of a handler."""
+        self._stack.append([label, time.perf_counter(), 0.0])
+
+    def _exit(self) -> None:
+        """Stop timing a step and record the time spent outside nested handlers."""
+        label, start, nested = self._stack.pop()
+        duration = time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][2] += duration
+        own = duration - nested
+
+        stats = self.handlers[label]
+        stats.calls += 1
+        stats.total += own
+        worse = own > stats.max
+        if worse:
+            stats.max = own
+        if own < self.threshold:
+            return
+        stats.slow += 1
+        self._slow_since_beat.add(label)
+        # Un avertissement par nouveau record, pas à chaque appel lent
+        if worse:
+            _LOGGER.warning(f"{label} blocked the event loop for {own * 1000:.0f} ms")
+
+    @callback
+    def async_start(self) -> None:
+        """Start the heartbeat."""
+        if not self.enabled or self._beat is not None:
+            return
+        self._schedule()
+
+    @callback
+    def _schedule(self) -> None:
+        """Schedule the next heartbeat."""
+        loop = self.hass.loop
+        self._expected = loop.time() + self.interval
+        self._beat = loop.call_at(self._expected, self._heartbeat)
+
+    @callback
+    def _heartbeat(self) -> None:
+        """Measure how late the loop ran this heartbeat."""
+        now = self.hass.loop.time()
+        lag = max(now - self._expected, 0.0)
+        self.lag_last = lag
+        if lag > self.lag_max:
+            self.lag_max = lag
+        if lag >= self.threshold:
+            self.lag_events += 1
+            for culprit in self._slow_since_beat or ("other",):
+                self.lag_blamed[culprit] = self.lag_blamed.get(culprit, 0) + 1
+        self._slow_since_beat.clear()
+        self._schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the heartbeat and remove every wrapper."""
+        if self._beat is not None:
+            self._beat.cancel()
+            self._beat = None
+        for owner, name in self._wrapped:
+            restore(owner, name)
+        self._wrapped = []
+
+    @property
+    def slow_calls(self) -> int:
+        """Return the number of slow handler steps."""
+        return sum(stats.slow for stats in self.handlers.values())
+
+    def worst(self, count: int = WATCHDOG_TOP) -> list[dict]:
+        """Return the handlers with the longest step, worst first."""
+        ranked = sorted(
+            (item for item in self.handlers.items() if item[1].calls),
+            key=lambda item: item[1].max,
+            reverse=True,
+        )
+        return [
+            {
+                "handler": label,
+                "calls": stats.calls,
+                "slow": stats.slow,
+                "max_ms": round(stats.max * 1000, 1),
+                "mean_ms": round(stats.total / stats.calls * 1000, 2),
+            }
+            for label, stats in ranked[:count]
+        ]
+
+    def as_dict(self) -> dict:
+        """Return the watchdog state for diagnostics and the sensor."""
+        return {
+            "enabled": self.enabled,
+            "slow_threshold_ms": round(self.threshold * 1000),
+            "slow_calls": self.slow_calls,
+            "loop_lag_ms": round(self.lag_last * 1000, 1),
+            "max_loop_lag_ms": round(self.lag_max * 1000, 1),
+            "lag_events": self.lag_events,
+            "lag_blamed": dict(self.lag_blamed),
+            "worst_handlers": self.worst(),
+        }
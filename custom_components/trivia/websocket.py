@@ -0,0 +1,228 @@
+"""Websocket API streaming the game state to the panel and taking answers."""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_dumps
+
+from .const import BATCH_MAX_ANSWERS, DOMAIN
+
+# Flux par entrée, gardés d'un rechargement à l'autre (hass.data)
+DATA_STREAMS = f"{DOMAIN}_streams"
+
+# Lot de réponses (boîtiers de buzzers): joueur, choix, heure Unix de l'appui
+ANSWERS_SCHEMA = vol.All(
+    [
+        vol.Schema(
+            {
+                vol.Required("player"): vol.Coerce(int),
+                vol.Required("choice"): vol.Coerce(str),
+                vol.Optional("timestamp"): vol.Coerce(float),
+            }
+        )
+    ],
+    vol.Length(min=1, max=BATCH_MAX_ANSWERS),
+)
+
+
+class GameStateStream:
+    """Send game state diffs to websocket subscribers.
+
+    Changes requested during one event loop iteration are merged: the
+    snapshot is computed and diffed once per tick, and the diff is encoded
+    once for every subscriber.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator) -> None:
+        """Initialize the stream."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._subscribers: dict[int, Callable[[str], None]] = {}
+        self._last: dict | None = None
+        self._scheduled = False
+        self.sent = 0
+
+    def snapshot(self) -> dict:
+        """Return the state shown by a scoreboard."""
+        coordinator = self.coordinator
+        session = coordinator.session
+        active = coordinator.game_active
+        players = {}
+        for player, state in session.players.items():
+            question = coordinator.get_current_question(player)
+            players[str(player)] = {
+                "score": state.score,
+                "index": state.index if active else 0,
+                "finished": state.finished if active else False,
+                "question": question.text if question else None,
+            }
+        return {
+            "phase": "playing" if active else "idle",
+            "total": session.total,
+            "players": players,
+            "ranking": [player for player, _score, _time in session.leaderboard.top()],
+        }
+
+    @callback
+    def async_subscribe(self, msg_id: int, send: Callable[[str], None]) -> Callable:
+        """Add a subscriber and return the function removing it."""
+        if not self._subscribers:
+            # Rien n'a été suivi sans abonné: repartir d'un instantané
+            self._last = None
+        self._subscribers[msg_id] = send
+
+        @callback
+        def unsubscribe() -> None:
+            self._subscribers.pop(msg_id, None)
+
+        return unsubscribe
+
+    @callback
+    def async_rebind(self, coordinator) -> None:
+        """Follow a new coordinator and send subscribers a full snapshot."""
+        self.coordinator = coordinator
+        self._last = None
+        self.async_changed()
+
+    @callback
+    def async_changed(self) -> None:
+        """Schedule a diff at the end of the current loop iteration."""
+        if self._scheduled or not self._subscribers:
+            return
+        self._scheduled = True
+        self.hass.loop.call_soon(self._flush)
+
+    @callback
+    def _flush(self) -> None:
+        """Compute the diff since the last flush and send it to everyone."""
+        self._scheduled = False
+        current = self.snapshot()
+        previous, self._last = self._last, current
+        if previous is None or previous["players"].keys() != current["players"].keys():
+            # Nouvelle partie: les clients repartent d'un instantané complet
+            payload = {"snapshot": current}
+        else:
+            diff = {
+                key: value
+                for key, value in current.items()
+                if key != "players" and value != previous[key]
+            }
+            players = {}
+            for player, state in current["players"].items():
+                before = previous["players"][player]
+                changed = {
+                    key: value for key, value in state.items() if value != before[key]
+                }
+                if changed:
+                    players[player] = changed
+            if players:
+                diff["players"] = players
+            if not diff:
+                return
+            payload = {"diff": diff}
+
+        # Encodé une seule fois pour tous les abonnés
+        event = json_dumps(payload)
+        for msg_id, send in list(self._subscribers.items()):
+            send(f'{{"id":{msg_id},"type":"event","event":{event}}}')
+        self.sent += 1
+
+    def as_dict(self) -> dict:
+        """Return stream statistics for diagnostics."""
+        return {"subscribers": len(self._subscribers), "sent": self.sent}
+
+
+@callback
+def async_get_stream(
+    hass: HomeAssistant, entry_id: str, coordinator
+) -> GameStateStream:
+    """Return the stream of an entry, bound to its current coordinator.
+
+    The stream outlives the coordinator: after a reload (options change),
+    open panels stay subscribed and get a snapshot of the new coordinator.
+    """
+    streams = hass.data.setdefault(DATA_STREAMS, {})
+    stream = streams.get(entry_id)
+    if stream is None:
+        stream = streams[entry_id] = GameStateStream(hass, coordinator)
+    else:
+        stream.async_rebind(coordinator)
+    return stream
+
+
+@callback
+def async_remove_stream(hass: HomeAssistant, entry_id: str) -> None:
+    """Forget the stream of a removed entry."""
+    hass.data.get(DATA_STREAMS, {}).pop(entry_id, None)
+
+
+@callback
+def async_register_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    websocket_api.async_register_command(hass, websocket_submit_answers)
+
+
+def _coordinator(hass: HomeAssistant, msg: dict):
+    """Return the coordinator of msg["entry_id"], or the first one."""
+    coordinators = hass.data.get(DOMAIN, {})
+    return coordinators.get(msg.get("entry_id")) or next(
+        iter(coordinators.values()), None
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Send a snapshot of the game, then a diff on every change."""
+    coordinator = _coordinator(hass, msg)
+    if coordinator is None:
+        connection.send_error(msg["id"], "not_found", "Trivia is not set up")
+        return
+
+    stream = coordinator.state_stream
+    msg_id = msg["id"]
+    connection.subscriptions[msg_id] = stream.async_subscribe(
+        msg_id, connection.send_message
+    )
+    connection.send_result(msg_id)
+    connection.send_message(
+        websocket_api.event_message(msg_id, {"snapshot": stream.snapshot()})
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/submit_answers",
+        vol.Optional("entry_id"): str,
+        vol.Required("answers"): ANSWERS_SCHEMA,
+    }
+)
+@websocket_api.async_response
+async def websocket_submit_answers(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Score a batch of answers and return the accepted and rejected ones."""
+    coordinator = _coordinator(hass, msg)
+    if coordinator is None:
+        connection.send_error(msg["id"], "not_found", "Trivia is not set up")
+        return
+
+    try:
+        result = await coordinator.submit_answers(msg["answers"])
+    except HomeAssistantError as err:
+        connection.send_error(msg["id"], "not_playing", str(err))
+        return
+    connection.send_result(msg["id"], result)
@@ -0,0 +1,21 @@
+"""Shared test setup.
+
+The game rules, answer matching, leaderboard, search and question bank
+modules are plain Python. When Home Assistant is not installed, the
+integration package is registered without running its setup module so
+those modules can still be imported and tested.
+"""
+import importlib.util
+from pathlib import Path
+import sys
+import types
+
+ROOT = Path(__file__).resolve().parents[1]
+INTEGRATION = ROOT / "custom_components" / "trivia"
+
+sys.path.insert(0, str(ROOT))
+
+if importlib.util.find_spec("homeassistant") is None:
+    package = types.ModuleType("custom_components.trivia")
+    package.__path__ = [str(INTEGRATION)]
+    sys.modules["custom_components.trivia"] = package
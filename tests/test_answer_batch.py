@@ -0,0 +1,79 @@
+"""Tests for batched answers."""
+import random
+
+from custom_components.trivia.bank import Question
+from custom_components.trivia.game import GameSession
+
+
+def make_pool(count=3):
+    return [
+        {
+            "fr": Question(
+                qid,
+                f"Question {qid} ?",
+                (f"Bonne {qid}", f"Fausse {qid}a", f"Fausse {qid}b", f"Fausse {qid}c"),
+                0,
+                "",
+            )
+        }
+        for qid in range(1, count + 1)
+    ]
+
+
+def make_session(players=3, count=3, seed=1):
+    session = GameSession(make_pool(count), players, "fr", rng=random.Random(seed))
+    for player in session.players:
+        session.show(player, 10.0)
+    return session
+
+
+def letter_of(session, player, correct=True):
+    """Return the displayed letter of the right (or a wrong) answer."""
+    question = session.current_question(player)
+    for letter, text in session.displayed_choices(player).items():
+        if (text == question.answer) == correct:
+            return letter
+    raise AssertionError("no such choice")
+
+
+def test_answer_batch_applies_everything_in_press_order():
+    session = make_session()
+    right_2 = letter_of(session, 2)
+    wrong_1 = letter_of(session, 1, correct=False)
+    checked, skipped, rejected = session.answer_batch(
+        [(2, right_2, 12.5), (1, wrong_1, 12.0), (1, right_2, 11.5), (3, "A", 9.0)]
+    )
+    assert rejected == []
+    # Seul le premier appui du joueur 1 compte (11.5), le second est ignoré
+    assert [result.player for result in checked] == [3, 1, 2]
+    assert [(item.position, item.player, item.reason) for item in skipped] == [
+        (1, 1, "not_waiting")
+    ]
+    assert checked[0].elapsed == 0.0  # appui horodaté avant l'envoi
+    assert checked[2].correct
+    assert session.scores[2] == 1
+
+
+def test_answer_batch_is_all_or_nothing():
+    session = make_session()
+    before = session.displayed_choices(1)
+    checked, _skipped, rejected = session.answer_batch(
+        [(1, "A", 11.0), (9, "A", 11.0), (2, "pas une réponse", 11.0)]
+    )
+    assert checked == []
+    assert {(item.player, item.reason) for item in rejected} == {
+        (9, "unknown_player"),
+        (2, "no_match"),
+    }
+    # Rien n'a changé: le joueur 1 peut encore répondre
+    assert session.displayed_choices(1) == before
+    assert session.scores == {1: 0, 2: 0, 3: 0}
+
+
+def test_answer_batch_skips_players_without_question():
+    session = make_session()
+    session.answer(1, "A", 11.0)
+    checked, skipped, rejected = session.answer_batch([(1, "B", 12.0), (2, "A", 12.0)])
+    assert [result.player for result in checked] == [2]
+    assert [item.player for item in skipped] == [1]
+    assert rejected == []
@@ -0,0 +1,52 @@
+"""Tests for the question records and packs."""
+from custom_components.trivia.bank import Question, QuestionPack
+
+
+def question(text, answer="Oui", **extra):
+    return {
+        "question": text,
+        "propositions": ["Oui", "Non", "Peut-être", "Jamais"],
+        "réponse": answer,
+        **extra,
+    }
+
+
+def test_from_dict():
+    record = Question.from_dict(question("Q ?", answer="Non", id=4, anecdote="A."))
+    assert record == Question(4, "Q ?", ("Oui", "Non", "Peut-être", "Jamais"), 1, "A.")
+    assert record.answer == "Non"
+
+
+def test_pack_aligns_languages_by_id():
+    pack = QuestionPack(
+        "a.json",
+        {
+            "fr": {"débutant": [question("Un ?", id=1), question("Deux ?", id=2)]},
+            "en": {"débutant": [question("Two?", id=2)]},
+        },
+    )
+    assert pack.ids("débutant", "fr") == [1, 2]
+    assert pack.ids("débutant", "en") == [2]
+    records = pack.records("débutant", 2, {"fr", "en"})
+    assert {language: record.text for language, record in records.items()} == {
+        "fr": "Deux ?",
+        "en": "Two?",
+    }
+
+
+def test_questions_without_id_use_their_position():
+    pack = QuestionPack(
+        "a.json", {"fr": {"débutant": [question("Zéro ?"), question("Un ?")]}}
+    )
+    assert pack.ids("débutant", "fr") == [0, 1]
+    assert pack.records("débutant", 1, {"fr"})["fr"].id == 1
+
+
+def test_excluded_translations_are_left_out():
+    pack = QuestionPack(
+        "a.json",
+        {"fr": {"débutant": [question("Un ?", id=1)]}, "en": {"débutant": [question("One?", id=1)]}},
+        exclude={("en", "débutant", 1)},
+    )
+    assert pack.ids("débutant", "en") == []
+    assert list(pack.records("débutant", 1, {"fr", "en"})) == ["fr"]
@@ -0,0 +1,94 @@
+"""Tests for the question file catalog."""
+import gzip
+import lzma
+import os
+import zipfile
+
+from custom_components.trivia.catalog import CatalogEntry, QuestionCatalog
+
+CONTENT = b'{"quizz": {}}'
+
+
+def test_question_files_are_listed_under_their_json_name(tmp_path):
+    (tmp_path / "a.json").write_bytes(CONTENT)
+    (tmp_path / "b.json.gz").write_bytes(gzip.compress(CONTENT))
+    (tmp_path / "c.json.xz").write_bytes(lzma.compress(CONTENT))
+    (tmp_path / "notes.txt").write_text("pas un quiz")
+    (tmp_path / "d.json").mkdir()
+
+    catalog = QuestionCatalog([tmp_path])
+    changes = catalog.scan()
+    assert changes.added == {"a.json", "b.json", "c.json"}
+    assert catalog.names() == ["a.json", "b.json", "c.json"]
+    assert catalog.entry("b.json").path == tmp_path / "b.json.gz"
+    assert "c.json" in catalog
+    assert catalog.entry("notes.txt") is None
+    assert catalog.entries(["a.json", "absent.json"]).keys() == {"a.json"}
+
+
+def test_zip_members_are_listed_by_basename(tmp_path):
+    with zipfile.ZipFile(tmp_path / "pack.zip", "w") as archive:
+        archive.writestr("quiz/e.json", CONTENT)
+        archive.writestr("quiz/lisez-moi.txt", "texte")
+
+    catalog = QuestionCatalog([tmp_path])
+    catalog.scan()
+    entry = catalog.entry("e.json")
+    assert catalog.names() == ["e.json"]
+    assert entry == CatalogEntry(
+        tmp_path / "pack.zip",
+        len(CONTENT),
+        (tmp_path / "pack.zip").stat().st_mtime,
+        "quiz/e.json",
+    )
+
+
+def test_later_directories_override_earlier_ones(tmp_path):
+    bundled = tmp_path / "bundled"
+    user = tmp_path / "user"
+    bundled.mkdir()
+    user.mkdir()
+    (bundled / "a.json").write_bytes(CONTENT)
+    (user / "a.json.gz").write_bytes(gzip.compress(CONTENT))
+
+    catalog = QuestionCatalog([bundled, user, tmp_path / "absent"])
+    catalog.scan()
+    assert catalog.entry("a.json").path == user / "a.json.gz"
+
+
+def test_scan_reports_only_changes(tmp_path):
+    (tmp_path / "a.json").write_bytes(CONTENT)
+    (tmp_path / "b.json").write_bytes(CONTENT)
+    catalog = QuestionCatalog([tmp_path])
+    catalog.scan()
+    assert not catalog.scan()
+
+    (tmp_path / "a.json").write_bytes(CONTENT + b" ")
+    (tmp_path / "b.json").unlink()
+    (tmp_path / "c.json").write_bytes(CONTENT)
+    changes = catalog.scan()
+    assert changes.added == {"c.json"}
+    assert changes.changed == {"a.json"}
+    assert changes.removed == {"b.json"}
+
+
+def test_changed_archive_is_read_again(tmp_path):
+    path = tmp_path / "pack.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("e.json", CONTENT)
+    catalog = QuestionCatalog([tmp_path])
+    catalog.scan()
+
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("f.json", CONTENT)
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    changes = catalog.scan()
+    assert changes.added == {"f.json"}
+    assert changes.removed == {"e.json"}
+
+
+def test_missing_directory_is_ignored(tmp_path):
+    catalog = QuestionCatalog([tmp_path / "absent"])
+    assert not catalog.scan()
+    assert catalog.names() == []
@@ -0,0 +1,98 @@
+"""Tests for the per-question statistics."""
+from custom_components.trivia.difficulty import (
+    QuestionStats,
+    bucket_for_rate,
+    parse_question_key,
+    question_key,
+)
+
+
+def answer(stats, key, correct, wrong):
+    for _ in range(correct):
+        stats.record(key, True)
+    for _ in range(wrong):
+        stats.record(key, False)
+
+
+def test_bucket_for_rate():
+    assert bucket_for_rate(0.0) == 0
+    assert bucket_for_rate(0.39) == 1
+    assert bucket_for_rate(1.0) == 4
+
+
+def test_question_key_round_trip():
+    assert parse_question_key(question_key("a.json", "expert", 12)) == (
+        "a.json",
+        "expert",
+        12,
+    )
+    assert parse_question_key(question_key(None, "débutant", "x")) == (
+        "None",
+        "débutant",
+        "x",
+    )
+
+
+def test_questions_are_rated_after_enough_answers():
+    stats = QuestionStats()
+    answer(stats, "q", 2, 2)
+    assert stats.rate("q") == 0.5
+    assert stats.bucket("q") is None
+    assert stats.bucket_sizes() == [0, 0, 0, 0, 0]
+
+    stats.record("q", True)
+    assert stats.bucket("q") == 3
+    assert stats.bucket_sizes() == [0, 0, 0, 1, 0]
+    assert stats.rate("inconnue") is None
+
+
+def test_questions_move_between_buckets():
+    stats = QuestionStats()
+    answer(stats, "q", 5, 0)
+    assert stats.bucket("q") == 4
+    answer(stats, "q", 0, 15)
+    assert stats.bucket("q") == 1
+    assert stats.bucket_sizes() == [0, 1, 0, 0, 0]
+
+
+def test_hardest_questions_first():
+    stats = QuestionStats()
+    answer(stats, "facile", 5, 0)
+    answer(stats, "dure", 0, 5)
+    answer(stats, "moyenne", 3, 2)
+    # Même taux, la question la plus posée passe devant
+    answer(stats, "dure-souvent", 0, 8)
+    answer(stats, "pas-classée", 0, 1)
+
+    assert [entry["question"] for entry in stats.hardest()] == [
+        "dure-souvent",
+        "dure",
+        "moyenne",
+        "facile",
+    ]
+    assert stats.hardest(1) == [
+        {"question": "dure-souvent", "answers": 8, "correct": 0, "success_rate": 0.0}
+    ]
+
+
+def test_from_data_restores_counters_and_buckets():
+    stats = QuestionStats()
+    answer(stats, "a", 1, 4)
+    answer(stats, "b", 4, 1)
+    answer(stats, "c", 1, 0)
+
+    restored = QuestionStats.from_data(stats.as_data())
+    assert len(restored) == 3
+    assert restored.as_data() == stats.as_data()
+    assert restored.bucket_sizes() == stats.bucket_sizes()
+    assert restored.hardest() == stats.hardest()
+    assert restored.bucket("c") is None
+
+    # Les réponses suivantes déplacent la question depuis sa tranche restaurée
+    answer(restored, "b", 0, 5)
+    assert restored.bucket("b") == 2
+    assert restored.bucket_sizes() == [0, 1, 1, 0, 0]
+
+
+def test_from_data_without_saved_stats():
+    assert len(QuestionStats.from_data(None)) == 0
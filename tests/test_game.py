@@ -0,0 +1,108 @@
+"""Tests for the game session rules."""
+import random
+
+from custom_components.trivia.bank import Question
+from custom_components.trivia.game import (
+    GameFinished,
+    GameSession,
+    PlayerFinished,
+    QuestionShown,
+)
+
+
+def make_pool(count=3):
+    return [
+        {
+            "fr": Question(
+                qid,
+                f"Question {qid} ?",
+                (f"Bonne {qid}", f"Fausse {qid}a", f"Fausse {qid}b", f"Fausse {qid}c"),
+                0,
+                "",
+            )
+        }
+        for qid in range(1, count + 1)
+    ]
+
+
+def make_session(players=3, count=3, seed=1):
+    session = GameSession(make_pool(count), players, "fr", rng=random.Random(seed))
+    for player in session.players:
+        session.show(player, 10.0)
+    return session
+
+
+def letter_of(session, player, correct=True):
+    """Return the displayed letter of the right (or a wrong) answer."""
+    question = session.current_question(player)
+    for letter, text in session.displayed_choices(player).items():
+        if (text == question.answer) == correct:
+            return letter
+    raise AssertionError("no such choice")
+
+
+def test_show_and_answer():
+    session = make_session(players=1)
+    result = session.answer(1, letter_of(session, 1), 12.5)
+    assert result.correct
+    assert result.elapsed == 2.5
+    assert session.scores == {1: 1}
+    # Une seule réponse par question
+    assert session.answer(1, "A", 13.0) is None
+
+    events = session.advance(1, 20.0)
+    assert isinstance(events[0], QuestionShown)
+    assert events[0].index == 1
+
+
+def test_same_seed_same_game():
+    first = make_session(seed=42)
+    second = make_session(seed=42)
+    assert first.displayed_choices(1) == second.displayed_choices(1)
+
+
+def test_game_finishes_when_every_player_is_done():
+    session = make_session(players=2, count=1)
+    session.answer(1, "A", 11.0)
+    assert session.advance(1, 12.0) == [PlayerFinished(1)]
+    session.answer(2, "A", 11.0)
+    events = session.advance(2, 12.0)
+    assert isinstance(events[0], PlayerFinished)
+    assert isinstance(events[1], GameFinished)
+    assert session.finished
+
+
+def test_replay_gives_the_same_scores():
+    session = make_session(players=2, seed=7)
+    answers = []
+    shown = 10.0
+    for step in range(3):
+        for player in (1, 2):
+            letter = letter_of(session, player, correct=(player + step) % 2 == 0)
+            answers.append([player, letter, 1.0 + player])
+            session.answer(player, letter, shown + 1.0 + player)
+            session.advance(player, shown + 10.0)
+        shown += 10.0
+
+    replayed = GameSession(make_pool(), 2, "fr", rng=random.Random(7)).replay(answers)
+    assert replayed.scores == session.scores
+    assert replayed.ranking == session.leaderboard.top()
+
+
+def test_players_fall_back_to_the_game_language():
+    pool = make_pool(1)
+    pool[0]["en"] = Question(
+        1, "Question 1?", ("Right", "Wrong a", "Wrong b", "Wrong c"), 0, ""
+    )
+    session = GameSession(pool, 3, "fr", ["en", "de"], rng=random.Random(1))
+    assert session.languages == {1: "en", 2: "de", 3: "fr"}
+    assert session.question(1, 0)[1] == "en"
+    # Pas de traduction allemande: la question est posée en français
+    assert session.question(2, 0)[1] == "fr"
+
+
+def test_replay_finishes_an_unfinished_game():
+    session = GameSession(make_pool(), 2, "fr", rng=random.Random(3))
+    finished = session.replay([[1, "A", 1.0]])
+    assert session.finished
+    assert finished.scores == session.scores
@@ -0,0 +1,67 @@
+"""Tests for the game journal CSV export."""
+import csv
+import json
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.trivia.journal import GameJournal  # noqa: E402
+
+
+def write_events(path, events):
+    path.write_text(
+        "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events),
+        encoding="utf-8",
+    )
+
+
+def read_csv(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_export(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_events(
+        path,
+        [
+            {"e": "start", "game": "g1", "t": 1.0, "file": "a.json", "difficulty": "expert"},
+            {"e": "answer", "game": "g1", "player": 1, "qid": 3, "correct": True, "elapsed": 2.0},
+            {"e": "answer", "game": "g1", "player": 2, "qid": 3, "correct": False, "elapsed": 4.0},
+            {"e": "answer", "game": "g1", "player": 1, "qid": 5, "correct": True, "elapsed": 1.0},
+        ],
+    )
+    players_path, questions_path = GameJournal(None, path).export(tmp_path / "out")
+
+    players = read_csv(players_path)
+    assert [(row["player"], row["answers"], row["correct"]) for row in players] == [
+        ("1", "2", "2"),
+        ("2", "1", "0"),
+    ]
+    questions = {row["question_id"]: row for row in read_csv(questions_path)}
+    assert questions["3"]["answers"] == "2"
+    assert questions["3"]["success_rate"] == "0.5"
+    assert questions["3"]["mean_answer_time"] == "3.0"
+    assert questions["5"]["file"] == "a.json"
+
+
+def test_export_themed_game_keeps_questions_apart(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_events(
+        path,
+        [
+            {"e": "start", "game": "g1", "t": 1.0, "file": None, "difficulty": "débutant"},
+            {"e": "answer", "game": "g1", "player": 1, "qid": 7, "correct": True,
+             "file": "a.json", "difficulty": "expert"},
+            {"e": "answer", "game": "g1", "player": 1, "qid": 7, "correct": False,
+             "file": "b.json", "difficulty": "débutant"},
+        ],
+    )
+    _players_path, questions_path = GameJournal(None, path).export(tmp_path)
+
+    rows = read_csv(questions_path)
+    assert [(row["file"], row["difficulty"], row["correct"]) for row in rows] == [
+        ("a.json", "expert", "1"),
+        ("b.json", "débutant", "0"),
+    ]
@@ -0,0 +1,59 @@
+"""Tests for the incremental leaderboard."""
+import random
+
+from custom_components.trivia.leaderboard import Leaderboard
+
+
+def test_reset_ranks_by_player_number():
+    board = Leaderboard()
+    board.reset([3, 1, 2])
+    assert board.top() == [(1, 0, 0.0), (2, 0, 0.0), (3, 0, 0.0)]
+    assert board.leader() == 1
+    assert len(board) == 3
+
+
+def test_score_then_answer_time_then_player():
+    board = Leaderboard()
+    board.reset([1, 2, 3])
+    board.update(2, 2, 9.0)
+    board.update(3, 2, 4.5)
+    board.update(1, 1, 1.0)
+    assert [player for player, _score, _time in board.top()] == [3, 2, 1]
+    assert board.rank(3) == 1
+    assert board.rank(1) == 3
+    assert board.rank(9) is None
+    assert board.score(2) == 2
+    assert board.answer_time(3) == 4.5
+    assert board.top(1) == [(3, 2, 4.5)]
+
+
+def test_matches_a_full_sort():
+    rng = random.Random(3)
+    board = Leaderboard()
+    board.reset(range(1, 9))
+    state = {player: (0, 0.0) for player in range(1, 9)}
+    for _ in range(200):
+        player = rng.randint(1, 8)
+        score, elapsed = state[player]
+        state[player] = (score + rng.randint(0, 1), elapsed + rng.random())
+        board.update(player, *state[player])
+
+    expected = sorted(state, key=lambda player: (-state[player][0], state[player][1], player))
+    assert [player for player, _score, _time in board.top()] == expected
+
+
+def test_render_is_cached_until_a_change():
+    board = Leaderboard()
+    board.reset([1, 2, 3, 4])
+    board.update(4, 3, 1.0)
+    message = board.render(5)
+    assert message.splitlines() == [
+        "🥇 Joueur 4: 3/5",
+        "🥈 Joueur 1: 0/5",
+        "🥉 Joueur 2: 0/5",
+        "4. Joueur 3: 0/5",
+    ]
+    assert board.render(5) is message
+    board.update(1, 1, 2.0)
+    assert board.render(5) is not message
+    assert board.render(5).splitlines()[1] == "🥈 Joueur 1: 1/5"
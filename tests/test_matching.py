@@ -0,0 +1,53 @@
+"""Tests for free-text answer matching."""
+from custom_components.trivia.matching import AnswerMatcher, bounded_distance, normalize
+
+
+def test_normalize():
+    assert normalize("  L'Élysée, Paris! ") == "l elysee paris"
+
+
+def test_bounded_distance():
+    assert bounded_distance("paris", "paris", 1) == 0
+    assert bounded_distance("pariss", "paris", 1) == 1
+    assert bounded_distance("londres", "paris", 2) is None
+
+
+def test_letters():
+    matcher = AnswerMatcher({"A": "Paris", "B": "Lyon", "C": "Marseille"})
+    assert matcher.match("a") == "A"
+    assert matcher.match(" B ") == "B"
+    assert matcher.match("C") == "C"
+
+
+def test_letter_propositions_do_not_hide_letters():
+    # culture_general_11.json (de/it débutant, id 7): une proposition "A"
+    matcher = AnswerMatcher({"A": "C", "B": "A", "C": "B"})
+    assert [matcher.match(letter) for letter in "abc"] == ["A", "B", "C"]
+
+
+def test_text_and_articles():
+    matcher = AnswerMatcher({"A": "Un coiffeur", "B": "La boulangère", "C": "Le maçon"})
+    assert matcher.match("un coiffeur") == "A"
+    assert matcher.match("coiffeur") == "A"
+    assert matcher.match("boulangere") == "B"
+    assert matcher.match("MAÇON") == "C"
+
+
+def test_typos():
+    matcher = AnswerMatcher({"A": "Marseille", "B": "Montpellier", "C": "Bordeaux"})
+    assert matcher.match("marseile") == "A"
+    assert matcher.match("bordaux") == "C"
+    assert matcher.match("strasbourg") is None
+
+
+def test_numbers_need_an_exact_match():
+    matcher = AnswerMatcher({"A": "1789", "B": "1798", "C": "1879"})
+    assert matcher.match("1798") == "B"
+    assert matcher.match("1790") is None
+    assert matcher.match("en 1789") is None
+
+
+def test_ambiguous_text():
+    matcher = AnswerMatcher({"A": "Le chat", "B": "Un chat", "C": "Le chien"})
+    assert matcher.match("chat") is None
+    assert matcher.match("le chat") == "A"
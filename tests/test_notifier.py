@@ -0,0 +1,116 @@
+"""Tests for notification retries and the per-device circuit breaker."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.trivia import notifier as notifier_module  # noqa: E402
+from custom_components.trivia.notifier import CircuitBreaker, Notifier  # noqa: E402
+
+
+class FakeServices:
+    """Record notify calls; failing services raise, hanging ones never answer."""
+
+    def __init__(self, failing=(), hanging=()):
+        self.failing = set(failing)
+        self.hanging = set(hanging)
+        self.calls = []
+
+    async def async_call(self, domain, service, data, blocking=False):
+        self.calls.append(service)
+        if service in self.hanging:
+            await asyncio.sleep(3600)
+        if service in self.failing:
+            raise RuntimeError("unreachable")
+
+
+class FakeHass:
+    def __init__(self, services):
+        self.services = services
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control time.monotonic (not for tests running an event loop)."""
+    now = [1000.0]
+    monkeypatch.setattr(notifier_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_breaker_opens_then_half_opens(clock):
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock[0] += 60
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+def test_half_open_lets_a_single_trial_through(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    breaker.record_failure()
+    clock[0] += 60
+    assert breaker.allow()
+    # Essai en cours: les autres appels sont ignorés
+    assert not breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock[0] += 60
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_unfinished_trial_expires(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    breaker.record_failure()
+    clock[0] += 60
+    assert breaker.allow()
+    clock[0] += 59
+    assert not breaker.allow()
+    clock[0] += 1
+    assert breaker.allow()
+
+
+def test_send_retries_then_succeeds():
+    services = FakeServices()
+    notifier = Notifier(FakeHass(services), timeout=1, retries=2, retry_delay=0)
+    assert asyncio.run(notifier.async_send("mobile_app_a", {"message": "x"}))
+    assert services.calls == ["mobile_app_a"]
+    assert notifier.stats["sent"] == 1
+
+
+def test_failing_device_is_skipped_without_affecting_others():
+    services = FakeServices(failing={"mobile_app_bad"}, hanging={"mobile_app_slow"})
+    notifier = Notifier(FakeHass(services), timeout=0.01, retries=1, retry_delay=0)
+
+    async def run():
+        for _ in range(notifier_module.NOTIFY_BREAKER_THRESHOLD):
+            assert not await notifier.async_send("mobile_app_bad", {})
+        assert not await notifier.async_send("mobile_app_slow", {})
+        assert await notifier.async_send("mobile_app_good", {})
+        calls = len(services.calls)
+        # Disjoncteur ouvert: l'appareil défaillant n'est plus appelé
+        assert not await notifier.async_send("mobile_app_bad", {})
+        assert len(services.calls) == calls
+
+    asyncio.run(run())
+    assert notifier.stats["skipped"] == 1
+    assert notifier.stats["timeout"] == 2
+    devices = notifier.as_dict()["devices"]
+    assert devices["mobile_app_bad"]["breaker"] == "open"
+    assert devices["mobile_app_good"]["breaker"] == "closed"
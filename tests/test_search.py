@@ -0,0 +1,87 @@
+"""Tests for the question search index."""
+from custom_components.trivia.search import QuestionIndex, file_documents, fold
+
+
+def question(qid, text, propositions, answer, anecdote=""):
+    return {
+        "id": qid,
+        "question": text,
+        "propositions": propositions,
+        "réponse": answer,
+        "anecdote": anecdote,
+    }
+
+
+QUIZZ = {
+    "fr": {
+        "débutant": [
+            question(1, "Où est la tour Eiffel ?", ["Paris", "Lyon", "Nice", "Lille"], "Paris"),
+            question(2, "Capitale de l'Italie ?", ["Rome", "Milan", "Turin", "Naples"], "Rome",
+                     "Rome est surnommée la Ville éternelle."),
+        ],
+        "expert": [
+            question(1, "Année de la prise de la Bastille ?", ["1789", "1790", "1791", "1792"], "1789",
+                     "Le 14 juillet, à Paris."),
+            question(2, "Question invalide", ["A", "B"], "C"),
+        ],
+    },
+    "en": {
+        "débutant": [
+            question(1, "Where is the Eiffel Tower?", ["Paris", "Lyon", "Nice", "Lille"], "Paris"),
+        ],
+    },
+}
+
+
+def make_index():
+    index = QuestionIndex()
+    index.replace_file("a.json", file_documents("a.json", QUIZZ))
+    return index
+
+
+def keys(hits):
+    return [hit.key for hit in hits]
+
+
+def test_fold():
+    assert fold("Élysée") == "elysee"
+
+
+def test_every_word_must_match_without_accents():
+    index = make_index()
+    assert keys(index.search("PARIS")) == ["a.json:débutant:1", "a.json:expert:1"]
+    assert keys(index.search("paris bastille")) == ["a.json:expert:1"]
+    assert keys(index.search("éternelle")) == ["a.json:débutant:2"]
+    assert index.search("paris zebre") == []
+
+
+def test_prefix_and_filters():
+    index = make_index()
+    assert keys(index.search("eiff*")) == ["a.json:débutant:1"]
+    assert keys(index.search("paris", difficulty="expert")) == ["a.json:expert:1"]
+    assert keys(index.search("paris", language="en")) == ["a.json:débutant:1"]
+
+
+def test_translations_share_one_document():
+    hit = make_index().search("tower")[0]
+    assert sorted(hit.texts) == ["en", "fr"]
+
+
+def test_invalid_and_excluded_questions_are_not_indexed():
+    index = QuestionIndex()
+    index.replace_file(
+        "a.json", file_documents("a.json", QUIZZ, exclude={("fr", "débutant", 2)})
+    )
+    assert index.search("invalide") == []
+    assert index.search("rome") == []
+
+
+def test_replace_and_remove_file():
+    index = make_index()
+    index.replace_file("b.json", file_documents("b.json", QUIZZ))
+    assert len(index.search("rome")) == 2
+    index.replace_file("a.json", [])
+    assert keys(index.search("rome")) == ["b.json:débutant:2"]
+    index.remove_file("b.json")
+    assert index.search("rome") == []
+    assert index.as_dict()["words"] == 0
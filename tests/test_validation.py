@@ -0,0 +1,119 @@
+"""Tests for question file validation."""
+import gzip
+import json
+import os
+
+from custom_components.trivia.catalog import CatalogEntry
+from custom_components.trivia.validation import (
+    excluded_questions,
+    validate_files,
+    validate_question,
+    validate_quizz,
+)
+
+
+def question(qid, answer="Oui", propositions=("Oui", "Non", "Peut-être", "Jamais")):
+    return {"id": qid, "question": f"Q{qid} ?", "propositions": list(propositions), "réponse": answer}
+
+
+QUIZZ = {
+    "quizz": {
+        "fr": {
+            "débutant": [
+                question(1),
+                question(2, answer="Toujours"),
+                question(3, propositions=("Oui", "Non")),
+            ]
+        }
+    }
+}
+
+
+def entry(path):
+    stat = path.stat()
+    return CatalogEntry(path, stat.st_size, stat.st_mtime)
+
+
+def write(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_validate_question():
+    assert validate_question(question(1)) is None
+    assert validate_question(question(1, answer="Toujours")) == "answer not in propositions"
+    assert validate_question(question(1, propositions=("Oui", "Non"))) == (
+        "fewer than 2 wrong answers"
+    )
+    assert validate_question("texte") == "not an object"
+
+
+def test_validate_quizz():
+    errors, problems = validate_quizz(QUIZZ)
+    assert errors == []
+    assert [(language, level, qid) for language, level, qid, _reason in problems] == [
+        ("fr", "débutant", 2),
+        ("fr", "débutant", 3),
+    ]
+    assert validate_quizz({})[0] == ["missing quizz section"]
+
+
+def test_results_are_cached_by_stat_then_by_hash(tmp_path):
+    path = write(tmp_path / "a.json", QUIZZ)
+    results, validated = validate_files({"a.json": entry(path)}, {})
+    assert validated == ["a.json"]
+    assert excluded_questions(results["a.json"]) == {
+        ("fr", "débutant", 2),
+        ("fr", "débutant", 3),
+    }
+
+    # Même taille et même date: pas de relecture
+    again, validated = validate_files({"a.json": entry(path)}, results)
+    assert validated == []
+    assert again["a.json"] is results["a.json"]
+
+    # Date modifiée, contenu identique: le hash évite une nouvelle validation
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    touched, validated = validate_files({"a.json": entry(path)}, results)
+    assert validated == []
+    assert touched["a.json"]["mtime"] == path.stat().st_mtime
+    assert touched["a.json"]["problems"] == results["a.json"]["problems"]
+
+
+def test_changed_content_is_validated_again(tmp_path):
+    path = write(tmp_path / "a.json", QUIZZ)
+    results, _validated = validate_files({"a.json": entry(path)}, {})
+    write(path, {"quizz": {"fr": {"débutant": [question(1), question(2)]}}})
+    results, validated = validate_files({"a.json": entry(path)}, results)
+    assert validated == ["a.json"]
+    assert results["a.json"]["problems"] == []
+
+
+def test_compressed_files_are_hashed_decompressed(tmp_path):
+    plain = write(tmp_path / "a.json", QUIZZ)
+    packed = tmp_path / "b.json.gz"
+    packed.write_bytes(gzip.compress(plain.read_bytes()))
+    results, _validated = validate_files(
+        {"a.json": entry(plain), "b.json": entry(packed)}, {}
+    )
+    assert results["a.json"]["hash"] == results["b.json"]["hash"]
+
+
+def test_invalid_json(tmp_path):
+    path = tmp_path / "a.json"
+    path.write_text("{", encoding="utf-8")
+    results, _validated = validate_files({"a.json": entry(path)}, {})
+    assert results["a.json"]["errors"][0].startswith("invalid JSON")
+
+
+def test_unreadable_file_does_not_keep_its_old_result(tmp_path):
+    path = write(tmp_path / "a.json", QUIZZ)
+    stale = entry(path)
+    results, _validated = validate_files({"a.json": stale}, {})
+    path.unlink()
+    moved = CatalogEntry(path, stale.size + 1, stale.mtime)
+    results, validated = validate_files({"a.json": moved}, results)
+    assert validated == ["a.json"]
+    assert results["a.json"]["errors"][0].startswith("unreadable")
+    assert results["a.json"]["hash"] is None